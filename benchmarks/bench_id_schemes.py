@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+Benchmark: database size and join latency per --id-scheme
+
+Generates one seeded dataset per ID scheme (uuid, int, gid) with
+src/main.py, then reports the file size, bytes per row and the median
+latency of a few representative join queries. The schemes consume the RNG
+differently, so row counts differ slightly between datasets; compare bytes
+per row rather than raw file size when they do.
+
+Usage:
+    python benchmarks/bench_id_schemes.py --num-users 2000 --tasks-per-section 60
+"""
+
+import argparse
+import os
+import sqlite3
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+sys.path.insert(0, os.path.join(REPO_ROOT, "src"))
+
+from storage.rows import TABLE_COLUMNS
+from utils.helpers import ID_SCHEMES
+
+JOIN_QUERIES = {
+    'tasks x users (assignee)': """
+        SELECT u.department, COUNT(*) FROM tasks t
+        JOIN users u ON u.user_id = t.assignee_id
+        GROUP BY u.department
+    """,
+    'task_tags x tags x tasks': """
+        SELECT g.name, SUM(t.is_completed) FROM task_tags tt
+        JOIN tags g ON g.tag_id = tt.tag_id
+        JOIN tasks t ON t.task_id = tt.task_id
+        GROUP BY g.name
+    """,
+    'comments x tasks x projects': """
+        SELECT p.project_type, COUNT(*) FROM comments c
+        JOIN tasks t ON t.task_id = c.task_id
+        JOIN projects p ON p.project_id = t.project_id
+        GROUP BY p.project_type
+    """,
+    'dependency self-join': """
+        SELECT COUNT(*) FROM task_dependencies d
+        JOIN tasks a ON a.task_id = d.task_id
+        JOIN tasks b ON b.task_id = d.depends_on_task_id
+        WHERE b.created_at <= a.created_at
+    """,
+}
+
+
+def time_query(connection, sql, repeat):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        connection.execute(sql).fetchall()
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="DB size and join latency per ID scheme")
+    parser.add_argument("--num-users", type=int, default=2000)
+    parser.add_argument("--tasks-per-section", type=int, default=60)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--repeat", type=int, default=7)
+    args = parser.parse_args()
+
+    results = []
+    with tempfile.TemporaryDirectory(prefix='asana-ids-') as tmp:
+        for scheme in ID_SCHEMES:
+            db = os.path.join(tmp, f"{scheme}.sqlite")
+            subprocess.run(
+                [sys.executable, "src/main.py", "--num-users", str(args.num_users),
+                 "--tasks-per-section", str(args.tasks_per_section), "--seed", str(args.seed),
+                 "--as-of", "2025-06-01", "--no-cache", "--id-scheme", scheme, "--output", db],
+                cwd=REPO_ROOT, check=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+            )
+            connection = sqlite3.connect(db)
+            rows = sum(connection.execute(f"SELECT COUNT(*) FROM {t}").fetchone()[0] for t in TABLE_COLUMNS)
+            latencies = {name: time_query(connection, sql, args.repeat) for name, sql in JOIN_QUERIES.items()}
+            connection.close()
+            results.append((scheme, os.path.getsize(db), rows, latencies))
+
+    print(f"{'scheme':<6} {'size MB':>9} {'rows':>10} {'bytes/row':>10}  "
+          + "  ".join(f"{name:>28}" for name in JOIN_QUERIES))
+    for scheme, size, rows, latencies in results:
+        print(f"{scheme:<6} {size / 1e6:>9.2f} {rows:>10,} {size / rows:>10.1f}  "
+              + "  ".join(f"{latencies[name] * 1000:>25.2f} ms" for name in JOIN_QUERIES))
+
+
+if __name__ == "__main__":
+    main()
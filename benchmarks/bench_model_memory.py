@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+Benchmark: memory footprint of the high-volume row models
+
+Builds N instances of each slotted model (Task, Subtask, Comment,
+CustomFieldValue, TaskTag, TaskDependency) and of an equivalent plain
+@dataclass with a per-instance __dict__, and reports bytes per entity for
+both. Field values are built once and shared by the two variants, so the
+"object" columns isolate the container overhead; the "with values" column
+adds the per-row strings and datetimes of a realistic row. For tasks, the
+columnar TaskTable is listed as a third representation.
+
+Usage:
+    python benchmarks/bench_model_memory.py --tasks 1000000
+"""
+
+import argparse
+import gc
+import os
+import random
+import sys
+import tracemalloc
+from dataclasses import fields, make_dataclass
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from models import Task, Subtask, Comment, CustomFieldValue, TaskTag, TaskDependency
+from models.columnar import TaskTable
+from generators.tasks import PRIORITIES, OPEN_STATUSES
+from utils.helpers import generate_uuid
+
+BASE = datetime(2025, 6, 1)
+USER_IDS = [generate_uuid() for _ in range(500)]
+PROJECT_IDS = [generate_uuid() for _ in range(50)]
+TAG_IDS = [generate_uuid() for _ in range(30)]
+FIELD_IDS = [generate_uuid() for _ in range(100)]
+TASK_NAMES = [f"Implement feature {i}" for i in range(200)]
+COMMENTS = [f"Comment template {i}" for i in range(50)]
+VALUE_SAMPLE = 20000
+
+
+def unslotted(cls):
+    """The same model as a plain @dataclass (the pre-slots layout)"""
+    return make_dataclass(cls.__name__, [(f.name, f.type) for f in fields(cls)])
+
+
+def when(i):
+    return BASE - timedelta(minutes=i)
+
+
+# Per model: how many rows per task, and a function building one row's values
+ROW_VALUES = {
+    Task: (1.0, lambda i: (
+        generate_uuid(), PROJECT_IDS[i % 50], generate_uuid(), TASK_NAMES[i % 200], None,
+        USER_IDS[i % 500], USER_IDS[(i * 7) % 500], when(i), when(i).date(), None,
+        PRIORITIES[i % 4], OPEN_STATUSES[i % 3], False, None, 8.0, None,
+    )),
+    Subtask: (1.0, lambda i: (
+        generate_uuid(), generate_uuid(), "Testing", None, USER_IDS[i % 500], when(i),
+        None, False, None,
+    )),
+    Comment: (0.6, lambda i: (
+        generate_uuid(), generate_uuid(), USER_IDS[i % 500], COMMENTS[i % 50], when(i), None, False,
+    )),
+    CustomFieldValue: (2.0, lambda i: (
+        generate_uuid(), generate_uuid(), FIELD_IDS[i % 100], 'Pending', BASE, None,
+    )),
+    TaskTag: (1.2, lambda i: (
+        generate_uuid(), generate_uuid(), TAG_IDS[i % 30], BASE,
+    )),
+    TaskDependency: (0.3, lambda i: (
+        generate_uuid(), generate_uuid(), generate_uuid(), 'blocks', BASE,
+    )),
+}
+
+
+def measure(build):
+    """Bytes allocated (and still live) by build(), plus its result"""
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    result = build()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return after - before, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Memory footprint of row models")
+    parser.add_argument("--tasks", type=int, default=1_000_000)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+    random.seed(args.seed)
+
+    print(f"Rows per model scaled to {args.tasks:,} tasks\n")
+    print(f"{'model':<18} {'rows':>10} {'dict obj B':>11} {'slots obj B':>12} "
+          f"{'saved':>7} {'with values B':>14}")
+    for model, (ratio, make_values) in ROW_VALUES.items():
+        n = int(args.tasks * ratio)
+        # Per-row value bytes from a sample: tracing every allocation of a
+        # million rows is slow and the values are the same either way
+        sample = min(n, VALUE_SAMPLE)
+        values_bytes, _ = measure(lambda: [make_values(i) for i in range(sample)])
+        values = [make_values(i) for i in range(n)]
+        plain = unslotted(model)
+        dict_bytes, plain_rows = measure(lambda: [plain(*v) for v in values])
+        del plain_rows
+        slot_bytes, rows = measure(lambda: [model(*v) for v in values])
+        # The tuples holding the values are scaffolding, not part of a row
+        tuple_bytes = sys.getsizeof(values[0]) if values else 0
+        per_values = values_bytes / sample - tuple_bytes - 8
+        print(f"{model.__name__:<18} {n:>10,} {dict_bytes / n:>11.0f} {slot_bytes / n:>12.0f} "
+              f"{1 - slot_bytes / dict_bytes:>7.0%} {slot_bytes / n + per_values:>14.0f}")
+        if model is Task:
+            table_bytes, table = measure(lambda: TaskTable.from_tasks(rows))
+            del table
+            print(f"{'  TaskTable':<18} {n:>10,} {'':>11} {table_bytes / n:>12.0f} "
+                  f"{'':>7} {'(arrays only)':>14}")
+        del values, rows
+        gc.collect()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+Benchmark and frequency check: task names per draw vs in one batch
+
+For every task name pool, checks that batched draws (TemplatePool.codes)
+pick each pattern uniformly: every observed pattern frequency must lie
+within --sigmas binomial standard deviations of 1/k. Then times N names
+drawn one at a time with generate_task_name (as the row-at-a-time path
+does) against one generate_task_names batch, with and without interning,
+and reports how many distinct string objects each batch holds. Exits
+non-zero if any frequency check fails.
+
+Usage:
+    python benchmarks/bench_names.py --count 1000000
+"""
+
+import argparse
+import math
+import os
+import random
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from generators.tasks import TASK_NAME_POOLS, generate_task_name, generate_task_names
+
+
+def check_patterns(name, pool, n, sigmas):
+    """Problems with the pattern frequencies of n batched draws (empty if uniform)"""
+    patterns = np.searchsorted(pool.offsets, pool.codes(n), side='right') - 1
+    observed = np.bincount(patterns, minlength=len(pool.patterns)) / n
+    p = 1 / len(pool.patterns)
+    tolerance = sigmas * math.sqrt(p * (1 - p) / n)
+    return [
+        f"{name}: {pool.patterns[i]!r} drawn {f:.5f}, expected {p:.5f} +/- {tolerance:.5f}"
+        for i, f in enumerate(observed) if abs(f - p) > tolerance
+    ]
+
+
+def timed(label, count, run):
+    start = time.perf_counter()
+    result = run()
+    elapsed = time.perf_counter() - start
+    print(f"{label:<44} {elapsed:>8.3f}s {count / elapsed:>14,.0f} names/sec")
+    return elapsed, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="generate_task_name vs generate_task_names")
+    parser.add_argument("--count", type=int, default=1_000_000)
+    parser.add_argument("--sigmas", type=float, default=5.0,
+                        help="Allowed deviation in binomial standard deviations (default: 5)")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+    n = args.count
+    random.seed(args.seed)
+    np.random.seed(args.seed)
+
+    problems = []
+    print(f"{'pool':<24} {'patterns':>9} {'renderings':>11}")
+    for name, pool in TASK_NAME_POOLS.items():
+        problems += check_patterns(name, pool, n, args.sigmas)
+        print(f"{name:<24} {len(pool.patterns):>9} {len(pool):>11}")
+
+    print()
+    types = [random.choice(list(TASK_NAME_POOLS)) for _ in range(n)]
+    per_draw, names = timed("generate_task_name per task", n,
+                            lambda: [generate_task_name(t) for t in types])
+    batch, interned = timed(f"generate_task_names({n})", n, lambda: generate_task_names(types))
+    _, copies = timed(f"generate_task_names({n}, intern=False)", n,
+                      lambda: generate_task_names(types, intern=False))
+    print(f"\nSpeedup: {per_draw / batch:.1f}x")
+    print(f"String objects: interned {len(set(map(id, interned))):,}, "
+          f"not interned {len(set(map(id, copies))):,}, distinct names {len(set(names)):,}")
+
+    for problem in problems:
+        print(f"FAIL {problem}")
+    print("frequencies OK" if not problems else f"{len(problems)} frequency check(s) failed")
+    sys.exit(1 if problems else 0)
+
+
+if __name__ == "__main__":
+    main()
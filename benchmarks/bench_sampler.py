@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+"""
+Benchmark: random.choices vs AliasSampler
+
+Times N draws with random.choices (weights passed per call, as the
+generators used to), AliasSampler.draw, np.random.choice and
+AliasSampler.indices. That the samplers reproduce their documented
+weights is checked by benchmarks/check_sampler_frequencies.py.
+
+Usage:
+    python benchmarks/bench_sampler.py --count 1000000
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from generators.tasks import ESTIMATED_HOURS_SAMPLER
+
+
+def timed(label, count, run):
+    start = time.perf_counter()
+    run()
+    elapsed = time.perf_counter() - start
+    print(f"{label:<36} {elapsed:>8.3f}s {count / elapsed:>14,.0f} draws/sec")
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="random.choices vs AliasSampler")
+    parser.add_argument("--count", type=int, default=1_000_000)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+    n = args.count
+    random.seed(args.seed)
+    np.random.seed(args.seed)
+
+    sampler = ESTIMATED_HOURS_SAMPLER
+    values, weights = sampler.values, list(sampler.weights)
+    choices = timed("random.choices(k=1) per draw", n,
+                    lambda: [random.choices(values, weights=weights, k=1)[0] for _ in range(n)])
+    draw = timed("AliasSampler.draw() per draw", n, lambda: [sampler.draw() for _ in range(n)])
+    np_choice = timed(f"np.random.choice(size={n})", n,
+                      lambda: np.random.choice(len(values), size=n, p=sampler.weights))
+    indices = timed(f"AliasSampler.indices({n})", n, lambda: sampler.indices(n))
+    print(f"\nSpeedup: scalar {choices / draw:.1f}x, batched {np_choice / indices:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
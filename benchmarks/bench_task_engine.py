@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+Benchmark: scalar vs vectorized task attribute generation
+
+Generates the same project plan with generate_task (one task at a time) and
+generate_tasks_vectorized (one NumPy batch for the whole run), reports
+tasks/sec for each, and prints the attribute distributions side by side so
+a regression in either speed or realism is visible.
+
+Usage:
+    python benchmarks/bench_task_engine.py --tasks 200000
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+from collections import Counter
+from datetime import datetime
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from generators.projects import generate_project, generate_sections
+from generators.tasks import generate_task, generate_task_creation_time, generate_tasks_vectorized
+from utils.helpers import generate_uuid
+
+PROJECT_TYPES = ['product_development', 'infrastructure', 'marketing_campaign', 'operations', 'product']
+
+
+def build_plan(num_tasks, tasks_per_project, base_datetime):
+    plan = []
+    remaining = num_tasks
+    while remaining > 0:
+        project = generate_project(
+            org_id=generate_uuid(), team_id=generate_uuid(), owner_user_id=generate_uuid(),
+            project_type=random.choice(PROJECT_TYPES), project_index=len(plan),
+            base_datetime=base_datetime
+        )
+        sections = generate_sections(project.project_id, project.project_type, project.created_at)
+        count = min(tasks_per_project, remaining)
+        plan.append((project, sections, count))
+        remaining -= count
+    return plan
+
+
+def run_scalar(plan, user_ids, base_datetime):
+    tasks = []
+    for project, sections, count in plan:
+        for _ in range(count):
+            tasks.append(generate_task(
+                project_id=project.project_id,
+                section_id=random.choice(sections).section_id,
+                user_ids=user_ids,
+                created_by_user_id=random.choice(user_ids),
+                created_at=generate_task_creation_time(project.created_at, base_datetime),
+                project_type=project.project_type,
+                project_owner_id=project.owner_user_id,
+                base_datetime=base_datetime
+            ))
+    return tasks
+
+
+def summarize(tasks):
+    n = len(tasks)
+    due_offsets = [(t.due_date - t.created_at.date()).days for t in tasks if t.due_date]
+    estimated = [t.estimated_hours for t in tasks if t.estimated_hours is not None]
+    cycle = [(t.completed_at - t.created_at).total_seconds() / 86400 for t in tasks if t.completed_at]
+    priority = Counter(t.priority for t in tasks)
+    status = Counter(t.status for t in tasks)
+    return {
+        'no_due_date': sum(t.due_date is None for t in tasks) / n,
+        'overdue': sum(d < 0 for d in due_offsets) / n,
+        'due_mean_offset_days': float(np.mean(due_offsets)),
+        'assigned': sum(t.assignee_id is not None for t in tasks) / n,
+        'completed': sum(t.is_completed for t in tasks) / n,
+        'cycle_median_days': float(np.median(cycle)),
+        'has_estimate': len(estimated) / n,
+        'estimate_mean_hours': float(np.mean(estimated)),
+        **{f'priority_{k}': v / n for k, v in sorted(priority.items())},
+        **{f'status_{k}': v / n for k, v in sorted(status.items())},
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--tasks", type=int, default=100000)
+    parser.add_argument("--tasks-per-project", type=int, default=20)
+    parser.add_argument("--users", type=int, default=5000)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    random.seed(args.seed)
+    np.random.seed(args.seed)
+    base_datetime = datetime(2025, 6, 1)
+    plan = build_plan(args.tasks, args.tasks_per_project, base_datetime)
+    user_ids = [generate_uuid() for _ in range(args.users)]
+
+    results = {}
+    for name, fn in (("scalar", run_scalar), ("vectorized", generate_tasks_vectorized)):
+        start = time.perf_counter()
+        tasks = fn(plan, user_ids, base_datetime)
+        elapsed = time.perf_counter() - start
+        results[name] = (len(tasks) / elapsed, summarize(tasks))
+        print(f"{name:<11} {len(tasks):>9} tasks  {elapsed:8.3f}s  {len(tasks) / elapsed:>12,.0f} tasks/sec")
+
+    speedup = results["vectorized"][0] / results["scalar"][0]
+    print(f"speedup: {speedup:.2f}x\n")
+    print(f"{'metric':<28}{'scalar':>12}{'vectorized':>12}")
+    for key in results["scalar"][1]:
+        print(f"{key:<28}{results['scalar'][1][key]:>12.4f}{results['vectorized'][1].get(key, 0.0):>12.4f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+Export check: every storage mode exports byte-identical JSONL shards
+
+Builds the same seeded dataset once per combination of --timestamps (iso,
+epoch) and --text-storage (inline, normalized), writing the iso/inline run's
+pipeline export with --jsonl-dir alongside. Each database is then exported
+with export_database (all tables plus the task view), and every export must
+match the pipeline export: same columns, row counts and SHA-256 per shard.
+Exits non-zero on any difference.
+
+Usage:
+    python benchmarks/check_export_modes.py
+    python benchmarks/check_export_modes.py --num-users 2000 --seed 7
+"""
+
+import argparse
+import itertools
+import json
+import os
+import subprocess
+import sys
+import tempfile
+
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+sys.path.insert(0, os.path.join(REPO_ROOT, "src"))
+
+from storage.jsonl_export import MANIFEST_NAME, TASK_VIEW, export_database
+
+AS_OF = "2025-06-01"
+MODES = list(itertools.product(('iso', 'epoch'), ('inline', 'normalized')))
+
+
+def shards(export_dir, tables=None):
+    """{table: (columns, rows, [sha256 per shard])} from an export's manifest"""
+    with open(os.path.join(export_dir, MANIFEST_NAME)) as f:
+        manifest = json.load(f)
+    return {
+        table: (entry['columns'], entry['rows'], [shard['sha256'] for shard in entry['shards']])
+        for table, entry in manifest['tables'].items()
+        if tables is None or table in tables
+    }
+
+
+def compare(label, expected, actual):
+    """Differences between two shards() results (empty if identical)"""
+    problems = []
+    for table in sorted(set(expected) | set(actual)):
+        if table not in actual or table not in expected:
+            problems.append(f"{label}: {table} only in one export")
+        elif expected[table] != actual[table]:
+            columns, rows, _ = actual[table]
+            problems.append(f"{label}: {table} differs ({rows} rows vs {expected[table][1]})"
+                            if rows != expected[table][1] else f"{label}: {table} shards differ")
+    return problems
+
+
+def main():
+    parser = argparse.ArgumentParser(description="JSONL exports of every storage mode match")
+    parser.add_argument("--num-users", type=int, default=500)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    problems = []
+    with tempfile.TemporaryDirectory(prefix='asana-export-') as tmp:
+        pipeline_dir = os.path.join(tmp, 'pipeline')
+        exports = {}
+        for timestamps, text_storage in MODES:
+            label = f"{timestamps}/{text_storage}"
+            db = os.path.join(tmp, f"{timestamps}_{text_storage}.sqlite")
+            cmd = [sys.executable, os.path.join(REPO_ROOT, 'src', 'main.py'),
+                   '--num-users', str(args.num_users), '--seed', str(args.seed), '--as-of', AS_OF,
+                   '--no-cache', '--output', db, '--timestamps', timestamps, '--text-storage', text_storage]
+            if (timestamps, text_storage) == MODES[0]:
+                cmd += ['--jsonl-dir', pipeline_dir, '--jsonl-workers', '1']
+            print(f"Generating {label}...", flush=True)
+            subprocess.run(cmd, cwd=REPO_ROOT, check=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+            export_dir = os.path.join(tmp, f"export_{timestamps}_{text_storage}")
+            export_database(db, export_dir, task_view=True, workers=1)
+            exports[label] = shards(export_dir)
+
+        reference = shards(pipeline_dir)
+        for label, export in exports.items():
+            # The pipeline writes tables only; the task view is compared between database exports
+            tables = {t: v for t, v in export.items() if t != TASK_VIEW}
+            found = compare(f"{label} vs pipeline", reference, tables)
+            found += compare(f"{label} vs iso/inline", exports['iso/inline'], export)
+            print(f"{'FAIL' if found else 'ok':<5} {label} ({len(export)} tables)")
+            problems += found
+
+    for problem in problems:
+        print(f"FAIL {problem}")
+    print("exports identical" if not problems else f"{len(problems)} export check(s) failed")
+    sys.exit(1 if problems else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+Frequency check: every AliasSampler against its documented weights
+
+For each weighted distribution the generators draw from, takes the values
+and weights from the tables the generators document (PRIORITY_WEIGHTS,
+SENIORITY_WEIGHTS, ROLE_WEIGHTS_BY_SENIORITY, DUE_DATE_BUCKETS, ...), not
+from the sampler, and checks that both the scalar draws made at the call
+site (choose_role, generate_priority, ...) and the batched draws
+(AliasSampler.indices) reproduce them: each observed frequency must lie
+within --sigmas binomial standard deviations of its weight, and
+zero-weight values must never appear. Seeded, so a run is repeatable;
+exits non-zero if any check fails.
+
+Usage:
+    python benchmarks/check_sampler_frequencies.py
+    python benchmarks/check_sampler_frequencies.py --count 1000000 --seed 7
+"""
+
+import argparse
+import math
+import os
+import random
+import sys
+from collections import Counter, namedtuple
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from generators.organizations import EMPLOYEE_COUNT_RANGES, EMPLOYEE_COUNT_WEIGHTS, EMPLOYEE_COUNT_SAMPLER
+from generators.tags import DEPENDENCY_TYPES, DEPENDENCY_TYPE_WEIGHTS, DEPENDENCY_TYPE_SAMPLER
+from generators.tasks import (
+    PRIORITIES, PRIORITY_WEIGHTS, PRIORITY_SAMPLER,
+    OPEN_STATUSES, OPEN_STATUS_WEIGHTS, OPEN_STATUS_SAMPLER,
+    ESTIMATED_HOURS, ESTIMATED_HOURS_WEIGHTS, ESTIMATED_HOURS_SAMPLER,
+    generate_priority, generate_task_status,
+)
+from generators.users import (
+    SENIORITY_WEIGHTS, SENIORITY_SAMPLER, ROLE_WEIGHTS, ROLE_WEIGHTS_BY_SENIORITY, ROLE_SAMPLERS,
+    DEFAULT_ROLE_WEIGHTS, DEFAULT_ROLE_SAMPLER, choose_seniority, choose_role,
+)
+from utils.helpers import DUE_DATE_BUCKETS, DUE_DATE_BUCKET_SAMPLER
+
+# values/weights as documented; draw() is one scalar draw as the generators make it
+Distribution = namedtuple('Distribution', ['name', 'values', 'weights', 'sampler', 'draw'])
+
+
+def distributions():
+    yield Distribution("priority", PRIORITIES, PRIORITY_WEIGHTS, PRIORITY_SAMPLER, generate_priority)
+    yield Distribution("open status", OPEN_STATUSES, OPEN_STATUS_WEIGHTS, OPEN_STATUS_SAMPLER,
+                       lambda: generate_task_status(False))
+    yield Distribution("estimated hours", ESTIMATED_HOURS, ESTIMATED_HOURS_WEIGHTS, ESTIMATED_HOURS_SAMPLER,
+                       ESTIMATED_HOURS_SAMPLER.draw)
+    yield Distribution("seniority", list(SENIORITY_WEIGHTS), list(SENIORITY_WEIGHTS.values()),
+                       SENIORITY_SAMPLER, choose_seniority)
+    for seniority, weights in ROLE_WEIGHTS_BY_SENIORITY.items():
+        yield Distribution(f"role ({seniority})", list(ROLE_WEIGHTS), weights, ROLE_SAMPLERS[seniority],
+                           lambda seniority=seniority: choose_role(seniority))
+    for seniority in ('junior', 'intern'):
+        yield Distribution(f"role ({seniority})", list(ROLE_WEIGHTS), DEFAULT_ROLE_WEIGHTS, DEFAULT_ROLE_SAMPLER,
+                           lambda seniority=seniority: choose_role(seniority))
+    yield Distribution("employee count range", EMPLOYEE_COUNT_RANGES, EMPLOYEE_COUNT_WEIGHTS,
+                       EMPLOYEE_COUNT_SAMPLER, EMPLOYEE_COUNT_SAMPLER.draw)
+    # Buckets are documented as cumulative probabilities
+    thresholds = [threshold for threshold, _ in DUE_DATE_BUCKETS]
+    yield Distribution("due date bucket", list(range(len(DUE_DATE_BUCKETS))),
+                       np.diff([0.0] + thresholds).tolist(), DUE_DATE_BUCKET_SAMPLER, DUE_DATE_BUCKET_SAMPLER.index)
+    yield Distribution("dependency type", DEPENDENCY_TYPES, DEPENDENCY_TYPE_WEIGHTS, DEPENDENCY_TYPE_SAMPLER,
+                       DEPENDENCY_TYPE_SAMPLER.draw)
+
+
+def check_frequencies(label, values, weights, counts, sigmas):
+    """Problems with observed counts per value (empty if they match the weights)"""
+    n = sum(counts)
+    total = sum(weights)
+    problems = []
+    for value, weight, count in zip(values, weights, counts):
+        p, f = weight / total, count / n
+        if p == 0:
+            if count:
+                problems.append(f"{label}: {value!r} has weight 0 but was drawn {count} times")
+            continue
+        tolerance = sigmas * math.sqrt(p * (1 - p) / n)
+        if abs(f - p) > tolerance:
+            problems.append(f"{label}: {value!r} drawn {f:.5f}, expected {p:.5f} +/- {tolerance:.5f}")
+    return problems
+
+
+def check(dist, n, sigmas):
+    """Problems with one distribution's scalar and batched draws"""
+    if list(dist.sampler.values) != list(dist.values):
+        return [f"{dist.name}: sampler values {dist.sampler.values!r} differ from {dist.values!r}"]
+    scalar = Counter(dist.draw() for _ in range(n))
+    unknown = set(scalar) - set(dist.values)
+    if unknown:
+        return [f"{dist.name}: drew undocumented values {sorted(unknown, key=repr)!r}"]
+    batch = np.bincount(dist.sampler.indices(n), minlength=len(dist.values))
+    return (check_frequencies(f"{dist.name} [call site]", dist.values, dist.weights,
+                              [scalar[value] for value in dist.values], sigmas)
+            + check_frequencies(f"{dist.name} [indices]", dist.values, dist.weights, batch.tolist(), sigmas))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="AliasSampler frequencies vs documented weights")
+    parser.add_argument("--count", type=int, default=200_000, help="Draws per distribution and mode")
+    parser.add_argument("--sigmas", type=float, default=5.0,
+                        help="Allowed deviation in binomial standard deviations (default: 5)")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+    random.seed(args.seed)
+    np.random.seed(args.seed)
+
+    problems = []
+    for dist in distributions():
+        found = check(dist, args.count, args.sigmas)
+        print(f"{'FAIL' if found else 'ok':<5} {dist.name}")
+        problems += found
+
+    for problem in problems:
+        print(f"FAIL {problem}")
+    print("frequencies OK" if not problems else f"{len(problems)} frequency check(s) failed")
+    sys.exit(1 if problems else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,194 @@
+#!/usr/bin/env python3
+"""
+Scale-ladder benchmark for the generate_all pipeline
+
+Runs the full pipeline once per rung of a ladder of organization sizes, each
+in a fresh subprocess so peak RSS is per rung. Tasks scale with the user
+count through --tasks-per-section; the project count is bounded by the
+project-name catalogue, so projects-per-team stays fixed. For each of the 11
+stages the generation and insert_* phases are recorded separately (wall
+time, rows, rows/sec, how much the phase raised peak RSS and its change in
+current RSS) and the whole run is written as JSON.
+
+Runs are seeded and pinned to a fixed --as-of date, so two result files
+differ only by speed. With --baseline, each rung/stage/phase is compared
+against a previous results file and the script exits non-zero when any of
+them slowed down by more than --threshold.
+
+Usage:
+    python benchmarks/run_benchmarks.py --output benchmarks/results.json
+    python benchmarks/run_benchmarks.py --sizes 500,5000 --baseline benchmarks/results.json
+"""
+
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+sys.path.insert(0, os.path.join(REPO_ROOT, "src"))
+
+DEFAULT_SIZES = [500, 5000, 20000, 50000]
+BASE_USERS = 500
+BASE_TASKS_PER_SECTION = 15
+PROJECTS_PER_TEAM = 3
+SEED = 42
+AS_OF = "2025-06-01"
+
+# Phases faster than this are too noisy to flag as regressions
+MIN_COMPARABLE_SECONDS = 0.05
+
+
+def tasks_per_section_for(num_users):
+    return max(1, round(BASE_TASKS_PER_SECTION * num_users / BASE_USERS))
+
+
+def run_rung(args):
+    """Child process: run one pipeline and write its stage report as JSON"""
+    import logging
+    from main import AsanaDataGenerator
+    from profiling import peak_rss_kb
+
+    logging.getLogger().setLevel(logging.WARNING)
+    generator = AsanaDataGenerator(
+        db_path=args.db, bulk_load=args.bulk_load, writer_thread=args.writer_thread,
+        seed=SEED, as_of=datetime.fromisoformat(AS_OF),
+        vectorized_tasks=args.vectorized_tasks,
+    )
+    start = time.perf_counter()
+    generator.setup_database()
+    generator.generate_all(
+        num_users=args.rung, projects_per_team=PROJECTS_PER_TEAM,
+        tasks_per_section=tasks_per_section_for(args.rung),
+    )
+    report = generator.recorder.report()
+    report['wall_seconds'] = round(time.perf_counter() - start, 6)
+    report['peak_rss_kb'] = peak_rss_kb()
+    report['db_bytes'] = os.path.getsize(args.db)
+    with open(args.report, 'w') as f:
+        json.dump(report, f)
+
+
+def run_ladder(args):
+    results = {
+        'created_at': datetime.now().isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'config': {
+            'seed': SEED,
+            'as_of': AS_OF,
+            'projects_per_team': PROJECTS_PER_TEAM,
+            'bulk_load': args.bulk_load,
+            'writer_thread': args.writer_thread,
+            'vectorized_tasks': args.vectorized_tasks,
+        },
+        'rungs': [],
+    }
+    with tempfile.TemporaryDirectory(prefix='asana-bench-') as tmp:
+        for num_users in args.sizes:
+            db = os.path.join(tmp, f'rung_{num_users}.sqlite')
+            report_path = os.path.join(tmp, f'rung_{num_users}.json')
+            cmd = [sys.executable, os.path.abspath(__file__), '--rung', str(num_users),
+                   '--db', db, '--report', report_path]
+            cmd += [flag for flag, on in (('--bulk-load', args.bulk_load),
+                                          ('--writer-thread', args.writer_thread),
+                                          ('--vectorized-tasks', args.vectorized_tasks)) if on]
+            print(f"Running {num_users} users (tasks-per-section {tasks_per_section_for(num_users)})...",
+                  flush=True)
+            subprocess.run(cmd, cwd=REPO_ROOT, check=True)
+            with open(report_path) as f:
+                report = json.load(f)
+            report['num_users'] = num_users
+            report['tasks_per_section'] = tasks_per_section_for(num_users)
+            results['rungs'].append(report)
+            os.remove(db)
+            print_rung(report)
+    return results
+
+
+def print_rung(report):
+    print(f"\n{report['num_users']} users: {report['wall_seconds']:.2f}s wall, "
+          f"peak RSS {(report['peak_rss_kb'] or 0) / 1024:.0f} MiB, "
+          f"{report['db_bytes'] / 1e6:.1f} MB on disk")
+    print(f"  {'stage':<24} {'phase':<9} {'rows':>10} {'seconds':>9} {'rows/sec':>12} "
+          f"{'+peak MiB':>10} {'+rss MiB':>9}")
+    for stage in report['stages']:
+        print(f"  {stage['stage']:<24} {stage['phase']:<9} {stage['rows']:>10,} "
+              f"{stage['seconds']:>9.3f} {stage['rows_per_sec']:>12,.0f} "
+              f"{(stage['peak_rss_growth_kb'] or 0) / 1024:>10.1f} "
+              f"{(stage['rss_delta_kb'] or 0) / 1024:>9.1f}")
+
+
+def compare(results, baseline, threshold):
+    """Return a list of regression descriptions (slower by more than threshold)"""
+    regressions = []
+    base_rungs = {rung['num_users']: rung for rung in baseline['rungs']}
+    for rung in results['rungs']:
+        base = base_rungs.get(rung['num_users'])
+        if base is None:
+            continue
+        base_stages = {(s['stage'], s['phase']): s for s in base['stages']}
+        checks = [(f"{rung['num_users']} users total", rung['wall_seconds'], base['wall_seconds'])]
+        for stage in rung['stages']:
+            before = base_stages.get((stage['stage'], stage['phase']))
+            if before is not None:
+                checks.append((f"{rung['num_users']} users {stage['stage']}/{stage['phase']}",
+                               stage['seconds'], before['seconds']))
+        for label, now, before in checks:
+            if before < MIN_COMPARABLE_SECONDS:
+                continue
+            change = now / before - 1
+            if change > threshold:
+                regressions.append(f"{label}: {before:.3f}s -> {now:.3f}s (+{change:.0%})")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Scale-ladder benchmark for generate_all')
+    parser.add_argument('--sizes', type=lambda s: [int(x) for x in s.split(',')],
+                        default=DEFAULT_SIZES, help='Comma-separated user counts')
+    parser.add_argument('--output', default=None, help='Write results JSON here')
+    parser.add_argument('--baseline', default=None, help='Results JSON to compare against')
+    parser.add_argument('--threshold', type=float, default=0.20,
+                        help='Flag phases slower than baseline by more than this fraction')
+    parser.add_argument('--bulk-load', action='store_true')
+    parser.add_argument('--writer-thread', action='store_true')
+    parser.add_argument('--vectorized-tasks', action='store_true')
+    # Internal: run a single rung in this process
+    parser.add_argument('--rung', type=int, help=argparse.SUPPRESS)
+    parser.add_argument('--db', help=argparse.SUPPRESS)
+    parser.add_argument('--report', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.rung is not None:
+        run_rung(args)
+        return 0
+
+    results = run_ladder(args)
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(results, f, indent=2)
+        print(f"\nResults written to {args.output}")
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        if baseline.get('config') != results['config']:
+            print("Warning: baseline was recorded with a different configuration")
+        regressions = compare(results, baseline, args.threshold)
+        if regressions:
+            print(f"\n{len(regressions)} regression(s) over {args.threshold:.0%}:")
+            for line in regressions:
+                print(f"  {line}")
+            return 1
+        print(f"\nNo regressions over {args.threshold:.0%} against {args.baseline}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,5 +1,6 @@
 -- Asana RL Seed Data Schema
 -- Comprehensive relational schema for simulating Asana enterprise workspace
+-- Index DDL lives in schema_indexes.sql so bulk loads can build indexes after the data
 
 -- ============================================================================
 -- Organizations / Workspaces
@@ -241,21 +242,3 @@ CREATE TABLE attachments (
     FOREIGN KEY (task_id) REFERENCES tasks(task_id),
     FOREIGN KEY (uploaded_by_user_id) REFERENCES users(user_id)
 );
-
--- ============================================================================
--- Indexes for Performance
--- ============================================================================
-CREATE INDEX idx_tasks_project ON tasks(project_id);
-CREATE INDEX idx_tasks_assignee ON tasks(assignee_id);
-CREATE INDEX idx_tasks_due_date ON tasks(due_date);
-CREATE INDEX idx_tasks_created_at ON tasks(created_at);
-CREATE INDEX idx_tasks_section ON tasks(section_id);
-CREATE INDEX idx_subtasks_task ON subtasks(task_id);
-CREATE INDEX idx_comments_task ON comments(task_id);
-CREATE INDEX idx_team_memberships_user ON team_memberships(user_id);
-CREATE INDEX idx_team_memberships_team ON team_memberships(team_id);
-CREATE INDEX idx_custom_field_values_task ON custom_field_values(task_id);
-CREATE INDEX idx_task_tags_task ON task_tags(task_id);
-CREATE INDEX idx_projects_team ON projects(team_id);
-CREATE INDEX idx_users_org ON users(org_id);
-CREATE INDEX idx_teams_org ON teams(org_id);
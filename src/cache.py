@@ -0,0 +1,81 @@
+# Content-addressed cache of generated databases
+#
+# A seeded run is fully determined by its generation parameters and the code
+# that produced it, so the finished database can be stored under a hash of
+# both and served again with a copy (or hardlink) instead of a rebuild.
+import hashlib
+import json
+import os
+import shutil
+from pathlib import Path
+from typing import Dict, Optional
+
+DEFAULT_CACHE_DIR = "output/cache"
+
+# Files whose contents define the "code version" part of the cache key
+_PROJECT_ROOT = Path(__file__).resolve().parent.parent
+_CODE_GLOBS = ["src/**/*.py", "schema*.sql"]
+
+
+def code_version() -> str:
+    """Hash of every source file and schema file that influences the output"""
+    digest = hashlib.sha256()
+    for pattern in _CODE_GLOBS:
+        for path in sorted(_PROJECT_ROOT.glob(pattern)):
+            if "__pycache__" in path.parts:
+                continue
+            digest.update(str(path.relative_to(_PROJECT_ROOT)).encode())
+            digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+def cache_key(params: Dict) -> str:
+    """Stable key for a set of generation parameters plus the current code version"""
+    payload = dict(params, code_version=code_version())
+    encoded = json.dumps(payload, sort_keys=True, default=str).encode()
+    return hashlib.sha256(encoded).hexdigest()
+
+
+class DatasetCache:
+    """Directory of finished databases named by cache key"""
+
+    def __init__(self, cache_dir: str = DEFAULT_CACHE_DIR):
+        self.cache_dir = Path(cache_dir)
+
+    def path_for(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.sqlite"
+
+    def lookup(self, key: str) -> Optional[Path]:
+        path = self.path_for(key)
+        return path if path.exists() else None
+
+    def materialize(self, key: str, dest: str, hardlink: bool = False) -> Path:
+        """
+        Place the cached database at dest, replacing whatever is there.
+        Hardlinks share storage with the cache entry, so writes to dest
+        would corrupt the cache; only use them for read-only consumers.
+        """
+        source = self.path_for(key)
+        dest_path = Path(dest)
+        dest_path.parent.mkdir(parents=True, exist_ok=True)
+        if dest_path.exists():
+            dest_path.unlink()
+        if hardlink:
+            try:
+                os.link(source, dest_path)
+                return dest_path
+            except OSError:
+                pass  # cross-device or unsupported filesystem: fall back to a copy
+        shutil.copyfile(source, dest_path)
+        return dest_path
+
+    def store(self, key: str, db_path: str, params: Dict) -> Path:
+        """Copy a finished database into the cache atomically, with its parameters alongside"""
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        target = self.path_for(key)
+        tmp = target.with_suffix(".sqlite.tmp")
+        shutil.copyfile(db_path, tmp)
+        os.replace(tmp, target)
+        with open(target.with_suffix(".json"), "w") as f:
+            json.dump(dict(params, code_version=code_version()), f, indent=2, sort_keys=True, default=str)
+        return target
@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+Export a finished database as sharded .jsonl.gz files
+
+Reads each table (and optionally a denormalized task view) with chunked
+cursors and writes <out>/<table>/part-NNNNN.jsonl.gz shards of a fixed row
+count, compressed in a process pool, plus a manifest.json with row counts
+and SHA-256 checksums per shard.
+
+Usage:
+    python src/export.py output/asana_simulation.sqlite --out output/export --task-view
+    python src/export.py --verify output/export
+"""
+
+import argparse
+import logging
+import os
+import sys
+
+from storage.rows import TABLE_COLUMNS
+from storage.jsonl_export import (
+    export_database, verify_manifest, DEFAULT_SHARD_ROWS, DEFAULT_COMPRESS_WORKERS,
+    DEFAULT_COMPRESSLEVEL
+)
+
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Export the seed database as sharded .jsonl.gz files")
+    parser.add_argument("db", nargs="?", default="output/asana_simulation.sqlite",
+                        help="Database to export (default: output/asana_simulation.sqlite)")
+    parser.add_argument("--out", type=str, default="output/export",
+                        help="Output directory (default: output/export)")
+    parser.add_argument("--tables", type=str, default=None,
+                        help="Comma-separated tables to export (default: all; '' for none)")
+    parser.add_argument("--task-view", action="store_true",
+                        help="Also export the denormalized task_view (task + project, team, "
+                             "section, people, tags and counts)")
+    parser.add_argument("--shard-rows", type=int, default=DEFAULT_SHARD_ROWS,
+                        help=f"Rows per shard (default: {DEFAULT_SHARD_ROWS})")
+    parser.add_argument("--workers", type=int, default=DEFAULT_COMPRESS_WORKERS,
+                        help=f"Compression processes (default: {DEFAULT_COMPRESS_WORKERS})")
+    parser.add_argument("--compresslevel", type=int, default=DEFAULT_COMPRESSLEVEL,
+                        help=f"gzip level 1-9 (default: {DEFAULT_COMPRESSLEVEL})")
+    parser.add_argument("--verify", metavar="DIR", default=None,
+                        help="Check an existing export against its manifest and exit")
+    args = parser.parse_args()
+
+    if args.verify:
+        problems = verify_manifest(args.verify)
+        for problem in problems:
+            logger.error(problem)
+        logger.info(f"{args.verify}: {'OK' if not problems else f'{len(problems)} problem(s)'}")
+        sys.exit(1 if problems else 0)
+
+    tables = None
+    if args.tables is not None:
+        tables = [t for t in args.tables.split(',') if t]
+        unknown = sorted(set(tables) - set(TABLE_COLUMNS))
+        if unknown:
+            parser.error(f"unknown tables: {', '.join(unknown)}")
+    if not os.path.exists(args.db):
+        parser.error(f"{args.db} not found")
+
+    writer = export_database(
+        args.db, args.out, tables=tables, task_view=args.task_view,
+        shard_rows=args.shard_rows, workers=args.workers, compresslevel=args.compresslevel
+    )
+    writer.log_report(logger)
+    shards = sum(len(entry['shards']) for entry in writer.manifest.values())
+    logger.info(f"Exported {len(writer.manifest)} datasets in {shards} shards")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,9 +1,10 @@
 # Organization and Company data generation
 import random
+import re
 from datetime import datetime, timedelta
 from typing import List, Dict
 from models import Organization
-from utils.helpers import generate_uuid, generate_random_datetime
+from utils.helpers import new_id, generate_random_datetime, AliasSampler
 
 # Real industries extracted from Y Combinator and market data
 INDUSTRIES = [
@@ -30,28 +31,48 @@ COMPANY_SUFFIXES = [
     "Works", "Engine", "Logic", "Sync", "Bridge", "Core"
 ]
 
+COMPANY_WORDS = ["Spark", "Atlas", "Surge", "Forge", "React", "Flux", "Drift", "Shift", "Drift", "Stride"]
+
 # Domain extensions for realism
 DOMAIN_EXTENSIONS = ["com", "io", "ai", "tech", "cloud", "dev"]
 
+# Employee count ranges and their weights (typical of SaaS companies):
+# most companies 50-2000 employees, some larger, few smaller
+EMPLOYEE_COUNT_RANGES = [(10, 50), (50, 500), (500, 2000), (2000, 10000)]
+EMPLOYEE_COUNT_WEIGHTS = [10, 50, 30, 10]
+EMPLOYEE_COUNT_SAMPLER = AliasSampler(EMPLOYEE_COUNT_RANGES, EMPLOYEE_COUNT_WEIGHTS)
+
+# Consecutive repeated draws after which the naming patterns count as exhausted
+MAX_NAME_ATTEMPTS = 1000
+
 def generate_company_names(count: int) -> List[str]:
-    """Generate realistic company names based on real naming patterns"""
-    names = set()
-    
-    # Pattern 1: Prefix + Suffix
-    while len(names) < count:
-        prefix = random.choice(COMPANY_PREFIXES)
-        suffix = random.choice(COMPANY_SUFFIXES)
-        names.add(f"{prefix}{suffix}")
-        
-        if len(names) >= count:
-            break
-        
-        # Pattern 2: Word + industry term
-        words = ["Spark", "Atlas", "Surge", "Forge", "React", "Flux", "Drift", "Shift", "Drift", "Stride"]
-        industry = random.choice(INDUSTRIES)
-        names.add(f"{random.choice(words)}{industry}")
-    
-    return list(names)[:count]
+    """
+    Generate realistic company names based on real naming patterns.
+    
+    Names are returned in draw order, so seeded runs get the same list.
+    The two patterns yield a few hundred distinct names; beyond that,
+    drawn names are reused with a number appended.
+    """
+    names = {}  # insertion-ordered set
+    misses = 0
+    
+    while len(names) < count and misses < MAX_NAME_ATTEMPTS:
+        # Pattern 1: Prefix + Suffix, alternating with pattern 2: Word + industry term
+        if (len(names) + misses) % 2 == 0:
+            name = f"{random.choice(COMPANY_PREFIXES)}{random.choice(COMPANY_SUFFIXES)}"
+        else:
+            name = f"{random.choice(COMPANY_WORDS)}{random.choice(INDUSTRIES)}"
+        if name in names:
+            misses += 1
+        else:
+            names[name] = None
+            misses = 0
+    
+    drawn = list(names)
+    for i in range(count - len(drawn)):
+        names[f"{drawn[i % len(drawn)]} {i // len(drawn) + 2}"] = None
+    
+    return list(names)
 
 def generate_organization(
     org_index: int,
@@ -66,19 +87,14 @@ def generate_organization(
     - Domain validation
     - Creation dates within operational history
     """
-    org_id = generate_uuid()
+    org_id = new_id()
     
-    # Domain from company name (realistic pattern)
-    domain_name = company_name.lower().replace(" ", "")
+    # Domain from company name (realistic pattern), e.g. "Flux AI/ML 2" -> fluxaiml2
+    domain_name = re.sub(r'[^a-z0-9]', '', company_name.lower())
     domain = f"{domain_name}.{random.choice(DOMAIN_EXTENSIONS)}"
     
-    # Realistic employee count distribution (log-normal, typical of SaaS companies)
-    # Most companies 50-2000 employees, some larger, few smaller
-    employee_count = random.choices(
-        [random.randint(10, 50), random.randint(50, 500), random.randint(500, 2000), random.randint(2000, 10000)],
-        weights=[10, 50, 30, 10],
-        k=1
-    )[0]
+    # Realistic employee count distribution: weighted range, then uniform within it
+    employee_count = random.randint(*EMPLOYEE_COUNT_SAMPLER.draw())
     
     industry = random.choice(INDUSTRIES)
     
@@ -129,7 +145,7 @@ def generate_single_large_organization(
     if base_datetime is None:
         base_datetime = datetime.now()
     
-    org_id = generate_uuid()
+    org_id = new_id()
     domain_name = company_name.lower().replace(" ", "")
     domain = f"{domain_name}.com"
     
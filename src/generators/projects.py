@@ -1,9 +1,9 @@
 # Project data generation based on real Asana/GitHub/ProductHunt patterns
 import random
 from datetime import datetime, timedelta, date
-from typing import List
+from typing import List, Optional, Set
 from models import Project, Section
-from utils.helpers import generate_uuid
+from utils.helpers import TemplatePool, new_id
 
 # Real project naming patterns from:
 # 1. Public Asana templates
@@ -51,6 +51,22 @@ PROJECT_NAMES_BY_TYPE = {
     'product': PRODUCT_PROJECT_NAMES
 }
 
+# 30% of names get a quarter and year appended for uniqueness
+PROJECT_NAME_PATTERNS = ["{name}", "{name} {quarter} {year}"]
+PROJECT_NAME_PATTERN_WEIGHTS = [0.7, 0.3]
+QUARTERS = ["Q1", "Q2", "Q3", "Q4"]
+YEARS = [2024, 2025]
+
+# Name lists compiled once into indexed pools
+PROJECT_NAME_POOLS = {
+    project_type: TemplatePool(
+        PROJECT_NAME_PATTERNS, {'name': names, 'quarter': QUARTERS, 'year': YEARS},
+        weights=PROJECT_NAME_PATTERN_WEIGHTS
+    )
+    for project_type, names in PROJECT_NAMES_BY_TYPE.items()
+}
+DEFAULT_PROJECT_NAME_POOL = PROJECT_NAME_POOLS['product_development']
+
 # Standard sections/columns in Asana (realistic workflow)
 PROJECT_SECTIONS = {
     'product_development': ["Backlog", "In Progress", "In Review", "Testing", "Deployed"],
@@ -77,17 +93,10 @@ def generate_project(
     base_datetime: datetime
 ) -> Project:
     """Generate a single realistic project"""
-    project_id = generate_uuid()
-    
-    # Choose realistic name
-    names = PROJECT_NAMES_BY_TYPE.get(project_type, ENGINEERING_PROJECT_NAMES)
-    name = random.choice(names)
+    project_id = new_id()
     
-    # Add uniqueness by appending initiative name or quarter
-    if random.random() < 0.3:
-        quarters = ["Q1", "Q2", "Q3", "Q4"]
-        years = [2024, 2025]
-        name = f"{name} {random.choice(quarters)} {random.choice(years)}"
+    # Choose realistic name, with a quarter appended for uniqueness
+    name = PROJECT_NAME_POOLS.get(project_type, DEFAULT_PROJECT_NAME_POOL).draw()
     
     description = PROJECT_DESCRIPTIONS.get(project_type, "")
     
@@ -129,19 +138,28 @@ def generate_project(
         visibility='team'
     )
 
+# Redraws of a clashing project name before falling back to a numbered name
+MAX_NAME_ATTEMPTS = 1000
+
 def generate_projects(
     org_id: str,
     teams: List,
     users: List,
     base_datetime: datetime = None,
-    projects_per_team: int = 3
+    projects_per_team: int = 3,
+    used_names: Optional[Set[str]] = None
 ) -> List[Project]:
-    """Generate projects for teams in an organization"""
+    """
+    Generate projects for teams in an organization.
+    used_names holds names already taken (e.g. by an existing database in
+    append mode); it is updated in place.
+    """
     if base_datetime is None:
         base_datetime = datetime.now()
     
     projects = []
-    used_names = set()  # Track project names to avoid duplicates
+    if used_names is None:
+        used_names = set()  # Track project names to avoid duplicates
     
     for team in teams:
         # Skip leadership team
@@ -179,7 +197,8 @@ def generate_projects(
                 base_datetime=base_datetime
             )
             
-            while project.name in used_names:
+            attempts = 0
+            while project.name in used_names and attempts < MAX_NAME_ATTEMPTS:
                 project = generate_project(
                     org_id=org_id,
                     team_id=team.team_id,
@@ -188,6 +207,13 @@ def generate_projects(
                     project_index=len(projects),
                     base_datetime=base_datetime
                 )
+                attempts += 1
+            
+            # The name pools are finite; number the name once they run out
+            base_name, number = project.name, 2
+            while project.name in used_names:
+                project.name = f"{base_name} ({number})"
+                number += 1
             
             used_names.add(project.name)
             projects.append(project)
@@ -204,7 +230,7 @@ def generate_sections(
     sections = []
     
     for order, name in enumerate(section_names):
-        section_id = generate_uuid()
+        section_id = new_id()
         section = Section(
             section_id=section_id,
             project_id=project_id,
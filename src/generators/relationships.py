@@ -0,0 +1,66 @@
+# Shared relationship index for the generators
+# Built once per run and filled stage by stage, so generators look up
+# project->sections, project->tasks, team->members etc. in O(1) instead of
+# rescanning the full entity lists inside their loops.
+from collections import defaultdict
+from typing import Dict, Iterable, List, Optional
+
+from models.columnar import entity_columns
+
+
+def group_by(items: Iterable, attr: str) -> Dict[str, List]:
+    """Group entities into lists keyed by one of their attributes"""
+    groups = defaultdict(list)
+    for item in items:
+        groups[getattr(item, attr)].append(item)
+    return groups
+
+
+class RelationshipIndex:
+    """O(1) lookups between entities generated so far"""
+
+    def __init__(self):
+        self.user_ids: List[str] = []
+        self.users_by_id: Dict[str, object] = {}
+        self.sections_by_project: Dict[str, List] = defaultdict(list)
+        # (task_id, created_at) pairs, so a TaskTable needs no Task rows
+        self.tasks_by_project: Dict[str, List[tuple]] = defaultdict(list)
+        self.custom_fields_by_project: Dict[str, List] = defaultdict(list)
+        self.members_by_team: Dict[str, List[str]] = defaultdict(list)
+        self.user_team_count: Dict[str, int] = defaultdict(int)
+
+    @classmethod
+    def build(cls, users: Optional[List] = None, sections: Optional[List] = None,
+              tasks: Optional[List] = None, custom_fields: Optional[List] = None,
+              memberships: Optional[List] = None) -> "RelationshipIndex":
+        """Index whatever entity lists are already available"""
+        index = cls()
+        index.add_users(users or [])
+        index.add_sections(sections or [])
+        index.add_tasks(tasks or [])
+        index.add_custom_fields(custom_fields or [])
+        index.add_memberships(memberships or [])
+        return index
+
+    def add_users(self, users: Iterable):
+        for user in users:
+            self.user_ids.append(user.user_id)
+            self.users_by_id[user.user_id] = user
+
+    def add_sections(self, sections: Iterable):
+        for section in sections:
+            self.sections_by_project[section.project_id].append(section)
+
+    def add_tasks(self, tasks):
+        """Index Task rows or a TaskTable"""
+        for project_id, task_id, created_at in entity_columns(tasks, 'project_id', 'task_id', 'created_at'):
+            self.tasks_by_project[project_id].append((task_id, created_at))
+
+    def add_custom_fields(self, custom_fields: Iterable):
+        for field in custom_fields:
+            self.custom_fields_by_project[field.project_id].append(field)
+
+    def add_memberships(self, memberships: Iterable):
+        for membership in memberships:
+            self.members_by_team[membership.team_id].append(membership.user_id)
+            self.user_team_count[membership.user_id] += 1
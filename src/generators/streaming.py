@@ -0,0 +1,66 @@
+# Project-sized streaming of the task-level entities
+# Everything below a project (sections, custom fields, tasks and their children)
+# only references rows of the same project, so it can be generated, written
+# and dropped one project at a time.
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Iterator, List
+
+from generators.projects import generate_sections
+from generators.tasks import generate_project_tasks, generate_subtasks, generate_comments
+from generators.tags import (
+    generate_custom_fields, generate_custom_field_values,
+    generate_task_tags, generate_task_dependencies
+)
+
+
+@dataclass
+class ProjectChunk:
+    """All rows that hang off one project"""
+    project: object
+    sections: List
+    custom_fields: List
+    tasks: List
+    subtasks: List
+    comments: List
+    custom_field_values: List
+    task_tags: List
+    dependencies: List
+
+
+def iter_project_chunks(
+    projects: List,
+    users: List,
+    tags: List,
+    base_datetime: datetime = None,
+    tasks_per_section: int = 10,
+    vectorized: bool = False
+) -> Iterator[ProjectChunk]:
+    """
+    Yield one ProjectChunk per project.
+    Only the current chunk is alive at any time, so peak memory is bounded
+    by the largest project rather than by the whole dataset.
+    """
+    if base_datetime is None:
+        base_datetime = datetime.now()
+    
+    user_ids = [u.user_id for u in users]
+    
+    for project in projects:
+        sections = generate_sections(project.project_id, project.project_type, project.created_at)
+        custom_fields = generate_custom_fields([project], base_datetime)
+        tasks = generate_project_tasks(
+            project, sections, user_ids, base_datetime, tasks_per_section, vectorized
+        )
+        
+        yield ProjectChunk(
+            project=project,
+            sections=sections,
+            custom_fields=custom_fields,
+            tasks=tasks,
+            subtasks=generate_subtasks(tasks, users, base_datetime, user_ids=user_ids),
+            comments=generate_comments(tasks, users, base_datetime, user_ids=user_ids),
+            custom_field_values=generate_custom_field_values(tasks, custom_fields, base_datetime),
+            task_tags=generate_task_tags(tasks, tags, base_datetime),
+            dependencies=generate_task_dependencies(tasks, base_datetime)
+        )
@@ -1,9 +1,13 @@
 # Tags, Custom Fields and other metadata generation
 import random
+import sys
+from dataclasses import dataclass
 from datetime import datetime
-from typing import List
+from typing import Dict, List, Optional
 from models import Tag, CustomFieldDefinition, CustomFieldValue, TaskTag, TaskDependency
-from utils.helpers import generate_uuid
+from generators.relationships import RelationshipIndex
+from models.columnar import entity_columns
+from utils.helpers import new_id, AliasSampler
 
 # Realistic tags used across teams
 UNIVERSAL_TAGS = [
@@ -59,7 +63,7 @@ def generate_tags(org_id: str, created_at: datetime) -> List[Tag]:
     tags = []
     
     for name, color in UNIVERSAL_TAGS:
-        tag_id = generate_uuid()
+        tag_id = new_id()
         tag = Tag(
             tag_id=tag_id,
             org_id=org_id,
@@ -86,7 +90,7 @@ def generate_custom_fields(
         )
         
         for field_name, field_type, options in default_fields:
-            field_id = generate_uuid()
+            field_id = new_id()
             field = CustomFieldDefinition(
                 field_id=field_id,
                 project_id=project.project_id,
@@ -103,31 +107,35 @@ def generate_custom_fields(
 def generate_custom_field_values(
     tasks: List,
     custom_fields: List,
-    created_at: datetime
+    created_at: datetime,
+    index: Optional[RelationshipIndex] = None
 ) -> List[CustomFieldValue]:
-    """Generate values for custom fields on tasks"""
+    """Generate values for custom fields on tasks (Task rows or a TaskTable)"""
+    if index is None:
+        index = RelationshipIndex.build(custom_fields=custom_fields)
     values = []
     
-    for task in tasks:
+    for task_id, project_id in entity_columns(tasks, 'task_id', 'project_id'):
         # Get fields for this task's project
-        task_fields = [f for f in custom_fields if f.project_id == task.project_id]
+        task_fields = index.custom_fields_by_project.get(project_id, [])
         
         for field in task_fields:
-            value_id = generate_uuid()
+            value_id = new_id()
             
             # Generate value based on field type
             if field.field_type == 'dropdown':
                 field_value = random.choice(['Yes', 'No', 'Pending', 'Done', 'In Progress'])
             elif field.field_type == 'number':
-                field_value = str(random.randint(1, 100))
+                # Few distinct values across many rows: share one string each
+                field_value = sys.intern(str(random.randint(1, 100)))
             elif field.field_type == 'text':
-                field_value = f"Value_{random.randint(1, 1000)}"
+                field_value = sys.intern(f"Value_{random.randint(1, 1000)}")
             else:
                 field_value = "Unknown"
             
             value = CustomFieldValue(
                 value_id=value_id,
-                task_id=task.task_id,
+                task_id=task_id,
                 field_id=field.field_id,
                 value=field_value,
                 created_at=created_at,
@@ -142,10 +150,10 @@ def generate_task_tags(
     tags: List,
     created_at: datetime
 ) -> List[TaskTag]:
-    """Generate tag associations for tasks"""
+    """Generate tag associations for tasks (Task rows or a TaskTable)"""
     task_tags = []
     
-    for task in tasks:
+    for task_id, in entity_columns(tasks, 'task_id'):
         # 60% of tasks get 1-3 tags
         if random.random() > 0.60:
             continue
@@ -154,10 +162,10 @@ def generate_task_tags(
         selected_tags = random.sample(tags, min(num_tags, len(tags)))
         
         for tag in selected_tags:
-            task_tag_id = generate_uuid()
+            task_tag_id = new_id()
             task_tag = TaskTag(
                 task_tag_id=task_tag_id,
-                task_id=task.task_id,
+                task_id=task_id,
                 tag_id=tag.tag_id,
                 added_at=created_at
             )
@@ -165,37 +173,83 @@ def generate_task_tags(
     
     return task_tags
 
-def generate_task_dependencies(
+# Share of tasks that depend on earlier tasks, and how many they depend on
+DEPENDENCY_PROBABILITY = 0.20
+DEPENDENCIES_PER_TASK = (1, 2)
+
+# Dependency rows always point from a task to an *earlier* task of the same
+# project. 'blocks' means depends_on_task blocks task; the former
+# 'is_blocked_by' share is folded into it, because emitting both for the
+# same direction produced contradictory pairs.
+DEPENDENCY_TYPES = ['blocks', 'related_to']
+DEPENDENCY_TYPE_WEIGHTS = [2, 1]
+DEPENDENCY_TYPE_SAMPLER = AliasSampler(DEPENDENCY_TYPES, DEPENDENCY_TYPE_WEIGHTS)
+
+@dataclass
+class DependencyGraph:
+    """Dependencies plus a precomputed schedule order for downstream consumers"""
+    dependencies: List[TaskDependency]
+    # Every task appears after all tasks it depends on
+    topological_order: List[str]
+    # Length of the longest chain of 'blocks' edges leading to each task
+    depth: Dict[str, int]
+
+def generate_task_dependency_graph(
     tasks: List,
-    created_at: datetime
-) -> List[TaskDependency]:
-    """Generate task dependencies"""
+    created_at: datetime,
+    index: Optional[RelationshipIndex] = None
+) -> DependencyGraph:
+    """
+    Generate a cycle-free dependency graph in linear time.
+    
+    Candidates come only from the task's own project bucket, ordered by
+    (created_at, generation order). A task may only depend on tasks that
+    precede it in that order, so the graph is a DAG by construction and
+    each (task, depends_on) pair can appear at most once, in one direction.
+    """
+    if index is None:
+        index = RelationshipIndex.build(tasks=tasks)
+    
     dependencies = []
+    topological_order = []
+    depth = {}
     
-    for task in tasks:
-        # 20% of tasks have dependencies
-        if random.random() > 0.20:
-            continue
-        
-        # Find other tasks in same project
-        related_tasks = [t for t in tasks if t.project_id == task.project_id and t.task_id != task.task_id]
-        
-        if not related_tasks:
-            continue
-        
-        # 1-2 dependencies per task
-        num_deps = random.randint(1, 2)
-        selected_deps = random.sample(related_tasks, min(num_deps, len(related_tasks)))
-        
-        for dep_task in selected_deps:
-            dep_id = generate_uuid()
-            dependency = TaskDependency(
-                dependency_id=dep_id,
-                task_id=task.task_id,
-                depends_on_task_id=dep_task.task_id,
-                dependency_type=random.choice(['blocks', 'is_blocked_by', 'related_to']),
-                created_at=created_at
+    for project_tasks in index.tasks_by_project.values():
+        # (task_id, created_at) pairs, see RelationshipIndex.tasks_by_project
+        ordered = [
+            task_id for _, (task_id, _) in sorted(
+                enumerate(project_tasks), key=lambda item: (item[1][1], item[0])
             )
-            dependencies.append(dependency)
+        ]
+        
+        for position, task_id in enumerate(ordered):
+            topological_order.append(task_id)
+            task_depth = 0
+            
+            # 20% of tasks have dependencies (the first task has nothing to depend on)
+            if position > 0 and random.random() <= DEPENDENCY_PROBABILITY:
+                num_deps = random.randint(*DEPENDENCIES_PER_TASK)
+                for earlier in random.sample(range(position), min(num_deps, position)):
+                    dep_task_id = ordered[earlier]
+                    dependency_type = DEPENDENCY_TYPE_SAMPLER.draw()
+                    dependencies.append(TaskDependency(
+                        dependency_id=new_id(),
+                        task_id=task_id,
+                        depends_on_task_id=dep_task_id,
+                        dependency_type=dependency_type,
+                        created_at=created_at
+                    ))
+                    if dependency_type == 'blocks':
+                        task_depth = max(task_depth, depth[dep_task_id] + 1)
+            
+            depth[task_id] = task_depth
     
-    return dependencies
+    return DependencyGraph(dependencies, topological_order, depth)
+
+def generate_task_dependencies(
+    tasks: List,
+    created_at: datetime,
+    index: Optional[RelationshipIndex] = None
+) -> List[TaskDependency]:
+    """Generate task dependencies (see generate_task_dependency_graph)"""
+    return generate_task_dependency_graph(tasks, created_at, index).dependencies
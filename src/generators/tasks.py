@@ -3,11 +3,18 @@
 
 import random
 from datetime import datetime, timedelta, date
-from typing import List, Tuple, Optional
+from typing import Iterator, List, Sequence, Tuple, Optional, Union
 from models import Task, Subtask, Comment, Tag, CustomFieldValue, TaskTag
+from models.columnar import Categorical, TaskTable, entity_columns
+from generators.relationships import RelationshipIndex
+from generators.texts import (
+    BRIEF_DESCRIPTION_IDS, DETAILED_DESCRIPTION_IDS, DETAILED_TASK_DESCRIPTION_POOL,
+    SUBTASK_DESCRIPTION_IDS, COMMENT_IDS
+)
 from utils.helpers import (
-    generate_uuid, generate_weighted_due_date, avoid_weekend,
-    generate_completion_time, is_realistic_date_range
+    AliasSampler, TemplatePool, new_id, new_ids, generate_weighted_due_date, avoid_weekend,
+    generate_completion_time, is_realistic_date_range,
+    generate_weighted_due_dates, generate_completion_times
 )
 import numpy as np
 
@@ -88,124 +95,132 @@ PROCESSES = ["hiring", "onboarding", "expense approval", "hiring workflow"]
 ACTIVITIES = ["training", "planning", "feedback", "retrospective"]
 RESOURCES = ["new hire", "new team", "vendor", "contractor"]
 COMPLIANCE = ["security audit", "GDPR", "SOC2", "financial"]
+OPERATIONS_TEAMS = ["engineering", "sales", "marketing", "leadership"]
+
+# Generic tasks for other project types
+GENERIC_PATTERNS = ["{verb} {object}"]
+GENERIC_VERBS = ["Implement", "Fix", "Update", "Review", "Test", "Deploy", "Document", "Optimize"]
+GENERIC_OBJECTS = ["feature", "bug", "process", "documentation", "system", "workflow"]
+
+# Pattern tables compiled once into indexed pools; each pattern only draws
+# the slots it uses
+TASK_NAME_POOLS = {
+    'product_development': TemplatePool(GITHUB_ENGINEERING_PATTERNS, {
+        'component': COMPONENTS,
+        'issue': ISSUES,
+        'feature': ["feature", "endpoint", "widget", "component"],
+        'goal': GOALS,
+        'metric': METRICS,
+        'edge_case': EDGE_CASES,
+        'version': [f"v{major}.{minor}" for major in range(1, 6) for minor in range(10)],
+        'area': ["performance", "security", "reliability"],
+    }, capitalize=True),
+    'marketing_campaign': TemplatePool(MARKETING_PATTERNS, {
+        'content_type': CONTENT_TYPES,
+        'channel': CHANNELS,
+        'campaign': CAMPAIGNS,
+        'metric': ["engagement", "conversion", "reach", "sentiment"],
+        'period': ["Q1", "Q2", "this month", "this week"],
+        'asset': ASSETS,
+        'topic': TOPICS,
+    }, capitalize=True),
+    'operations': TemplatePool(OPERATIONS_PATTERNS, {
+        'document': DOCUMENTS,
+        'event': EVENTS,
+        'event_type': EVENT_TYPES,
+        'team': OPERATIONS_TEAMS,
+        'system': SYSTEMS,
+        'process': PROCESSES,
+        'activity': ACTIVITIES,
+        'resource_type': RESOURCES,
+        'compliance': COMPLIANCE,
+    }, capitalize=True),
+}
+DEFAULT_TASK_NAME_POOL = TemplatePool(
+    GENERIC_PATTERNS, {'verb': GENERIC_VERBS, 'object': GENERIC_OBJECTS}, capitalize=True
+)
 
 def generate_task_name(project_type: str) -> str:
     """Generate realistic task names based on project type"""
-    if project_type == 'product_development':
-        pattern = random.choice(GITHUB_ENGINEERING_PATTERNS)
-        name = pattern.format(
-            component=random.choice(COMPONENTS),
-            issue=random.choice(ISSUES),
-            feature=random.choice(["feature", "endpoint", "widget", "component"]),
-            goal=random.choice(GOALS),
-            metric=random.choice(METRICS),
-            edge_case=random.choice(EDGE_CASES),
-            version=f"v{random.randint(1, 5)}.{random.randint(0, 9)}",
-            area=random.choice(["performance", "security", "reliability"])
-        )
-    elif project_type == 'marketing_campaign':
-        pattern = random.choice(MARKETING_PATTERNS)
-        name = pattern.format(
-            content_type=random.choice(CONTENT_TYPES),
-            channel=random.choice(CHANNELS),
-            campaign=random.choice(CAMPAIGNS),
-            metric=random.choice(["engagement", "conversion", "reach", "sentiment"]),
-            period=random.choice(["Q1", "Q2", "this month", "this week"]),
-            asset=random.choice(ASSETS),
-            topic=random.choice(TOPICS)
-        )
-    elif project_type == 'operations':
-        pattern = random.choice(OPERATIONS_PATTERNS)
-        name = pattern.format(
-            document=random.choice(DOCUMENTS),
-            event=random.choice(EVENTS),
-            event_type=random.choice(EVENT_TYPES),
-            team=random.choice(["engineering", "sales", "marketing", "leadership"]),
-            system=random.choice(SYSTEMS),
-            process=random.choice(PROCESSES),
-            activity=random.choice(ACTIVITIES),
-            resource_type=random.choice(RESOURCES),
-            compliance=random.choice(COMPLIANCE)
-        )
-    else:
-        # Default generic task
-        verbs = ["Implement", "Fix", "Update", "Review", "Test", "Deploy", "Document", "Optimize"]
-        objects = ["feature", "bug", "process", "documentation", "system", "workflow"]
-        name = f"{random.choice(verbs)} {random.choice(objects)}"
-    
-    return name.capitalize()
+    return TASK_NAME_POOLS.get(project_type, DEFAULT_TASK_NAME_POOL).draw()
+
+def generate_task_names(project_types: Sequence[str], intern: bool = True) -> np.ndarray:
+    """
+    Batch of task names, one per entry of project_types, drawn from numpy's
+    global RNG. With intern, identical names share one string object.
+    """
+    project_types = np.asarray(project_types, dtype=object)
+    names = np.empty(len(project_types), dtype=object)
+    for project_type in dict.fromkeys(project_types.tolist()):
+        mask = project_types == project_type
+        pool = TASK_NAME_POOLS.get(project_type, DEFAULT_TASK_NAME_POOL)
+        names[mask] = pool.sample(int(mask.sum()), intern=intern)
+    return names
+
+# 20% of tasks have no description; half of the rest a brief one and half
+# a detailed one
+NO_DESCRIPTION_PROBABILITY = 0.20
+BRIEF_DESCRIPTION_PROBABILITY = 0.50
 
-def generate_task_description(task_name: str, project_type: str) -> str:
-    """Generate realistic task descriptions with varying detail levels"""
-    # 20% no description
-    if random.random() < 0.20:
+def generate_task_description() -> Optional[int]:
+    """
+    Generate realistic task descriptions with varying detail levels, as a
+    text id (see generators/texts.py)
+    """
+    if random.random() < NO_DESCRIPTION_PROBABILITY:
         return None
     
-    # 50% brief 1-3 sentence description
-    if random.random() < 0.50:
-        descriptions_brief = [
-            "Work on implementing this feature in upcoming sprint.",
-            "Investigate and resolve reported issue.",
-            "Review and merge proposed changes.",
-            "Complete as part of planned milestone.",
-            "User-requested improvement for workflow optimization."
-        ]
-        return random.choice(descriptions_brief)
-    
-    # 30% detailed with bullet points (LLM-like content)
-    detailed_templates = [
-        f"""
-{task_name} - Detailed Implementation
-
-Current State:
-- Limited functionality in current implementation
-- Performance concerns reported
-
-Goals:
-- Implement full {random.choice(['feature set', 'workflow', 'integration'])}
-- Improve performance metrics
-- Ensure comprehensive test coverage
-
-Acceptance Criteria:
-- All tests passing
-- Code review approval
-- Performance benchmarks met
-- Documentation updated
-
-Timeline: {random.randint(1, 4)} weeks
-Priority: {random.choice(['High', 'Medium'])}
-        """,
-        f"""
-Background: {task_name}
-
-Description:
-{task_name} is critical for our {random.choice(['Q1', 'Q2', 'Q3', 'Q4'])} roadmap.
-
-Requirements:
-- Backward compatibility required
-- Cross-team coordination needed
-- Stakeholder approval pending
-
-Next Steps:
-1. Design review meeting
-2. Implementation sprint
-3. QA testing
-4. Production deployment
-
-Stakeholders: {random.choice(['Product', 'Engineering', 'Marketing'])} team
-        """
-    ]
-    
-    return random.choice(detailed_templates)
+    # Brief 1-3 sentence description
+    if random.random() < BRIEF_DESCRIPTION_PROBABILITY:
+        return random.choice(BRIEF_DESCRIPTION_IDS)
+    
+    # Detailed with bullet points (LLM-like content)
+    return DETAILED_DESCRIPTION_IDS[DETAILED_TASK_DESCRIPTION_POOL.code()]
+
+def generate_task_descriptions(n: int) -> np.ndarray:
+    """Batch of n task description text ids (None for no description) from numpy's global RNG"""
+    described = np.random.random(n) >= NO_DESCRIPTION_PROBABILITY
+    brief = np.random.random(n) < BRIEF_DESCRIPTION_PROBABILITY
+    ids = np.where(
+        brief,
+        BRIEF_DESCRIPTION_IDS.start + np.random.randint(0, len(BRIEF_DESCRIPTION_IDS), size=n),
+        DETAILED_DESCRIPTION_IDS.start + DETAILED_TASK_DESCRIPTION_POOL.codes(n),
+    )
+    descriptions = np.empty(n, dtype=object)
+    descriptions[:] = ids.tolist()
+    descriptions[~described] = None
+    return descriptions
+
+# Attribute distributions shared by the scalar and vectorized task paths
+PRIORITIES = ['low', 'medium', 'high', 'urgent']
+PRIORITY_WEIGHTS = [10, 60, 25, 5]
+
+OPEN_STATUSES = ['not_started', 'in_progress', 'on_hold']
+OPEN_STATUS_WEIGHTS = [30, 60, 10]
+
+ESTIMATED_HOURS = [2, 4, 8, 16, 24, 40]
+ESTIMATED_HOURS_WEIGHTS = [20, 25, 30, 15, 8, 2]
+ESTIMATE_PROBABILITY = 0.7
+
+# Compiled once; the scalar and vectorized paths draw from the same tables
+PRIORITY_SAMPLER = AliasSampler(PRIORITIES, PRIORITY_WEIGHTS)
+OPEN_STATUS_SAMPLER = AliasSampler(OPEN_STATUSES, OPEN_STATUS_WEIGHTS)
+ESTIMATED_HOURS_SAMPLER = AliasSampler(ESTIMATED_HOURS, ESTIMATED_HOURS_WEIGHTS)
+
+ASSIGNED_PROBABILITY = 0.85
+ACTUAL_HOURS_VARIANCE = 0.3
+
+# Engineering: 70-85%, Bug tracking: 60-70%, Ongoing: 40-50%
+COMPLETION_PROBABILITY_BY_TYPE = {
+    'product_development': 0.75,
+    'infrastructure': 0.70,
+}
+DEFAULT_COMPLETION_PROBABILITY = 0.60
 
 def generate_priority() -> str:
     """Generate task priority with realistic distribution"""
     # Based on typical task distribution: most medium, fewer high/low
-    return random.choices(
-        ['low', 'medium', 'high', 'urgent'],
-        weights=[10, 60, 25, 5],
-        k=1
-    )[0]
+    return PRIORITY_SAMPLER.draw()
 
 def generate_task_status(is_completed: bool) -> str:
     """Generate task status based on completion"""
@@ -213,11 +228,7 @@ def generate_task_status(is_completed: bool) -> str:
         return 'completed'
     
     # Distribution of non-completed tasks
-    return random.choices(
-        ['not_started', 'in_progress', 'on_hold'],
-        weights=[30, 60, 10],
-        k=1
-    )[0]
+    return OPEN_STATUS_SAMPLER.draw()
 
 def generate_task(
     project_id: str,
@@ -230,14 +241,14 @@ def generate_task(
     base_datetime: datetime
 ) -> Task:
     """Generate a single realistic task with temporal consistency"""
-    task_id = generate_uuid()
+    task_id = new_id()
     
     # Generate name and description
     name = generate_task_name(project_type)
-    description = generate_task_description(name, project_type)
+    description = generate_task_description()
     
     # Assignee: 85% assigned, 15% unassigned (per Asana benchmarks)
-    if random.random() < 0.85:
+    if random.random() < ASSIGNED_PROBABILITY:
         assignee_id = random.choice(user_ids)
     else:
         assignee_id = None
@@ -251,13 +262,7 @@ def generate_task(
     priority = generate_priority()
     
     # Completion with realistic cycle time distribution
-    # Engineering: 70-85%, Bug tracking: 60-70%, Ongoing: 40-50%
-    if project_type == 'product_development':
-        completion_prob = 0.75
-    elif project_type == 'infrastructure':
-        completion_prob = 0.70
-    else:
-        completion_prob = 0.60
+    completion_prob = COMPLETION_PROBABILITY_BY_TYPE.get(project_type, DEFAULT_COMPLETION_PROBABILITY)
     
     completed_at, is_completed = generate_completion_time(created_at, completion_prob)
     status = generate_task_status(is_completed)
@@ -268,19 +273,15 @@ def generate_task(
             completed_at = created_at + timedelta(days=random.randint(1, 14))
     
     # Estimated hours (varies by task)
-    if random.random() < 0.7:
-        estimated_hours = random.choices(
-            [2, 4, 8, 16, 24, 40],
-            weights=[20, 25, 30, 15, 8, 2],
-            k=1
-        )[0]
+    if random.random() < ESTIMATE_PROBABILITY:
+        estimated_hours = ESTIMATED_HOURS_SAMPLER.draw()
     else:
         estimated_hours = None
     
     # Actual hours (if completed, typically close to estimate)
     actual_hours = None
     if is_completed and estimated_hours:
-        variance = random.gauss(0, 0.3)  # 30% variance
+        variance = random.gauss(0, ACTUAL_HOURS_VARIANCE)  # 30% variance
         actual_hours = max(estimated_hours * (1 + variance), 0.5)
     
     return Task(
@@ -302,50 +303,212 @@ def generate_task(
         actual_hours=actual_hours
     )
 
+def project_task_count(project, tasks_per_section: int) -> int:
+    """Number of tasks to generate for a project (more for active projects)"""
+    if project.status == 'active':
+        return random.randint(tasks_per_section - 2, tasks_per_section + 5)
+    return random.randint(3, 10)
+
+def generate_project_tasks(
+    project,
+    project_sections: List,
+    user_ids: List[str],
+    base_datetime: datetime,
+    tasks_per_section: int = 10,
+    vectorized: bool = False,
+    num_tasks: Optional[int] = None
+) -> List[Task]:
+    """Generate the tasks of a single project (num_tasks defaults to project_task_count)"""
+    if num_tasks is None:
+        num_tasks = project_task_count(project, tasks_per_section)
+    if vectorized:
+        return generate_tasks_vectorized([(project, project_sections, num_tasks)], user_ids, base_datetime)
+    
+    tasks = []
+    for _ in range(num_tasks):
+        section = random.choice(project_sections)
+        task_created_at = generate_task_creation_time(
+            project.created_at,
+            base_datetime
+        )
+        
+        task = generate_task(
+            project_id=project.project_id,
+            section_id=section.section_id,
+            user_ids=user_ids,
+            created_by_user_id=random.choice(user_ids),
+            created_at=task_created_at,
+            project_type=project.project_type,
+            project_owner_id=project.owner_user_id,
+            base_datetime=base_datetime
+        )
+        tasks.append(task)
+    
+    return tasks
+
 def generate_tasks(
     projects: List,
     sections: List,
     users: List,
     base_datetime: datetime = None,
-    tasks_per_section: int = 10
+    tasks_per_section: int = 10,
+    vectorized: bool = False,
+    index: Optional[RelationshipIndex] = None,
+    as_table: bool = False
+):
+    """
+    Generate tasks for all projects and sections.
+    With vectorized=True every numeric attribute for the whole run is drawn
+    in one batch of NumPy calls (see generate_tasks_vectorized). as_table
+    implies vectorized and returns the columnar TaskTable instead of Task rows.
+    """
+    if index is None:
+        index = RelationshipIndex.build(users=users, sections=sections)
+    
+    if vectorized or as_table:
+        if base_datetime is None:
+            base_datetime = datetime.now()
+        plan = [
+            (project, index.sections_by_project[project.project_id],
+             project_task_count(project, tasks_per_section))
+            for project in projects
+        ]
+        if as_table:
+            return generate_task_table(plan, index.user_ids, base_datetime)
+        return generate_tasks_vectorized(plan, index.user_ids, base_datetime)
+    
+    tasks = []
+    for _, project_tasks in iter_project_tasks(
+        projects, sections, users, base_datetime, tasks_per_section, index=index
+    ):
+        tasks.extend(project_tasks)
+    
+    return tasks
+
+def generate_tasks_vectorized(
+    plan: List[Tuple[object, List, int]],
+    user_ids: List[str],
+    base_datetime: datetime
 ) -> List[Task]:
-    """Generate tasks for all projects and sections"""
+    """Batch path for task generation, materialized as Task rows (see generate_task_table)"""
+    return generate_task_table(plan, user_ids, base_datetime).to_tasks()
+
+def generate_task_table(
+    plan: List[Tuple[object, List, int]],
+    user_ids: List[str],
+    base_datetime: datetime
+) -> TaskTable:
+    """
+    Batch path for task generation.
+    
+    plan holds (project, project_sections, num_tasks) entries. Creation time,
+    section, assignee, creator, due date, priority, completion, status and
+    hours for every task in the plan are drawn as NumPy arrays in one shot,
+    using the same distributions as generate_task, and returned as a
+    columnar TaskTable. Names and description text ids are drawn as
+    batches too.
+    """
+    counts = np.array([num_tasks for _, _, num_tasks in plan], dtype=np.int64)
+    n = int(counts.sum())
+    if n == 0:
+        return TaskTable.from_tasks([])
+    
+    project_index = np.repeat(np.arange(len(plan)), counts)
+    
+    # Creation time (generate_task_creation_time): day offset into the
+    # project's lifetime, then a business-hours time of day
+    midnights = np.array(
+        [p.created_at.replace(hour=0, minute=0, second=0) for p, _, _ in plan], dtype='datetime64[us]'
+    )
+    ages = np.array([(base_datetime - p.created_at).days for p, _, _ in plan], dtype=np.int64)
+    age = ages[project_index]
+    rand = np.random.random(n)
+    high = np.where(
+        rand < 0.6, np.maximum(1, (age * 0.2).astype(np.int64)),
+        np.where(rand < 0.85, np.maximum(1, (age * 0.5).astype(np.int64)), age)
+    )
+    days = np.random.randint(0, high + 1)
+    hours = np.random.randint(8, 19, size=n)
+    minutes = np.random.randint(0, 60, size=n)
+    created_at = (
+        midnights[project_index]
+        + days.astype('timedelta64[D]')
+        + hours.astype('timedelta64[h]')
+        + minutes.astype('timedelta64[m]')
+    )
+    
+    # Section, assignee and creator
+    section_counts = np.array([len(sections) for _, sections, _ in plan], dtype=np.int64)
+    section_pick = (np.random.random(n) * section_counts[project_index]).astype(np.int64)
+    assigned = np.random.random(n) < ASSIGNED_PROBABILITY
+    assignee_pick = np.random.randint(0, len(user_ids), size=n)
+    creator_pick = np.random.randint(0, len(user_ids), size=n)
+    
+    due_dates = generate_weighted_due_dates(created_at.astype('datetime64[D]'))
+    
+    priority = PRIORITY_SAMPLER.indices(n)
+    
+    completion_probs = np.array([
+        COMPLETION_PROBABILITY_BY_TYPE.get(p.project_type, DEFAULT_COMPLETION_PROBABILITY) for p, _, _ in plan
+    ])
+    completed_at = generate_completion_times(created_at, completion_probs[project_index])
+    is_completed = ~np.isnat(completed_at)
+    open_status = OPEN_STATUS_SAMPLER.indices(n)
+    
+    has_estimate = np.random.random(n) < ESTIMATE_PROBABILITY
+    estimate = ESTIMATED_HOURS_SAMPLER.sample(n)
+    actual = np.maximum(estimate * (1 + np.random.normal(0, ACTUAL_HOURS_VARIANCE, n)), 0.5)
+    
+    # Names come from the compiled pools and descriptions as text ids, each
+    # in one batch; IDs come from the allocator in one block
+    project_types = np.array([p.project_type for p, _, _ in plan], dtype=object)[project_index]
+    task_ids = np.empty(n, dtype=object)
+    task_ids[:] = new_ids(n)
+    names = generate_task_names(project_types)
+    descriptions = generate_task_descriptions(n)
+    
+    section_offsets = np.concatenate(([0], np.cumsum(section_counts)[:-1]))
+    section_ids = [s.section_id for _, sections, _ in plan for s in sections]
+    
+    return TaskTable(
+        task_id=task_ids,
+        project_id=Categorical.from_codes(project_index, [p.project_id for p, _, _ in plan]),
+        section_id=Categorical.from_codes(section_offsets[project_index] + section_pick, section_ids),
+        name=names,
+        description=descriptions,
+        assignee_id=Categorical.from_codes(np.where(assigned, assignee_pick, -1), user_ids),
+        created_by_user_id=Categorical.from_codes(creator_pick, user_ids),
+        created_at=created_at,
+        due_date=due_dates,
+        start_date=np.full(n, np.datetime64('NaT'), dtype='datetime64[D]'),
+        priority=Categorical.from_codes(priority, PRIORITIES),
+        status=Categorical.from_codes(np.where(is_completed, len(OPEN_STATUSES), open_status), OPEN_STATUSES + ['completed']),
+        is_completed=is_completed,
+        completed_at=completed_at,
+        estimated_hours=np.where(has_estimate, estimate, np.nan),
+        actual_hours=np.where(is_completed & has_estimate, actual, np.nan),
+    )
+
+def iter_project_tasks(
+    projects: List,
+    sections: List,
+    users: List,
+    base_datetime: datetime = None,
+    tasks_per_section: int = 10,
+    vectorized: bool = False,
+    index: Optional[RelationshipIndex] = None
+) -> Iterator[Tuple[object, List[Task]]]:
+    """Yield (project, tasks) one project at a time so callers can stream the output"""
     if base_datetime is None:
         base_datetime = datetime.now()
-    
-    tasks = []
-    user_ids = [u.user_id for u in users]
+    if index is None:
+        index = RelationshipIndex.build(users=users, sections=sections)
     
     for project in projects:
-        # Get sections for this project
-        project_sections = [s for s in sections if s.project_id == project.project_id]
-        
-        # Generate tasks (more for active projects)
-        if project.status == 'active':
-            num_tasks = random.randint(tasks_per_section - 2, tasks_per_section + 5)
-        else:
-            num_tasks = random.randint(3, 10)
-        
-        for _ in range(num_tasks):
-            section = random.choice(project_sections)
-            task_created_at = generate_task_creation_time(
-                project.created_at,
-                base_datetime
-            )
-            
-            task = generate_task(
-                project_id=project.project_id,
-                section_id=section.section_id,
-                user_ids=user_ids,
-                created_by_user_id=random.choice(user_ids),
-                created_at=task_created_at,
-                project_type=project.project_type,
-                project_owner_id=project.owner_user_id,
-                base_datetime=base_datetime
-            )
-            tasks.append(task)
-    
-    return tasks
+        yield project, generate_project_tasks(
+            project, index.sections_by_project[project.project_id], index.user_ids,
+            base_datetime, tasks_per_section, vectorized
+        )
 
 def generate_task_creation_time(
     project_created_at: datetime,
@@ -376,18 +539,25 @@ def generate_task_creation_time(
     return task_created_at.replace(hour=hours, minute=minutes, second=0)
 
 def generate_subtasks(
-    tasks: List[Task],
+    tasks: Union[List[Task], TaskTable],
     users: List,
-    base_datetime: datetime = None
+    base_datetime: datetime = None,
+    user_ids: Optional[List[str]] = None
 ) -> List[Subtask]:
-    """Generate subtasks for complex tasks (realistic pattern)"""
+    """
+    Generate subtasks for complex tasks (realistic pattern), from Task rows
+    or a TaskTable. Pass user_ids when calling once per chunk to avoid
+    rebuilding it each time.
+    """
     if base_datetime is None:
         base_datetime = datetime.now()
     
     subtasks = []
-    user_ids = [u.user_id for u in users]
+    if user_ids is None:
+        user_ids = [u.user_id for u in users]
     
-    for task in tasks:
+    task_fields = entity_columns(tasks, 'task_id', 'created_at', 'due_date', 'is_completed', 'completed_at')
+    for task_id, created_at, due_date, is_completed, completed_at in task_fields:
         # 40% of tasks have subtasks
         if random.random() > 0.40:
             continue
@@ -396,7 +566,7 @@ def generate_subtasks(
         num_subtasks = random.randint(1, 4)
         
         for i in range(num_subtasks):
-            subtask_id = generate_uuid()
+            subtask_id = new_id()
             
             subtask_names = [
                 f"Design & Planning",
@@ -410,45 +580,37 @@ def generate_subtasks(
             
             subtask = Subtask(
                 subtask_id=subtask_id,
-                task_id=task.task_id,
+                task_id=task_id,
                 name=random.choice(subtask_names),
-                description=None if random.random() < 0.5 else "Subtask details",
+                description=None if random.random() < 0.5 else random.choice(SUBTASK_DESCRIPTION_IDS),
                 assignee_id=random.choice([None, random.choice(user_ids)]),
-                created_at=task.created_at + timedelta(days=random.randint(0, 5)),
-                due_date=task.due_date,
-                is_completed=task.is_completed,
-                completed_at=task.completed_at if task.is_completed else None
+                created_at=created_at + timedelta(days=random.randint(0, 5)),
+                due_date=due_date,
+                is_completed=is_completed,
+                completed_at=completed_at if is_completed else None
             )
             subtasks.append(subtask)
     
     return subtasks
 
 def generate_comments(
-    tasks: List[Task],
+    tasks: Union[List[Task], TaskTable],
     users: List,
-    base_datetime: datetime = None
+    base_datetime: datetime = None,
+    user_ids: Optional[List[str]] = None
 ) -> List[Comment]:
-    """Generate realistic comments on tasks"""
+    """
+    Generate realistic comments on tasks, from Task rows or a TaskTable.
+    Pass user_ids when calling once per chunk to avoid rebuilding it each time.
+    """
     if base_datetime is None:
         base_datetime = datetime.now()
     
     comments = []
-    user_ids = [u.user_id for u in users]
-    
-    comment_templates = [
-        "Looking good! Please make sure to test thoroughly.",
-        "I've reviewed the changes - a few minor suggestions in the PR.",
-        "Great progress on this. Let me know if you need any help.",
-        "This is blocking the release. Can we prioritize?",
-        "Thanks for the update. Ready to move forward.",
-        "I found an issue in the implementation. Let's sync up.",
-        "Approved for merge. Thanks for the thorough testing.",
-        "Do we have a timeline for this?",
-        "I'll take a look and provide feedback.",
-        "This needs more documentation before we proceed."
-    ]
-    
-    for task in tasks:
+    if user_ids is None:
+        user_ids = [u.user_id for u in users]
+    
+    for task_id, created_at in entity_columns(tasks, 'task_id', 'created_at'):
         # 30% of tasks have comments
         if random.random() > 0.30:
             continue
@@ -457,14 +619,14 @@ def generate_comments(
         num_comments = random.randint(1, 3)
         
         for j in range(num_comments):
-            comment_id = generate_uuid()
-            comment_at = task.created_at + timedelta(days=random.randint(0, 10))
+            comment_id = new_id()
+            comment_at = created_at + timedelta(days=random.randint(0, 10))
             
             comment = Comment(
                 comment_id=comment_id,
-                task_id=task.task_id,
+                task_id=task_id,
                 user_id=random.choice(user_ids),
-                content=random.choice(comment_templates),
+                content=random.choice(COMMENT_IDS),
                 created_at=comment_at,
                 updated_at=None,
                 is_edited=False
@@ -1,9 +1,24 @@
 # Team data generation
 import random
 from datetime import datetime, timedelta
-from typing import List
+from typing import List, Optional
 from models import Team, TeamMembership, User
-from utils.helpers import generate_uuid
+from generators.relationships import RelationshipIndex
+from utils.helpers import new_id
+
+# Users already in this many teams are only picked when nobody else is left
+MAX_TEAMS_PER_USER = 3
+
+TEAM_SIZE_RANGE = {
+    'leadership': (8, 12),
+    'engineering': (15, 35),
+    'product': (8, 15),
+    'design': (5, 12),
+    'data': (8, 15),
+    'marketing': (10, 25),
+    'sales': (15, 40),
+    'operations': (10, 20)
+}
 
 TEAM_TYPES = ['engineering', 'marketing', 'operations', 'sales', 'design', 'leadership', 'product', 'data']
 
@@ -57,7 +72,7 @@ def generate_team(
     base_datetime: datetime
 ) -> Team:
     """Generate a single realistic team"""
-    team_id = generate_uuid()
+    team_id = new_id()
     
     # Choose realistic name for team type
     team_names = TEAM_NAMES.get(team_type, TEAM_NAMES['engineering'])
@@ -161,44 +176,48 @@ def generate_teams(
 def generate_team_memberships(
     teams: List[Team],
     users: List[User],
-    base_datetime: datetime = None
+    base_datetime: datetime = None,
+    index: Optional[RelationshipIndex] = None
 ) -> List[TeamMembership]:
     """
     Generate realistic team memberships.
     Distribution: Most users in 1-2 teams, some in 3+ teams
+    
+    Memberships are recorded in index (members_by_team, user_team_count)
+    as they are created.
     """
     if base_datetime is None:
         base_datetime = datetime.now()
+    if index is None:
+        index = RelationshipIndex()
     
     memberships = []
-    user_team_count = {}  # Track how many teams each user is in
+    user_team_count = index.user_team_count  # Track how many teams each user is in
+    
+    # Users that can still join teams; kept in sync incrementally (swap-remove)
+    # instead of being rebuilt from the full user list for every team
+    available_users = [u for u in users if user_team_count[u.user_id] < MAX_TEAMS_PER_USER]
+    position = {u.user_id: i for i, u in enumerate(available_users)}
+    
+    def retire(user_id):
+        i = position.pop(user_id)
+        last = available_users.pop()
+        if last.user_id != user_id:
+            available_users[i] = last
+            position[last.user_id] = i
     
     for team in teams:
-        team_size_range = {
-            'leadership': (8, 12),
-            'engineering': (15, 35),
-            'product': (8, 15),
-            'design': (5, 12),
-            'data': (8, 15),
-            'marketing': (10, 25),
-            'sales': (15, 40),
-            'operations': (10, 20)
-        }
-        
-        min_size, max_size = team_size_range.get(team.team_type, (10, 20))
+        min_size, max_size = TEAM_SIZE_RANGE.get(team.team_type, (10, 20))
         team_size = random.randint(min_size, max_size)
         
         # Select users for this team
         # Prefer users not yet assigned or assigned to few teams
-        available_users = [u for u in users if user_team_count.get(u.user_id, 0) < 3]
-        
-        if len(available_users) < team_size:
-            available_users = users
+        candidates = available_users if len(available_users) >= team_size else users
         
-        selected_users = random.sample(available_users, min(team_size, len(available_users)))
+        selected_users = random.sample(candidates, min(team_size, len(candidates)))
         
         for user in selected_users:
-            membership_id = generate_uuid()
+            membership_id = new_id()
             
             # Chance of being a team lead (higher for senior roles)
             is_lead = False
@@ -214,15 +233,18 @@ def generate_team_memberships(
             days_ago = random.randint(0, max(1, days_since_team_creation - 5))
             joined_at = base_datetime - timedelta(days=days_ago)
             
-            memberships.append(TeamMembership(
+            membership = TeamMembership(
                 membership_id=membership_id,
                 team_id=team.team_id,
                 user_id=user.user_id,
                 joined_at=joined_at,
                 is_lead=is_lead,
                 role_in_team=role_in_team
-            ))
+            )
+            memberships.append(membership)
+            index.add_memberships([membership])
             
-            user_team_count[user.user_id] = user_team_count.get(user.user_id, 0) + 1
+            if user_team_count[user.user_id] == MAX_TEAMS_PER_USER and user.user_id in position:
+                retire(user.user_id)
     
     return memberships
@@ -0,0 +1,124 @@
+# Text bodies of task descriptions, subtask descriptions and comments
+#
+# These come from a small, fixed set of templates, so every body that can
+# occur is numbered once here (TEXT_BODIES, ids from 1) and the generators
+# emit those ids instead of rendered strings. Writers render them back into
+# the TEXT columns (--text-storage inline) or store the ids and keep each
+# body once in a text_bodies table (normalized). Detailed task descriptions
+# quote the task's name; their bodies hold TASK_NAME_MARKER, which
+# rendering replaces with the name of the task.
+from typing import Iterable, Optional, Union
+
+from utils.helpers import TemplatePool
+
+TASK_NAME_MARKER = '{task_name}'
+
+# Brief 1-3 sentence task descriptions
+BRIEF_TASK_DESCRIPTIONS = [
+    "Work on implementing this feature in upcoming sprint.",
+    "Investigate and resolve reported issue.",
+    "Review and merge proposed changes.",
+    "Complete as part of planned milestone.",
+    "User-requested improvement for workflow optimization."
+]
+
+# Detailed task descriptions with bullet points (LLM-like content)
+DETAILED_TASK_DESCRIPTION_PATTERNS = [
+    """
+{task_name} - Detailed Implementation
+
+Current State:
+- Limited functionality in current implementation
+- Performance concerns reported
+
+Goals:
+- Implement full {scope}
+- Improve performance metrics
+- Ensure comprehensive test coverage
+
+Acceptance Criteria:
+- All tests passing
+- Code review approval
+- Performance benchmarks met
+- Documentation updated
+
+Timeline: {weeks} weeks
+Priority: {priority}
+        """,
+    """
+Background: {task_name}
+
+Description:
+{task_name} is critical for our {quarter} roadmap.
+
+Requirements:
+- Backward compatibility required
+- Cross-team coordination needed
+- Stakeholder approval pending
+
+Next Steps:
+1. Design review meeting
+2. Implementation sprint
+3. QA testing
+4. Production deployment
+
+Stakeholders: {team} team
+        """
+]
+
+DETAILED_TASK_DESCRIPTION_POOL = TemplatePool(DETAILED_TASK_DESCRIPTION_PATTERNS, {
+    # Left in place for rendering to fill in
+    'task_name': [TASK_NAME_MARKER],
+    'scope': ['feature set', 'workflow', 'integration'],
+    'weeks': [1, 2, 3, 4],
+    'priority': ['High', 'Medium'],
+    'quarter': ['Q1', 'Q2', 'Q3', 'Q4'],
+    'team': ['Product', 'Engineering', 'Marketing'],
+})
+
+SUBTASK_DESCRIPTIONS = ["Subtask details"]
+
+COMMENT_TEMPLATES = [
+    "Looking good! Please make sure to test thoroughly.",
+    "I've reviewed the changes - a few minor suggestions in the PR.",
+    "Great progress on this. Let me know if you need any help.",
+    "This is blocking the release. Can we prioritize?",
+    "Thanks for the update. Ready to move forward.",
+    "I found an issue in the implementation. Let's sync up.",
+    "Approved for merge. Thanks for the thorough testing.",
+    "Do we have a timeline for this?",
+    "I'll take a look and provide feedback.",
+    "This needs more documentation before we proceed."
+]
+
+_bodies = []
+
+
+def _number(bodies: Iterable[str]) -> range:
+    """Append bodies to the catalog; returns their text ids"""
+    start = len(_bodies) + 1
+    _bodies.extend(bodies)
+    return range(start, len(_bodies) + 1)
+
+
+BRIEF_DESCRIPTION_IDS = _number(BRIEF_TASK_DESCRIPTIONS)
+# Id of pool code c is DETAILED_DESCRIPTION_IDS[c]
+DETAILED_DESCRIPTION_IDS = _number(
+    DETAILED_TASK_DESCRIPTION_POOL.render(code) for code in range(len(DETAILED_TASK_DESCRIPTION_POOL))
+)
+SUBTASK_DESCRIPTION_IDS = _number(SUBTASK_DESCRIPTIONS)
+COMMENT_IDS = _number(COMMENT_TEMPLATES)
+
+# Every body by id; TEXT_BODIES[0] is unused so ids index directly
+TEXT_BODIES = tuple([None] + _bodies)
+
+
+def render_text(text_id: Optional[Union[int, str]], task_name: Optional[str] = None) -> Optional[str]:
+    """
+    The text a column holding text_id reads as. None stays None, and text
+    already rendered (rows read back from an inline database) passes through.
+    """
+    if text_id is None or isinstance(text_id, str):
+        return text_id
+    body = TEXT_BODIES[text_id]
+    return body.replace(TASK_NAME_MARKER, task_name) if task_name is not None else body
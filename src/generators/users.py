@@ -3,7 +3,7 @@ import random
 from datetime import datetime, timedelta
 from typing import List, Tuple
 from models import User
-from utils.helpers import generate_uuid, generate_email
+from utils.helpers import new_id, generate_email, AliasSampler
 
 # Realistic first names reflecting diverse workforce (top names from census data)
 FIRST_NAMES_MALE = [
@@ -90,6 +90,23 @@ ROLE_WEIGHTS = {
     'executive': 1
 }
 
+# Role weights (in ROLE_WEIGHTS order) by seniority: more senior people are
+# more likely to be in leadership; junior and intern use the default
+ROLE_WEIGHTS_BY_SENIORITY = {
+    'principal': [20, 40, 30, 10, 0],  # mostly lead/manager/director
+    'staff': [40, 30, 25, 5, 0],
+    'senior': [60, 20, 15, 5, 0],
+    'mid': [80, 10, 8, 2, 0],
+}
+DEFAULT_ROLE_WEIGHTS = [95, 3, 2, 0, 0]
+
+SENIORITY_SAMPLER = AliasSampler(list(SENIORITY_WEIGHTS), list(SENIORITY_WEIGHTS.values()))
+ROLE_SAMPLERS = {
+    seniority: AliasSampler(list(ROLE_WEIGHTS), weights)
+    for seniority, weights in ROLE_WEIGHTS_BY_SENIORITY.items()
+}
+DEFAULT_ROLE_SAMPLER = AliasSampler(list(ROLE_WEIGHTS), DEFAULT_ROLE_WEIGHTS)
+
 def choose_title(role: str, seniority: str) -> str:
     """Choose a realistic job title based on role and seniority"""
     if role == 'executive':
@@ -105,31 +122,11 @@ def choose_title(role: str, seniority: str) -> str:
 
 def choose_seniority() -> str:
     """Choose seniority level with realistic distribution"""
-    return random.choices(
-        list(SENIORITY_WEIGHTS.keys()),
-        weights=list(SENIORITY_WEIGHTS.values()),
-        k=1
-    )[0]
+    return SENIORITY_SAMPLER.draw()
 
 def choose_role(seniority: str) -> str:
     """Choose role based on seniority level"""
-    # More senior people more likely to be in leadership
-    if seniority == 'principal':
-        weights = [20, 40, 30, 10, 0]  # mostly lead/manager/director
-    elif seniority == 'staff':
-        weights = [40, 30, 25, 5, 0]
-    elif seniority == 'senior':
-        weights = [60, 20, 15, 5, 0]
-    elif seniority == 'mid':
-        weights = [80, 10, 8, 2, 0]
-    else:  # junior, intern
-        weights = [95, 3, 2, 0, 0]
-    
-    return random.choices(
-        list(ROLE_WEIGHTS.keys()),
-        weights=weights,
-        k=1
-    )[0]
+    return ROLE_SAMPLERS.get(seniority, DEFAULT_ROLE_SAMPLER).draw()
 
 def generate_user(
     org_id: str,
@@ -138,7 +135,7 @@ def generate_user(
     base_datetime: datetime
 ) -> User:
     """Generate a single realistic user"""
-    user_id = generate_uuid()
+    user_id = new_id()
     
     # Realistic gender distribution (~50/50)
     is_male = random.random() < 0.5
@@ -15,8 +15,13 @@ Usage:
 import sqlite3
 import argparse
 import logging
+import random
+import shutil
+import time
+from collections import Counter
 from datetime import datetime, timedelta
 from pathlib import Path
+from typing import Optional
 import sys
 import os
 
@@ -35,367 +40,1034 @@ from generators.organizations import generate_single_large_organization
 from generators.users import generate_users, ensure_role_distribution
 from generators.teams import generate_teams, generate_team_memberships
 from generators.projects import generate_projects, generate_all_sections
-from generators.tasks import generate_tasks, generate_subtasks, generate_comments
+from generators.tasks import (
+    generate_tasks, generate_project_tasks, generate_subtasks, generate_comments
+)
 from generators.tags import (
     generate_tags, generate_custom_fields, generate_custom_field_values,
     generate_task_tags, generate_task_dependencies
 )
+from generators.streaming import iter_project_chunks
+from generators.relationships import RelationshipIndex
+from storage.rows import ROW_CONVERTERS, TIMESTAMP_FORMATS, TEXT_STORAGE_MODES, columnar_rows
+from storage.shards import merge_shard
+from storage.background import BackgroundWriter, DEFAULT_QUEUE_DEPTH
+from storage.sqlite_writer import (
+    BulkWriter, TeeWriter, DEFAULT_BATCH_SIZE, apply_bulk_load_pragmas, restore_pragmas,
+    execute_sql_file, create_iso_views, create_text_views
+)
+from storage.parquet_writer import (
+    ParquetWriter, OUTPUT_FORMATS, DEFAULT_ROW_GROUP_SIZE, parquet_dir_for
+)
+from storage.workspace import load_workspace
+from storage.in_memory import fits_in_memory, persist_database, estimate_database_bytes
+from storage.jsonl_export import JsonlShardWriter, DEFAULT_SHARD_ROWS, DEFAULT_COMPRESS_WORKERS
+from storage.checkpoints import (
+    CheckpointLog, CheckpointError, checkpoint_path_for, read_checkpoint, restore_rng_state,
+    check_row_counts, discard_unfinished, load_finished_entities, STAGE_TABLES
+)
+from sharding import (
+    ShardSpec, SHARD_TABLES, partition_projects, shard_seeds, generate_shards,
+    make_shard_dir
+)
+from multi_org import (
+    OrgSpec, ORG_OUTPUTS, ORG_SIZE_DISTRIBUTIONS, ORG_TABLES, DEFAULT_ORG_SIZE_SPREAD,
+    plan_organizations, org_id_sequences, generate_orgs, org_dir_for, org_file_name,
+    write_org_manifest
+)
+from cache import DatasetCache, DEFAULT_CACHE_DIR, cache_key
+from profiling import StageRecorder, STAGES, profile_report_path, pstats_dir_for
+from utils.helpers import seed_everything, set_id_scheme, id_allocator, ID_SCHEMES
+
+SCHEMA_PATH = Path("schema.sql")
+INDEX_SCHEMA_PATH = Path("schema_indexes.sql")
 
 class AsanaDataGenerator:
     """Main data generator orchestrator"""
     
-    def __init__(self, db_path: str = "output/asana_simulation.sqlite"):
+    def __init__(self, db_path: str = "output/asana_simulation.sqlite",
+                 batch_size: int = DEFAULT_BATCH_SIZE, bulk_load: bool = False,
+                 writer_thread: bool = False, queue_depth: int = DEFAULT_QUEUE_DEPTH,
+                 seed: Optional[int] = None, as_of: Optional[datetime] = None,
+                 vectorized_tasks: bool = False, profile: bool = False,
+                 profile_pstats: bool = False, id_scheme: str = 'uuid',
+                 timestamps: str = 'iso', text_storage: str = 'inline', output_format: str = 'sqlite',
+                 parquet_dir: Optional[str] = None, row_group_size: int = DEFAULT_ROW_GROUP_SIZE,
+                 jsonl_dir: Optional[str] = None, jsonl_shard_rows: int = DEFAULT_SHARD_ROWS,
+                 jsonl_workers: int = DEFAULT_COMPRESS_WORKERS, in_memory_build: bool = False,
+                 compact: bool = False, checkpoint_stages: bool = False):
         self.db_path = db_path
+        self.batch_size = batch_size
+        self.bulk_load = bulk_load
+        self.writer_thread = writer_thread
+        self.queue_depth = queue_depth
         self.connection = None
-        self.base_datetime = datetime.now()
+        self.writer = None
+        self._saved_pragmas = None
+        self.seed = seed
+        self.vectorized_tasks = vectorized_tasks
+        self.id_scheme = id_scheme
+        self.timestamps = timestamps
+        # 'inline' TEXT or 'normalized' ids into text_bodies (see storage/rows.py)
+        self.text_storage = text_storage
+        # 'sqlite', 'parquet' (no database file) or 'both'
+        self.output_format = output_format
+        self.parquet_dir = parquet_dir or parquet_dir_for(db_path)
+        self.row_group_size = row_group_size
+        # Optional extra sink: sharded .jsonl.gz export written alongside
+        self.jsonl_dir = jsonl_dir
+        self.jsonl_shard_rows = jsonl_shard_rows
+        self.jsonl_workers = jsonl_workers
+        # Build in :memory: and persist to db_path at the end (see storage/in_memory.py);
+        # setup_database() may fall back to disk
+        self.in_memory_build = in_memory_build
+        self.compact = compact
+        # Set by open_existing_database() for --append
+        self.workspace = None
+        # Stage checkpoints of generate_all (see storage/checkpoints.py), opt-in
+        # because they commit per stage; resume_database() sets the checkpoint
+        # being resumed (and keeps checkpointing) and the
+        # entities its finished stages produced
+        self.checkpoint_stages = checkpoint_stages
+        self.checkpoints = None
+        self.resume_from = None
+        self.resumed = {}
+        self._stage_started = 0.0
+        # as_of pins "now" so seeded runs do not drift with the wall clock
+        self.base_datetime = as_of or datetime.now()
+        # Per-stage wall/CPU time, rows and peak RSS (see profiling.py);
+        # profile adds tracemalloc peaks and optionally cProfile dumps
+        self.profile = profile
+        self.recorder = StageRecorder(
+            profile=profile,
+            pstats_dir=pstats_dir_for(db_path) if profile and profile_pstats else None
+        )
+        
+    def setup_database(self, expected_bytes: Optional[int] = None):
+        """
+        Create and initialize SQLite database.
         
-    def setup_database(self):
-        """Create and initialize SQLite database"""
-        logger.info(f"Setting up database at {self.db_path}")
+        With in_memory_build the database is created in :memory: and
+        written to db_path by finalize_database(). If expected_bytes (see
+        estimate_database_bytes) would not fit in available RAM the build
+        falls back to disk.
+        
+        In bulk-load mode only the tables are created here; indexes are
+        built by finalize_database() once the last insert_* call is done.
+        With output_format 'parquet' no database is created at all and the
+        insert_* calls feed a ParquetWriter; 'both' writes to each. A
+        jsonl_dir adds a JsonlShardWriter next to whichever of those is used.
+        """
+        sinks = []
+        if self.output_format != 'sqlite':
+            sinks.append(ParquetWriter(
+                self.parquet_dir, row_group_size=self.row_group_size, id_scheme=self.id_scheme
+            ))
+        if self.jsonl_dir:
+            sinks.append(JsonlShardWriter(
+                self.jsonl_dir, shard_rows=self.jsonl_shard_rows, workers=self.jsonl_workers
+            ))
+        if self.output_format == 'parquet':
+            logger.info(f"Writing Parquet datasets to {self.parquet_dir} (no SQLite database)")
+            self.writer = sinks[0] if len(sinks) == 1 else TeeWriter(sinks, batch_size=self.batch_size)
+            return
+        
+        if self.in_memory_build and not fits_in_memory(expected_bytes):
+            logger.warning(
+                f"Estimated database size {expected_bytes / 2**20:.0f} MiB exceeds the in-memory "
+                "budget; building on disk instead"
+            )
+            self.in_memory_build = False
+        
+        logger.info(f"Setting up database at {self.db_path}"
+                    + (" (built in memory)" if self.in_memory_build else ""))
         
         # Create output directory if needed
         Path(self.db_path).parent.mkdir(parents=True, exist_ok=True)
         
-        # Read and execute schema
-        schema_path = Path("schema.sql")
-        if not schema_path.exists():
-            raise FileNotFoundError("schema.sql not found")
+        for path in (SCHEMA_PATH, INDEX_SCHEMA_PATH):
+            if not path.exists():
+                raise FileNotFoundError(f"{path} not found")
         
-        self.connection = sqlite3.connect(self.db_path)
-        cursor = self.connection.cursor()
+        # Autocommit mode: the bulk writer manages the load transaction explicitly.
+        # With a writer thread the connection is handed over to that thread
+        # for the duration of the load.
+        self.connection = sqlite3.connect(
+            ':memory:' if self.in_memory_build else self.db_path,
+            isolation_level=None, check_same_thread=not self.writer_thread
+        )
         
-        with open(schema_path, 'r') as f:
-            schema = f.read()
+        if self.bulk_load:
+            self._saved_pragmas = apply_bulk_load_pragmas(self.connection)
+            logger.info("Bulk-load mode: load-time PRAGMAs applied, index creation deferred")
         
-        cursor.executescript(schema)
-        self.connection.commit()
+        execute_sql_file(self.connection, SCHEMA_PATH, self.id_scheme, self.timestamps, self.text_storage)
+        if not self.bulk_load:
+            execute_sql_file(self.connection, INDEX_SCHEMA_PATH)
+        if self.text_storage == 'normalized':
+            # Text ids are compact but opaque; <table>_text views show the text
+            create_text_views(self.connection)
+        if self.timestamps == 'epoch':
+            # Epoch integers are compact but unreadable; <table>_iso views show ISO strings
+            create_iso_views(self.connection, self.text_storage)
+        self.writer = self._sqlite_writer()
+        if sinks:
+            self.writer = TeeWriter([self.writer] + sinks, batch_size=self.batch_size)
         logger.info("Database schema created successfully")
     
+    def open_existing_database(self, org_id: Optional[str] = None):
+        """
+        Open db_path for --append. The ID scheme, timestamp format and text
+        storage are taken from the file, and the rows appended entities reference are
+        loaded into self.workspace. A database with several organizations
+        needs org_id; only that organization's rows are loaded.
+        """
+        if not Path(self.db_path).exists():
+            raise FileNotFoundError(f"{self.db_path} not found (--append grows an existing database)")
+        logger.info(f"Opening existing database at {self.db_path}")
+        self.connection = sqlite3.connect(self.db_path, isolation_level=None)
+        self.workspace = load_workspace(self.connection, org_id)
+        self.id_scheme = self.workspace.id_scheme
+        self.timestamps = self.workspace.timestamps
+        self.text_storage = self.workspace.text_storage
+        self.writer = BulkWriter(
+            self.connection, batch_size=self.batch_size, timestamps=self.timestamps,
+            text_storage=self.text_storage
+        )
+        logger.info(
+            f"Loaded organization {self.workspace.org_id}: "
+            f"{len(self.workspace.users)} users, {len(self.workspace.teams)} teams, "
+            f"{len(self.workspace.projects)} projects ({self.id_scheme} ids, {self.timestamps} timestamps, "
+            f"{self.text_storage} text)"
+        )
+    
+    def resume_database(self):
+        """
+        Reopen db_path to continue an interrupted generate_all run from its
+        checkpoint. The settings that shape the output (sizes, seed, as-of,
+        ID scheme, timestamps, text storage, vectorized tasks, bulk load) come from the
+        checkpoint; returns the size options to pass to generate_all.
+        
+        Rows of unfinished stages are deleted, and the entities the
+        remaining stages read are loaded into self.resumed.
+        """
+        path = checkpoint_path_for(self.db_path)
+        if not Path(self.db_path).exists() or not path.exists():
+            raise FileNotFoundError(f"{path} not found: no interrupted run of {self.db_path} to resume")
+        checkpoint = read_checkpoint(path)
+        params = checkpoint.params
+        self.seed = params['seed']
+        self.base_datetime = datetime.fromisoformat(params['as_of'])
+        self.id_scheme = params['id_scheme']
+        self.timestamps = params['timestamps']
+        self.text_storage = params.get('text_storage', 'inline')
+        self.vectorized_tasks = params['vectorized_tasks']
+        self.bulk_load = params['bulk_load']
+        
+        logger.info(f"Resuming {self.db_path} after {len(checkpoint.records)}/{len(STAGES)} stages "
+                    f"({sum(r.seconds for r in checkpoint.records):.1f}s of generation already done)")
+        self.connection = sqlite3.connect(
+            self.db_path, isolation_level=None, check_same_thread=not self.writer_thread
+        )
+        problems = check_row_counts(self.connection, checkpoint)
+        if problems:
+            raise CheckpointError(f"{self.db_path} does not match {path}: {'; '.join(problems)}")
+        deleted = discard_unfinished(self.connection, checkpoint)
+        if deleted:
+            logger.warning("Discarded rows of unfinished stages: "
+                           + ", ".join(f"{table} {count}" for table, count in deleted.items()))
+        if self.bulk_load:
+            self._saved_pragmas = apply_bulk_load_pragmas(self.connection)
+        
+        self.resumed = load_finished_entities(self.connection, checkpoint, self.timestamps)
+        logger.info("Reloaded " + ", ".join(f"{len(rows)} {name}" for name, rows in self.resumed.items()))
+        self.resume_from = checkpoint
+        self.checkpoints = CheckpointLog.resume(path, checkpoint)
+        self.writer = self._sqlite_writer()
+        return {name: params[name] for name in ('num_users', 'projects_per_team', 'tasks_per_section')}
+    
+    def _sqlite_writer(self):
+        if self.writer_thread:
+            return BackgroundWriter(
+                self.connection, batch_size=self.batch_size, queue_depth=self.queue_depth,
+                timestamps=self.timestamps, text_storage=self.text_storage
+            )
+        return BulkWriter(
+            self.connection, batch_size=self.batch_size, timestamps=self.timestamps,
+            text_storage=self.text_storage
+        )
+    
+    def finalize_database(self):
+        """
+        Build deferred indexes and restore durable settings after a bulk
+        load, then write an in-memory build out to db_path
+        """
+        if self.bulk_load:
+            elapsed = execute_sql_file(self.connection, INDEX_SCHEMA_PATH)
+            logger.info(f"Created indexes in {elapsed:.3f}s")
+            if self._saved_pragmas is not None:
+                restore_pragmas(self.connection, self._saved_pragmas)
+                self._saved_pragmas = None
+                logger.info("Restored durable PRAGMA settings")
+        if self.in_memory_build and self.connection is not None:
+            elapsed = persist_database(self.connection, self.db_path, compact=self.compact)
+            method = "VACUUM INTO" if self.compact else "backup API"
+            logger.info(f"Persisted in-memory database to {self.db_path} via {method} in {elapsed:.3f}s")
+    
+    def _generate(self, target, stage=None):
+        """Time one generation step; the stage name carries over to its inserts"""
+        self.recorder.current_stage = stage or target
+        return self.recorder.measure('generate', target)
+    
+    def _write(self, table, entities, label=None):
+        """Convert entities to row tuples and hand them to the bulk writer"""
+        return self._write_rows(table, map(ROW_CONVERTERS[table], entities), label)
+    
+    def _write_rows(self, table, rows, label=None, **options):
+        """Hand already-converted row tuples to the bulk writer"""
+        with self.recorder.measure('insert', table) as step:
+            count = step.rows = self.writer.insert(table, rows, **options)
+        logger.info(f"Inserted {count} {label or table.replace('_', ' ')}")
+        return count
+
     def insert_organizations(self, orgs):
         """Insert organizations into database"""
-        cursor = self.connection.cursor()
-        for org in orgs:
-            cursor.execute("""
-                INSERT INTO organizations 
-                (org_id, name, domain, is_verified, created_at, employee_count, industry)
-                VALUES (?, ?, ?, ?, ?, ?, ?)
-            """, (
-                org.org_id, org.name, org.domain, org.is_verified,
-                org.created_at.isoformat(), org.employee_count, org.industry
-            ))
-        self.connection.commit()
-        logger.info(f"Inserted {len(orgs)} organization(s)")
+        self._write('organizations', orgs, 'organization(s)')
     
     def insert_users(self, users):
         """Insert users into database"""
-        cursor = self.connection.cursor()
-        for user in users:
-            cursor.execute("""
-                INSERT INTO users
-                (user_id, org_id, email, full_name, first_name, last_name,
-                 profile_picture_url, role, seniority_level, created_at, is_active, department)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                user.user_id, user.org_id, user.email, user.full_name,
-                user.first_name, user.last_name, user.profile_picture_url,
-                user.role, user.seniority_level, user.created_at.isoformat(),
-                user.is_active, user.department
-            ))
-        self.connection.commit()
-        logger.info(f"Inserted {len(users)} users")
+        self._write('users', users)
     
     def insert_teams(self, teams):
         """Insert teams into database"""
-        cursor = self.connection.cursor()
-        for team in teams:
-            cursor.execute("""
-                INSERT INTO teams
-                (team_id, org_id, name, description, team_type, created_at, is_active)
-                VALUES (?, ?, ?, ?, ?, ?, ?)
-            """, (
-                team.team_id, team.org_id, team.name, team.description,
-                team.team_type, team.created_at.isoformat(), team.is_active
-            ))
-        self.connection.commit()
-        logger.info(f"Inserted {len(teams)} teams")
+        self._write('teams', teams)
     
     def insert_team_memberships(self, memberships):
         """Insert team memberships"""
-        cursor = self.connection.cursor()
-        for membership in memberships:
-            cursor.execute("""
-                INSERT INTO team_memberships
-                (membership_id, team_id, user_id, joined_at, is_lead, role_in_team)
-                VALUES (?, ?, ?, ?, ?, ?)
-            """, (
-                membership.membership_id, membership.team_id, membership.user_id,
-                membership.joined_at.isoformat(), membership.is_lead, membership.role_in_team
-            ))
-        self.connection.commit()
-        logger.info(f"Inserted {len(memberships)} team memberships")
+        self._write('team_memberships', memberships)
     
     def insert_projects(self, projects):
         """Insert projects"""
-        cursor = self.connection.cursor()
-        for project in projects:
-            cursor.execute("""
-                INSERT INTO projects
-                (project_id, org_id, team_id, name, description, project_type,
-                 status, created_at, start_date, target_end_date, owner_user_id, visibility)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                project.project_id, project.org_id, project.team_id,
-                project.name, project.description, project.project_type,
-                project.status, project.created_at.isoformat(),
-                project.start_date.isoformat() if project.start_date else None,
-                project.target_end_date.isoformat() if project.target_end_date else None,
-                project.owner_user_id, project.visibility
-            ))
-        self.connection.commit()
-        logger.info(f"Inserted {len(projects)} projects")
+        self._write('projects', projects)
     
     def insert_sections(self, sections):
         """Insert project sections"""
-        cursor = self.connection.cursor()
-        for section in sections:
-            cursor.execute("""
-                INSERT INTO sections
-                (section_id, project_id, name, description, display_order, created_at)
-                VALUES (?, ?, ?, ?, ?, ?)
-            """, (
-                section.section_id, section.project_id, section.name,
-                section.description, section.display_order, section.created_at.isoformat()
-            ))
-        self.connection.commit()
-        logger.info(f"Inserted {len(sections)} sections")
+        self._write('sections', sections)
     
     def insert_tasks(self, tasks):
         """Insert tasks"""
-        cursor = self.connection.cursor()
-        for task in tasks:
-            cursor.execute("""
-                INSERT INTO tasks
-                (task_id, project_id, section_id, name, description, assignee_id,
-                 created_by_user_id, created_at, due_date, start_date, priority,
-                 status, is_completed, completed_at, estimated_hours, actual_hours)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                task.task_id, task.project_id, task.section_id, task.name,
-                task.description, task.assignee_id, task.created_by_user_id,
-                task.created_at.isoformat(), task.due_date.isoformat() if task.due_date else None,
-                task.start_date.isoformat() if task.start_date else None,
-                task.priority, task.status, task.is_completed,
-                task.completed_at.isoformat() if task.completed_at else None,
-                task.estimated_hours, task.actual_hours
-            ))
-        self.connection.commit()
-        logger.info(f"Inserted {len(tasks)} tasks")
+        self._write('tasks', tasks)
+    
+    def insert_task_table(self, task_table):
+        """
+        Insert tasks from a columnar TaskTable, converting each column in one
+        pass. SQLite writers get the timestamp and date columns encoded
+        straight from their datetime64 arrays; Parquet and JSONL outputs
+        encode rows themselves, so they get them decoded.
+        """
+        if isinstance(self.writer, (BulkWriter, BackgroundWriter)):
+            rows = columnar_rows('tasks', task_table, self.timestamps)
+            self._write_rows('tasks', rows, 'tasks', encoded=True)
+        else:
+            self._write_rows('tasks', columnar_rows('tasks', task_table), 'tasks')
     
     def insert_subtasks(self, subtasks):
         """Insert subtasks"""
-        cursor = self.connection.cursor()
-        for subtask in subtasks:
-            cursor.execute("""
-                INSERT INTO subtasks
-                (subtask_id, task_id, name, description, assignee_id, created_at,
-                 due_date, is_completed, completed_at)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                subtask.subtask_id, subtask.task_id, subtask.name,
-                subtask.description, subtask.assignee_id, subtask.created_at.isoformat(),
-                subtask.due_date.isoformat() if subtask.due_date else None,
-                subtask.is_completed, subtask.completed_at.isoformat() if subtask.completed_at else None
-            ))
-        self.connection.commit()
-        logger.info(f"Inserted {len(subtasks)} subtasks")
+        self._write('subtasks', subtasks)
     
     def insert_comments(self, comments):
         """Insert comments"""
-        cursor = self.connection.cursor()
-        for comment in comments:
-            cursor.execute("""
-                INSERT INTO comments
-                (comment_id, task_id, user_id, content, created_at, updated_at, is_edited)
-                VALUES (?, ?, ?, ?, ?, ?, ?)
-            """, (
-                comment.comment_id, comment.task_id, comment.user_id,
-                comment.content, comment.created_at.isoformat(),
-                comment.updated_at.isoformat() if comment.updated_at else None,
-                comment.is_edited
-            ))
-        self.connection.commit()
-        logger.info(f"Inserted {len(comments)} comments")
+        self._write('comments', comments)
     
     def insert_tags(self, tags):
         """Insert tags"""
-        cursor = self.connection.cursor()
-        for tag in tags:
-            cursor.execute("""
-                INSERT INTO tags
-                (tag_id, org_id, name, color, created_at)
-                VALUES (?, ?, ?, ?, ?)
-            """, (
-                tag.tag_id, tag.org_id, tag.name, tag.color, tag.created_at.isoformat()
-            ))
-        self.connection.commit()
-        logger.info(f"Inserted {len(tags)} tags")
+        self._write('tags', tags)
     
     def insert_custom_fields(self, fields):
         """Insert custom field definitions"""
-        cursor = self.connection.cursor()
-        for field in fields:
-            cursor.execute("""
-                INSERT INTO custom_field_definitions
-                (field_id, project_id, name, field_type, description, is_required, created_at)
-                VALUES (?, ?, ?, ?, ?, ?, ?)
-            """, (
-                field.field_id, field.project_id, field.name, field.field_type,
-                field.description, field.is_required, field.created_at.isoformat()
-            ))
-        self.connection.commit()
-        logger.info(f"Inserted {len(fields)} custom field definitions")
+        self._write('custom_field_definitions', fields, 'custom field definitions')
     
     def insert_custom_field_values(self, values):
         """Insert custom field values"""
-        cursor = self.connection.cursor()
-        for value in values:
-            cursor.execute("""
-                INSERT INTO custom_field_values
-                (value_id, task_id, field_id, value, created_at, updated_at)
-                VALUES (?, ?, ?, ?, ?, ?)
-            """, (
-                value.value_id, value.task_id, value.field_id, value.value,
-                value.created_at.isoformat(), value.updated_at.isoformat() if value.updated_at else None
-            ))
-        self.connection.commit()
-        logger.info(f"Inserted {len(values)} custom field values")
+        self._write('custom_field_values', values)
     
     def insert_task_tags(self, task_tags):
         """Insert task-tag associations"""
-        cursor = self.connection.cursor()
-        for task_tag in task_tags:
-            cursor.execute("""
-                INSERT INTO task_tags
-                (task_tag_id, task_id, tag_id, added_at)
-                VALUES (?, ?, ?, ?)
-            """, (
-                task_tag.task_tag_id, task_tag.task_id, task_tag.tag_id,
-                task_tag.added_at.isoformat()
-            ))
-        self.connection.commit()
-        logger.info(f"Inserted {len(task_tags)} task-tag associations")
+        self._write('task_tags', task_tags, 'task-tag associations')
     
     def insert_task_dependencies(self, dependencies):
         """Insert task dependencies"""
-        cursor = self.connection.cursor()
-        for dep in dependencies:
-            cursor.execute("""
-                INSERT INTO task_dependencies
-                (dependency_id, task_id, depends_on_task_id, dependency_type, created_at)
-                VALUES (?, ?, ?, ?, ?)
-            """, (
-                dep.dependency_id, dep.task_id, dep.depends_on_task_id,
-                dep.dependency_type, dep.created_at.isoformat()
-            ))
-        self.connection.commit()
-        logger.info(f"Inserted {len(dependencies)} task dependencies")
+        self._write('task_dependencies', dependencies)
     
     def generate_all(self, num_users: int = 500, projects_per_team: int = 3,
                     tasks_per_section: int = 15):
-        """Generate entire dataset"""
+        """
+        Generate entire dataset.
+        
+        With on-disk SQLite output each of the 11 stages commits on its own
+        and records a checkpoint (see storage/checkpoints.py). After
+        resume_database() the stages the interrupted run finished are
+        skipped, their entities come from self.resumed, and the RNGs
+        continue from the last checkpoint.
+        """
         try:
             logger.info("=" * 60)
             logger.info("Starting Asana Seed Data Generation")
             logger.info("=" * 60)
             
+            # Without checkpoints the whole load runs inside one explicit transaction
+            self.writer.begin()
+            if self.resume_from is not None:
+                restore_rng_state(self.resume_from.rng_state)
+                counts = self.resume_from.row_counts
+            else:
+                self._seed_rngs()
+                if (self.checkpoint_stages and self.output_format == 'sqlite' and not self.jsonl_dir
+                        and not self.in_memory_build):
+                    self.checkpoints = CheckpointLog(checkpoint_path_for(self.db_path), dict(
+                        num_users=num_users,
+                        projects_per_team=projects_per_team,
+                        tasks_per_section=tasks_per_section,
+                        seed=self.seed,
+                        as_of=self.base_datetime.isoformat(),
+                        id_scheme=self.id_scheme,
+                        timestamps=self.timestamps,
+                        text_storage=self.text_storage,
+                        vectorized_tasks=self.vectorized_tasks,
+                        bulk_load=self.bulk_load,
+                    ))
+                counts = {}
+            loaded = self.resumed
+            
             # 1. Organizations
-            logger.info("\n[1/11] Generating organizations...")
-            orgs = [generate_single_large_organization(base_datetime=self.base_datetime)]
-            self.insert_organizations(orgs)
-            org = orgs[0]
+            if self._resumed('organizations'):
+                orgs = loaded.get('organizations')
+            else:
+                logger.info("\n[1/11] Generating organizations...")
+                with self._generate('organizations') as step:
+                    orgs = [generate_single_large_organization(base_datetime=self.base_datetime)]
+                    counts['organizations'] = step.rows = len(orgs)
+                self.insert_organizations(orgs)
+                self._checkpoint('organizations', counts, orgs)
+            org = orgs[0] if orgs else None
             
             # 2. Users
-            logger.info("\n[2/11] Generating users...")
-            users = generate_users(org.org_id, org.domain, num_users, self.base_datetime)
-            users = ensure_role_distribution(users)
-            self.insert_users(users)
+            if self._resumed('users'):
+                users = loaded['users']
+            else:
+                logger.info("\n[2/11] Generating users...")
+                with self._generate('users') as step:
+                    users = generate_users(org.org_id, org.domain, num_users, self.base_datetime)
+                    users = ensure_role_distribution(users)
+                    counts['users'] = step.rows = len(users)
+                self.insert_users(users)
+                self._checkpoint('users', counts, users)
+            
+            # Relationship lookups shared by the later stages, filled as they run
+            index = RelationshipIndex.build(users=users)
             
             # 3. Teams
-            logger.info("\n[3/11] Generating teams...")
-            teams = generate_teams(org.org_id, self.base_datetime)
-            self.insert_teams(teams)
+            if self._resumed('teams'):
+                teams = loaded.get('teams')
+            else:
+                logger.info("\n[3/11] Generating teams...")
+                with self._generate('teams') as step:
+                    teams = generate_teams(org.org_id, self.base_datetime)
+                    counts['teams'] = step.rows = len(teams)
+                self.insert_teams(teams)
+                self._checkpoint('teams', counts, teams)
             
             # 4. Team Memberships
-            logger.info("\n[4/11] Generating team memberships...")
-            memberships = generate_team_memberships(teams, users, self.base_datetime)
-            self.insert_team_memberships(memberships)
+            if not self._resumed('team_memberships'):
+                logger.info("\n[4/11] Generating team memberships...")
+                with self._generate('team_memberships') as step:
+                    memberships = generate_team_memberships(teams, users, self.base_datetime, index=index)
+                    counts['team_memberships'] = step.rows = len(memberships)
+                self.insert_team_memberships(memberships)
+                self._checkpoint('team_memberships', counts)
             
             # 5. Projects
-            logger.info("\n[5/11] Generating projects...")
-            projects = generate_projects(org.org_id, teams, users, self.base_datetime, projects_per_team)
-            self.insert_projects(projects)
+            if self._resumed('projects'):
+                projects = loaded.get('projects')
+            else:
+                logger.info("\n[5/11] Generating projects...")
+                with self._generate('projects') as step:
+                    projects = generate_projects(org.org_id, teams, users, self.base_datetime, projects_per_team)
+                    counts['projects'] = step.rows = len(projects)
+                self.insert_projects(projects)
+                self._checkpoint('projects', counts, projects)
             
             # 6. Sections
-            logger.info("\n[6/11] Generating sections...")
-            sections = generate_all_sections(projects, self.base_datetime)
-            self.insert_sections(sections)
+            if self._resumed('sections'):
+                sections = loaded.get('sections', [])
+            else:
+                logger.info("\n[6/11] Generating sections...")
+                with self._generate('sections') as step:
+                    sections = generate_all_sections(projects, self.base_datetime)
+                    counts['sections'] = step.rows = len(sections)
+                self.insert_sections(sections)
+                self._checkpoint('sections', counts, sections)
+            index.add_sections(sections)
             
             # 7. Tasks
-            logger.info("\n[7/11] Generating tasks...")
-            tasks = generate_tasks(projects, sections, users, self.base_datetime, tasks_per_section)
-            self.insert_tasks(tasks)
+            if self._resumed('tasks'):
+                tasks = loaded.get('tasks', [])
+            else:
+                logger.info("\n[7/11] Generating tasks...")
+                with self._generate('tasks') as step:
+                    tasks = generate_tasks(
+                        projects, sections, users, self.base_datetime, tasks_per_section,
+                        vectorized=self.vectorized_tasks, index=index, as_table=self.vectorized_tasks
+                    )
+                    counts['tasks'] = step.rows = len(tasks)
+                if self.vectorized_tasks:
+                    # Columnar TaskTable: written column-wise; the stages below
+                    # read its columns, so no Task rows are built
+                    self.insert_task_table(tasks)
+                else:
+                    self.insert_tasks(tasks)
+                self._checkpoint('tasks', counts, tasks)
+            index.add_tasks(tasks)
             
             # 8. Subtasks
-            logger.info("\n[8/11] Generating subtasks...")
-            subtasks = generate_subtasks(tasks, users, self.base_datetime)
-            self.insert_subtasks(subtasks)
+            if not self._resumed('subtasks'):
+                logger.info("\n[8/11] Generating subtasks...")
+                with self._generate('subtasks') as step:
+                    subtasks = generate_subtasks(tasks, users, self.base_datetime, user_ids=index.user_ids)
+                    counts['subtasks'] = step.rows = len(subtasks)
+                self.insert_subtasks(subtasks)
+                self._checkpoint('subtasks', counts)
             
             # 9. Comments
-            logger.info("\n[9/11] Generating comments...")
-            comments = generate_comments(tasks, users, self.base_datetime)
-            self.insert_comments(comments)
+            if not self._resumed('comments'):
+                logger.info("\n[9/11] Generating comments...")
+                with self._generate('comments') as step:
+                    comments = generate_comments(tasks, users, self.base_datetime, user_ids=index.user_ids)
+                    counts['comments'] = step.rows = len(comments)
+                self.insert_comments(comments)
+                self._checkpoint('comments', counts)
             
             # 10. Tags and Custom Fields
-            logger.info("\n[10/11] Generating tags and custom fields...")
+            if not self._resumed('tags_and_custom_fields'):
+                logger.info("\n[10/11] Generating tags and custom fields...")
+                with self._generate('tags', stage='tags_and_custom_fields') as step:
+                    tags = generate_tags(org.org_id, self.base_datetime)
+                    counts['tags'] = step.rows = len(tags)
+                self.insert_tags(tags)
+                
+                with self._generate('custom_field_definitions', stage='tags_and_custom_fields') as step:
+                    custom_fields = generate_custom_fields(projects, self.base_datetime)
+                    counts['custom_field_definitions'] = step.rows = len(custom_fields)
+                self.insert_custom_fields(custom_fields)
+                index.add_custom_fields(custom_fields)
+                
+                with self._generate('custom_field_values', stage='tags_and_custom_fields') as step:
+                    custom_field_values = generate_custom_field_values(
+                        tasks, custom_fields, self.base_datetime, index=index
+                    )
+                    counts['custom_field_values'] = step.rows = len(custom_field_values)
+                self.insert_custom_field_values(custom_field_values)
+                
+                with self._generate('task_tags', stage='tags_and_custom_fields') as step:
+                    task_tags = generate_task_tags(tasks, tags, self.base_datetime)
+                    counts['task_tags'] = step.rows = len(task_tags)
+                self.insert_task_tags(task_tags)
+                self._checkpoint('tags_and_custom_fields', counts)
+            
+            # 11. Task Dependencies
+            if not self._resumed('task_dependencies'):
+                logger.info("\n[11/11] Generating task dependencies...")
+                with self._generate('task_dependencies') as step:
+                    dependencies = generate_task_dependencies(tasks, self.base_datetime, index=index)
+                    counts['task_dependencies'] = step.rows = len(dependencies)
+                self.insert_task_dependencies(dependencies)
+                self._checkpoint('task_dependencies', counts)
+            
+            self.writer.commit()
+            self.finalize_database()
+            if self.checkpoints is not None:
+                self.checkpoints.remove()
+            
+            self._log_summary({
+                'organizations': counts['organizations'],
+                'users': counts['users'],
+                'teams': counts['teams'],
+                'projects': counts['projects'],
+                'tasks': counts['tasks'],
+                'subtasks': counts['subtasks'],
+                'comments': counts['comments'],
+                'tags': counts['tags'],
+                'custom fields': counts['custom_field_definitions'],
+            })
+            
+        except Exception as e:
+            logger.error(f"Error during generation: {e}", exc_info=True)
+            if self.writer:
+                self.writer.rollback()
+            if self.checkpoints is not None and self.checkpoints.checkpoint.records:
+                logger.error(f"Finished stages are checkpointed in {self.checkpoints.path}; "
+                             "rerun with --resume to continue from the next one")
+            raise
+        finally:
+            if self.connection:
+                self.connection.close()
+    
+    def _resumed(self, stage) -> bool:
+        """True if the run being resumed already finished stage"""
+        self._stage_started = time.perf_counter()
+        if self.resume_from is None or stage not in self.resume_from.finished:
+            return False
+        logger.info(f"\n[{STAGES.index(stage) + 1}/{len(STAGES)}] "
+                    f"{stage.replace('_', ' ')}: restored from checkpoint")
+        return True
+    
+    def _checkpoint(self, stage, counts, entities=None):
+        """
+        Commit a finished stage and record its checkpoint (when
+        checkpointing); entities are the rows later stages read
+        """
+        if self.checkpoints is None:
+            return
+        self.writer.commit()
+        self.checkpoints.record(
+            stage, {table: counts[table] for table in STAGE_TABLES[stage]},
+            time.perf_counter() - self._stage_started, entities
+        )
+        self.writer.begin()
+
+    def generate_streaming(self, num_users: int = 500, projects_per_team: int = 3,
+                           tasks_per_section: int = 15):
+        """
+        Generate the dataset as a pipeline of project-sized chunks.
+        
+        Organization-level entities (users, teams, memberships, projects,
+        tags) are generated up front as in generate_all. Everything below a
+        project is produced by iter_project_chunks, written, and dropped
+        before the next project, so peak memory stays flat as tasks grow.
+        """
+        try:
+            logger.info("=" * 60)
+            logger.info("Starting Asana Seed Data Generation (streaming)")
+            logger.info("=" * 60)
+            
+            self.writer.begin()
+            self._seed_rngs()
+            
+            logger.info("\n[1/6] Generating organizations...")
+            org = generate_single_large_organization(base_datetime=self.base_datetime)
+            self.insert_organizations([org])
+            
+            logger.info("\n[2/6] Generating users...")
+            users = generate_users(org.org_id, org.domain, num_users, self.base_datetime)
+            users = ensure_role_distribution(users)
+            self.insert_users(users)
+            
+            logger.info("\n[3/6] Generating teams and memberships...")
+            teams = generate_teams(org.org_id, self.base_datetime)
+            self.insert_teams(teams)
+            memberships = generate_team_memberships(teams, users, self.base_datetime)
+            self.insert_team_memberships(memberships)
+            del memberships
+            
+            logger.info("\n[4/6] Generating projects...")
+            projects = generate_projects(org.org_id, teams, users, self.base_datetime, projects_per_team)
+            self.insert_projects(projects)
+            
+            logger.info("\n[5/6] Generating tags...")
             tags = generate_tags(org.org_id, self.base_datetime)
             self.insert_tags(tags)
             
-            custom_fields = generate_custom_fields(projects, self.base_datetime)
-            self.insert_custom_fields(custom_fields)
+            logger.info(f"\n[6/6] Streaming {len(projects)} projects...")
+            totals = {
+                'sections': 0, 'custom_field_definitions': 0, 'tasks': 0, 'subtasks': 0,
+                'comments': 0, 'custom_field_values': 0, 'task_tags': 0, 'task_dependencies': 0,
+            }
+            chunks = iter_project_chunks(
+                projects, users, tags, self.base_datetime, tasks_per_section,
+                vectorized=self.vectorized_tasks
+            )
+            for done, chunk in enumerate(chunks, start=1):
+                for table, rows in (
+                    ('sections', chunk.sections),
+                    ('custom_field_definitions', chunk.custom_fields),
+                    ('tasks', chunk.tasks),
+                    ('subtasks', chunk.subtasks),
+                    ('comments', chunk.comments),
+                    ('custom_field_values', chunk.custom_field_values),
+                    ('task_tags', chunk.task_tags),
+                    ('task_dependencies', chunk.dependencies),
+                ):
+                    totals[table] += self.writer.insert(table, map(ROW_CONVERTERS[table], rows))
+                if done % 100 == 0:
+                    logger.info(f"  {done}/{len(projects)} projects, {totals['tasks']} tasks written")
             
-            custom_field_values = generate_custom_field_values(tasks, custom_fields, self.base_datetime)
-            self.insert_custom_field_values(custom_field_values)
+            self.writer.commit()
+            self.finalize_database()
             
-            task_tags = generate_task_tags(tasks, tags, self.base_datetime)
-            self.insert_task_tags(task_tags)
+            self._log_summary({
+                'organizations': 1,
+                'users': len(users),
+                'teams': len(teams),
+                'projects': len(projects),
+                'tasks': totals['tasks'],
+                'subtasks': totals['subtasks'],
+                'comments': totals['comments'],
+                'tags': len(tags),
+                'custom fields': totals['custom_field_definitions'],
+            })
             
-            # 11. Task Dependencies
-            logger.info("\n[11/11] Generating task dependencies...")
-            dependencies = generate_task_dependencies(tasks, self.base_datetime)
-            self.insert_task_dependencies(dependencies)
+        except Exception as e:
+            logger.error(f"Error during generation: {e}", exc_info=True)
+            if self.writer:
+                self.writer.rollback()
+            raise
+        finally:
+            if self.connection:
+                self.connection.close()
+    
+    def generate_sharded(self, num_users: int = 500, projects_per_team: int = 3,
+                         tasks_per_section: int = 15, workers: int = 2):
+        """
+        Generate the dataset with project-level work spread over a process pool.
+        
+        Organization-level entities are generated and written here; projects
+        are then partitioned into one shard per worker. Each worker runs the
+        project-chunk pipeline with its own RNG stream into its own shard
+        database, and the shards are merged with ATTACH + INSERT ... SELECT.
+        """
+        shard_dir = None
+        try:
+            logger.info("=" * 60)
+            logger.info(f"Starting Asana Seed Data Generation ({workers} workers)")
+            logger.info("=" * 60)
+            
+            self.writer.begin()
+            self._seed_rngs()
+            
+            logger.info("\n[1/7] Generating organizations...")
+            org = generate_single_large_organization(base_datetime=self.base_datetime)
+            self.insert_organizations([org])
+            
+            logger.info("\n[2/7] Generating users...")
+            users = generate_users(org.org_id, org.domain, num_users, self.base_datetime)
+            users = ensure_role_distribution(users)
+            self.insert_users(users)
+            
+            logger.info("\n[3/7] Generating teams and memberships...")
+            teams = generate_teams(org.org_id, self.base_datetime)
+            self.insert_teams(teams)
+            self.insert_team_memberships(generate_team_memberships(teams, users, self.base_datetime))
+            
+            logger.info("\n[4/7] Generating projects...")
+            projects = generate_projects(org.org_id, teams, users, self.base_datetime, projects_per_team)
+            self.insert_projects(projects)
+            
+            logger.info("\n[5/7] Generating tags...")
+            tags = generate_tags(org.org_id, self.base_datetime)
+            self.insert_tags(tags)
+            
+            self.writer.commit()
+            
+            logger.info(f"\n[6/7] Generating {len(projects)} projects in {workers} shards...")
+            shard_dir = make_shard_dir(self.db_path)
+            seeds = shard_seeds(random.getrandbits(63), workers)
+            id_sequences = id_allocator().interleave(workers)
+            specs = [
+                ShardSpec(
+                    index=i,
+                    path=str(shard_dir / f"shard_{i:03d}.sqlite"),
+                    seed=seeds[i],
+                    schema_path=str(SCHEMA_PATH.resolve()),
+                    projects=shard_projects,
+                    users=users,
+                    tags=tags,
+                    base_datetime=self.base_datetime,
+                    tasks_per_section=tasks_per_section,
+                    batch_size=self.batch_size,
+                    vectorized=self.vectorized_tasks,
+                    id_scheme=self.id_scheme,
+                    timestamps=self.timestamps,
+                    text_storage=self.text_storage,
+                    id_start=id_sequences[i][0],
+                    id_step=id_sequences[i][1],
+                )
+                for i, shard_projects in enumerate(partition_projects(projects, workers))
+            ]
+            start = time.perf_counter()
+            shard_counts = generate_shards(specs, workers)
+            logger.info(f"Shards generated in {time.perf_counter() - start:.3f}s")
+            
+            logger.info("\n[7/7] Merging shards...")
+            totals = {table: 0 for table in SHARD_TABLES}
+            start = time.perf_counter()
+            for spec in specs:
+                for table, count in merge_shard(self.connection, spec.path, SHARD_TABLES).items():
+                    totals[table] += count
+            logger.info(f"Merged {len(specs)} shards in {time.perf_counter() - start:.3f}s")
             
-            # Summary
-            logger.info("\n" + "=" * 60)
-            logger.info("Data Generation Complete!")
+            self.finalize_database()
+            
+            self._log_summary({
+                'organizations': 1,
+                'users': len(users),
+                'teams': len(teams),
+                'projects': len(projects),
+                'tasks': totals['tasks'],
+                'subtasks': totals['subtasks'],
+                'comments': totals['comments'],
+                'tags': len(tags),
+                'custom fields': totals['custom_field_definitions'],
+            })
+            for spec, counts in zip(specs, shard_counts):
+                logger.info(f"shard {spec.index}: {len(spec.projects)} projects, {counts['tasks']} tasks")
+            
+        except Exception as e:
+            logger.error(f"Error during generation: {e}", exc_info=True)
+            if self.writer:
+                self.writer.rollback()
+            raise
+        finally:
+            if shard_dir is not None and shard_dir.exists():
+                shutil.rmtree(shard_dir)
+            if self.connection:
+                self.connection.close()
+    
+    def generate_multi_org(self, num_orgs: int, num_users: int = 500, projects_per_team: int = 3,
+                           tasks_per_section: int = 15, workers: int = 1, org_output: str = 'shared',
+                           size_distribution: str = 'fixed',
+                           size_spread: float = DEFAULT_ORG_SIZE_SPREAD):
+        """
+        Generate num_orgs independent tenant workspaces in a process pool.
+        
+        Org names, sizes (users drawn from size_distribution around
+        num_users) and RNG seeds are planned here; each org is then built
+        by a worker into its own database (see multi_org.py). With
+        org_output 'shared' every org is merged into db_path as soon as it
+        is ready; 'per-org' keeps one indexed database per org in
+        <output stem>.orgs/ next to an orgs.json manifest. A seeded run
+        gives the same orgs for any number of workers.
+        """
+        scratch_dir = None
+        try:
             logger.info("=" * 60)
-            logger.info(f"Database saved to: {self.db_path}")
-            logger.info(f"Total organizations: 1")
-            logger.info(f"Total users: {len(users)}")
-            logger.info(f"Total teams: {len(teams)}")
-            logger.info(f"Total projects: {len(projects)}")
-            logger.info(f"Total tasks: {len(tasks)}")
-            logger.info(f"Total subtasks: {len(subtasks)}")
-            logger.info(f"Total comments: {len(comments)}")
-            logger.info(f"Total tags: {len(tags)}")
-            logger.info(f"Total custom fields: {len(custom_fields)}")
+            logger.info(f"Starting Asana Seed Data Generation ({num_orgs} organizations, "
+                        f"{workers} workers, {org_output} output)")
             logger.info("=" * 60)
             
+            self._seed_rngs()
+            plans = plan_organizations(num_orgs, num_users, projects_per_team, size_distribution, size_spread)
+            sizes = sorted(plan.num_users for plan in plans)
+            logger.info(f"Users per org ({size_distribution}): min {sizes[0]}, "
+                        f"median {sizes[len(sizes) // 2]}, max {sizes[-1]}")
+            
+            if org_output == 'shared':
+                out_dir = scratch_dir = make_shard_dir(self.db_path)
+            else:
+                out_dir = org_dir_for(self.db_path)
+                if out_dir.exists():
+                    raise FileExistsError(f"{out_dir} already exists; delete it or choose another --output")
+                out_dir.mkdir(parents=True)
+            id_sequences = org_id_sequences(self.id_scheme, num_orgs)
+            specs = [
+                OrgSpec(
+                    plan=plan,
+                    path=str(out_dir / org_file_name(plan.index)),
+                    schema_path=str(SCHEMA_PATH.resolve()),
+                    base_datetime=self.base_datetime,
+                    tasks_per_section=tasks_per_section,
+                    index_schema_path=None if org_output == 'shared' else str(INDEX_SCHEMA_PATH.resolve()),
+                    batch_size=self.batch_size,
+                    vectorized=self.vectorized_tasks,
+                    id_scheme=self.id_scheme,
+                    timestamps=self.timestamps,
+                    text_storage=self.text_storage,
+                    id_start=id_sequences[plan.index][0],
+                    id_step=id_sequences[plan.index][1],
+                )
+                for plan in plans
+            ]
+            
+            totals = Counter()
+            results = []
+            merge_seconds = 0.0
+            start = time.perf_counter()
+            # Results arrive in org order; merging one overlaps with generating the next
+            for result in generate_orgs(specs, workers):
+                if org_output == 'shared':
+                    merge_start = time.perf_counter()
+                    merge_shard(self.connection, result.path, ORG_TABLES)
+                    os.remove(result.path)
+                    merge_seconds += time.perf_counter() - merge_start
+                totals.update(result.counts)
+                results.append(result)
+                if len(results) % max(1, num_orgs // 10) == 0 or len(results) == num_orgs:
+                    logger.info(f"{len(results)}/{num_orgs} organizations done "
+                                f"({time.perf_counter() - start:.1f}s)")
+            elapsed = time.perf_counter() - start
+            org_seconds = sum(result.seconds for result in results)
+            logger.info(f"Generated {num_orgs} organizations in {elapsed:.3f}s "
+                        f"({org_seconds:.3f}s of worker time, {org_seconds / elapsed:.2f}x)"
+                        + (f", merging took {merge_seconds:.3f}s" if org_output == 'shared' else ""))
+            
+            if org_output == 'shared':
+                self.finalize_database()
+            else:
+                manifest = write_org_manifest(out_dir, results, dict(
+                    num_users=num_users, projects_per_team=projects_per_team,
+                    tasks_per_section=tasks_per_section, seed=self.seed,
+                    as_of=self.base_datetime.isoformat(), size_distribution=size_distribution,
+                    size_spread=size_spread, id_scheme=self.id_scheme, timestamps=self.timestamps,
+                    text_storage=self.text_storage,
+                ))
+                logger.info(f"Org databases saved to: {out_dir} (manifest {manifest.name})")
+            
+            self._log_summary({
+                'organizations': totals['organizations'],
+                'users': totals['users'],
+                'teams': totals['teams'],
+                'projects': totals['projects'],
+                'tasks': totals['tasks'],
+                'subtasks': totals['subtasks'],
+                'comments': totals['comments'],
+                'tags': totals['tags'],
+                'custom fields': totals['custom_field_definitions'],
+            })
+            
         except Exception as e:
             logger.error(f"Error during generation: {e}", exc_info=True)
             raise
+        finally:
+            if scratch_dir is not None and scratch_dir.exists():
+                shutil.rmtree(scratch_dir)
+            if self.connection:
+                self.connection.close()
+    
+    def generate_append(self, add_tasks: int = 0, add_projects_per_team: int = 0,
+                        tasks_per_section: int = 15):
+        """
+        Grow the database opened by open_existing_database() in place.
+        
+        New projects (with sections and custom fields) go to the existing
+        teams; add_tasks more tasks are spread over the existing active
+        projects. Every new task gets subtasks, comments, custom field
+        values, tags and dependencies as in a full run, referencing existing
+        users and tags. Existing tasks are never loaded, so the cost is
+        proportional to what is added. New project names avoid the existing
+        ones (UNIQUE(org_id, name)); all other unique keys involve a new row.
+        """
+        workspace = self.workspace
+        try:
+            logger.info("=" * 60)
+            logger.info("Appending to existing Asana workspace")
+            logger.info("=" * 60)
+            
+            self.writer.begin()
+            # A seeded append must not replay the draws (and IDs) of the run
+            # that built the database, so the seed is mixed with its size
+            self._seed_rngs(salt=sum(workspace.row_counts.values()), id_start=workspace.max_int_id + 1)
+            
+            users = workspace.users
+            index = RelationshipIndex.build(
+                users=users, sections=workspace.sections, custom_fields=workspace.custom_fields
+            )
+            
+            logger.info("\n[1/4] Generating projects...")
+            projects = []
+            if add_projects_per_team:
+                projects = generate_projects(
+                    workspace.org_id, workspace.teams, users, self.base_datetime,
+                    add_projects_per_team, used_names=workspace.project_names
+                )
+                self.insert_projects(projects)
+                sections = generate_all_sections(projects, self.base_datetime)
+                self.insert_sections(sections)
+                index.add_sections(sections)
+                custom_fields = generate_custom_fields(projects, self.base_datetime)
+                self.insert_custom_fields(custom_fields)
+                index.add_custom_fields(custom_fields)
+            
+            logger.info("\n[2/4] Generating tasks...")
+            # (project, task count); None lets new projects draw their usual count
+            plan = [(project, None) for project in projects]
+            if add_tasks:
+                targets = [p for p in workspace.projects if p.status == 'active'] or workspace.projects
+                counts = Counter(random.choices(range(len(targets)), k=add_tasks))
+                plan.extend((targets[i], counts[i]) for i in sorted(counts))
+            tasks = []
+            for project, num_tasks in plan:
+                tasks.extend(generate_project_tasks(
+                    project, index.sections_by_project[project.project_id], index.user_ids,
+                    self.base_datetime, tasks_per_section, self.vectorized_tasks, num_tasks=num_tasks
+                ))
+            self.insert_tasks(tasks)
+            
+            logger.info("\n[3/4] Generating subtasks and comments...")
+            subtasks = generate_subtasks(tasks, users, self.base_datetime, user_ids=index.user_ids)
+            self.insert_subtasks(subtasks)
+            comments = generate_comments(tasks, users, self.base_datetime, user_ids=index.user_ids)
+            self.insert_comments(comments)
+            
+            logger.info("\n[4/4] Generating custom field values, tags and dependencies...")
+            self.insert_custom_field_values(
+                generate_custom_field_values(tasks, [], self.base_datetime, index=index)
+            )
+            self.insert_task_tags(generate_task_tags(tasks, workspace.tags, self.base_datetime))
+            # New tasks only depend on other new tasks of the same project
+            self.insert_task_dependencies(generate_task_dependencies(tasks, self.base_datetime))
+            
+            self.writer.commit()
+            
+            self._log_summary({
+                'projects added': len(projects),
+                'tasks added': len(tasks),
+                'subtasks added': len(subtasks),
+                'comments added': len(comments),
+                'tasks now': workspace.row_counts['tasks'] + len(tasks),
+            })
+            
+        except Exception as e:
+            logger.error(f"Error during append: {e}", exc_info=True)
+            if self.writer:
+                self.writer.rollback()
+            raise
         finally:
             if self.connection:
                 self.connection.close()
+    
+    def _seed_rngs(self, salt: int = 0, id_start: int = 1):
+        """
+        Reset all RNGs and the ID sequence so a seeded run replays exactly.
+        A non-zero salt derives a different stream from the same seed.
+        """
+        if self.seed is not None:
+            seed = self.seed if not salt else (self.seed * 1000003 + salt) % 2 ** 63
+            seed_everything(seed)
+            logger.info(f"Seeded RNGs with {self.seed} (as of {self.base_datetime.isoformat()})")
+        # The ID stream is seeded from `random`, so this comes after seeding
+        set_id_scheme(self.id_scheme, start=id_start)
+    
+    def _log_summary(self, totals):
+        """Log final entity counts and the per-table insert report"""
+        logger.info("\n" + "=" * 60)
+        logger.info("Data Generation Complete!")
+        logger.info("=" * 60)
+        # No writer: per-org multi-org output, reported by generate_multi_org
+        if self.output_format != 'parquet' and self.writer is not None:
+            logger.info(f"Database saved to: {self.db_path}")
+        for name, count in totals.items():
+            logger.info(f"Total {name}: {count}")
+        logger.info("=" * 60)
+        if self.writer is not None:
+            self.writer.log_report(logger)
+            logger.info("=" * 60)
+    
+    def write_profile_report(self, **extra):
+        """Write the per-stage profile as JSON next to the database"""
+        path = self.recorder.write_report(
+            profile_report_path(self.db_path), db_path=self.db_path, **extra
+        )
+        logger.info(f"Profile report written to {path}")
+        return path
 
 def main():
     parser = argparse.ArgumentParser(
@@ -425,16 +1097,378 @@ def main():
         default="output/asana_simulation.sqlite",
         help="Output database path (default: output/asana_simulation.sqlite)"
     )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=DEFAULT_BATCH_SIZE,
+        help=f"Rows per executemany batch (default: {DEFAULT_BATCH_SIZE})"
+    )
+    
+    parser.add_argument(
+        "--bulk-load",
+        action="store_true",
+        help="Defer index creation and relax journaling/sync until the load finishes"
+    )
+    
+    parser.add_argument(
+        "--stream",
+        action="store_true",
+        help="Generate and write one project at a time to keep memory flat"
+    )
+    
+    parser.add_argument(
+        "--writer-thread",
+        action="store_true",
+        help="Write to SQLite from a background thread while generation continues"
+    )
+    parser.add_argument(
+        "--queue-depth",
+        type=int,
+        default=DEFAULT_QUEUE_DEPTH,
+        help=f"Max batches buffered for the writer thread (default: {DEFAULT_QUEUE_DEPTH})"
+    )
+    
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Worker processes for project-level generation (default: 1, no sharding)"
+    )
+    
+    parser.add_argument(
+        "--num-orgs",
+        type=int,
+        default=1,
+        help="Generate this many independent organizations in a --workers process pool "
+             "(default: 1, the single large organization)"
+    )
+    parser.add_argument(
+        "--org-output",
+        choices=ORG_OUTPUTS,
+        default='shared',
+        help="With --num-orgs: merge every org into --output (shared, default) or write one "
+             "database per org to <output stem>.orgs/ (per-org)"
+    )
+    parser.add_argument(
+        "--org-size-dist",
+        choices=ORG_SIZE_DISTRIBUTIONS,
+        default='fixed',
+        help="With --num-orgs: distribution of users per org around --num-users (default: fixed)"
+    )
+    parser.add_argument(
+        "--org-size-spread",
+        type=float,
+        default=DEFAULT_ORG_SIZE_SPREAD,
+        help=f"Relative spread of org sizes: +/- range for uniform, sigma for lognormal "
+             f"(default: {DEFAULT_ORG_SIZE_SPREAD})"
+    )
+    parser.add_argument(
+        "--vectorized-tasks",
+        action="store_true",
+        help="Draw task attributes as NumPy arrays in one batch instead of per task"
+    )
+    parser.add_argument(
+        "--seed",
+        type=int,
+        default=None,
+        help="Seed all RNGs for a reproducible dataset (enables the dataset cache)"
+    )
+    parser.add_argument(
+        "--as-of",
+        type=datetime.fromisoformat,
+        default=None,
+        help="Reference 'now' as an ISO date/datetime (default: today at midnight when seeded)"
+    )
+    parser.add_argument(
+        "--cache-dir",
+        type=str,
+        default=DEFAULT_CACHE_DIR,
+        help=f"Directory for cached seeded datasets (default: {DEFAULT_CACHE_DIR})"
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Always regenerate, even if a cached dataset matches"
+    )
+    parser.add_argument(
+        "--cache-hardlink",
+        action="store_true",
+        help="Serve cache hits as hardlinks instead of copies (output must be treated read-only)"
+    )
+    parser.add_argument(
+        "--id-scheme",
+        choices=ID_SCHEMES,
+        default='uuid',
+        help="Entity keys: uuid text (default), int rowid aliases, or gid Asana-style numbers"
+    )
+    parser.add_argument(
+        "--timestamps",
+        choices=TIMESTAMP_FORMATS,
+        default='iso',
+        help="Store dates/timestamps as ISO text (default) or INTEGER epoch microseconds/days "
+             "with <table>_iso views"
+    )
+    parser.add_argument(
+        "--text-storage",
+        choices=TEXT_STORAGE_MODES,
+        default='inline',
+        help="Store task/subtask descriptions and comment bodies as TEXT (inline, default) or as "
+             "ids into a text_bodies table holding each body once, with <table>_text views (normalized)"
+    )
+    parser.add_argument(
+        "--format",
+        dest="output_format",
+        choices=OUTPUT_FORMATS,
+        default='sqlite',
+        help="Output: SQLite database (default), one Parquet dataset per table without "
+             "a database (parquet), or both (parquet/both require pyarrow)"
+    )
+    parser.add_argument(
+        "--parquet-dir",
+        type=str,
+        default=None,
+        help="Directory for Parquet datasets (default: <output stem>.parquet next to --output)"
+    )
+    parser.add_argument(
+        "--row-group-size",
+        type=int,
+        default=DEFAULT_ROW_GROUP_SIZE,
+        help=f"Rows per Parquet row group (default: {DEFAULT_ROW_GROUP_SIZE})"
+    )
+    parser.add_argument(
+        "--jsonl-dir",
+        type=str,
+        default=None,
+        help="Also export every table as sharded .jsonl.gz files with a manifest to this directory"
+    )
+    parser.add_argument(
+        "--jsonl-shard-rows",
+        type=int,
+        default=DEFAULT_SHARD_ROWS,
+        help=f"Rows per .jsonl.gz shard (default: {DEFAULT_SHARD_ROWS})"
+    )
+    parser.add_argument(
+        "--jsonl-workers",
+        type=int,
+        default=DEFAULT_COMPRESS_WORKERS,
+        help=f"Processes compressing .jsonl.gz shards (default: {DEFAULT_COMPRESS_WORKERS})"
+    )
+    parser.add_argument(
+        "--in-memory-build",
+        action="store_true",
+        help="Build the database in :memory: and write it to --output in one pass at the end "
+             "(falls back to disk if it would not fit in RAM)"
+    )
+    parser.add_argument(
+        "--compact",
+        action="store_true",
+        help="With --in-memory-build, persist with VACUUM INTO for a compacted file"
+    )
+    parser.add_argument(
+        "--append",
+        action="store_true",
+        help="Grow the existing --output database in place instead of creating a new one"
+    )
+    parser.add_argument(
+        "--add-tasks",
+        type=int,
+        default=0,
+        help="With --append, tasks (with their subtasks, comments etc.) to add to existing projects"
+    )
+    parser.add_argument(
+        "--add-projects-per-team",
+        type=int,
+        default=0,
+        help="With --append, new projects per team (with sections and tasks)"
+    )
+    parser.add_argument(
+        "--org-id",
+        help="With --append, the organization to grow (required when the database holds several, "
+             "e.g. from --num-orgs)"
+    )
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="Continue an interrupted --checkpoint run of --output from its last stage checkpoint "
+             "(sizes, seed and schema options come from the checkpoint)"
+    )
+    parser.add_argument(
+        "--checkpoint",
+        action="store_true",
+        help="Commit each stage and record a checkpoint after it, so an interrupted run can "
+             "--resume (default: load everything in one transaction)"
+    )
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="Record per-stage CPU time and tracemalloc peaks to <output stem>.profile.json "
+             "(always regenerates)"
+    )
+    parser.add_argument(
+        "--profile-pstats",
+        action="store_true",
+        help="With --profile, also dump a cProfile .pstats file per stage"
+    )
     
     args = parser.parse_args()
+    if args.workers < 1:
+        parser.error("--workers must be at least 1")
+    if (args.output_format != 'sqlite' or args.jsonl_dir) and args.workers > 1:
+        parser.error("--format parquet/both and --jsonl-dir are not supported with --workers "
+                     "(shards merge through SQLite; export the result with src/export.py)")
+    if args.output_format == 'parquet' and (args.writer_thread or args.bulk_load or args.in_memory_build
+                                            or args.text_storage != 'inline'):
+        parser.error("--writer-thread, --bulk-load, --in-memory-build and --text-storage apply to "
+                     "SQLite output only")
+    if args.compact and not args.in_memory_build:
+        parser.error("--compact requires --in-memory-build")
+    if args.append:
+        if args.add_tasks <= 0 and args.add_projects_per_team <= 0:
+            parser.error("--append needs --add-tasks and/or --add-projects-per-team")
+        if (args.workers > 1 or args.stream or args.output_format != 'sqlite' or args.jsonl_dir
+                or args.bulk_load or args.writer_thread or args.in_memory_build):
+            parser.error("--append runs the single-process pipeline into the existing SQLite file only")
+    elif args.org_id is not None:
+        parser.error("--org-id requires --append")
+    if args.num_orgs < 1:
+        parser.error("--num-orgs must be at least 1")
+    if args.org_size_spread < 0:
+        parser.error("--org-size-spread must not be negative")
+    if args.num_orgs > 1:
+        if (args.stream or args.append or args.resume or args.output_format != 'sqlite' or args.jsonl_dir
+                or args.writer_thread):
+            parser.error("--num-orgs builds every org in a worker process into SQLite files only")
+        if args.org_output == 'per-org' and (args.in_memory_build or args.bulk_load):
+            parser.error("--org-output per-org writes each org's database directly "
+                         "(--in-memory-build and --bulk-load apply to the shared database)")
+    if args.resume and (args.append or args.workers > 1 or args.stream or args.output_format != 'sqlite'
+                        or args.jsonl_dir or args.in_memory_build):
+        parser.error("--resume continues the staged pipeline into an on-disk SQLite file only")
+    if args.checkpoint and (args.append or args.workers > 1 or args.num_orgs > 1 or args.stream
+                            or args.output_format != 'sqlite' or args.jsonl_dir or args.in_memory_build):
+        parser.error("--checkpoint covers the staged pipeline into an on-disk SQLite file only")
     
-    generator = AsanaDataGenerator(db_path=args.output)
-    generator.setup_database()
-    generator.generate_all(
+    as_of = args.as_of
+    if args.seed is not None and as_of is None:
+        as_of = datetime.combine(datetime.now().date(), datetime.min.time())
+    
+    options = dict(
         num_users=args.num_users,
         projects_per_team=args.projects_per_team,
         tasks_per_section=args.tasks_per_section
     )
+    
+    # Only seeded runs are reproducible, so only they can be served from cache
+    cache = key = None
+    # The cache holds single database files, so Parquet/JSONL output always regenerates,
+    # and per-org multi-org output is a directory of databases
+    if (args.seed is not None and not args.no_cache and not args.append and not args.resume
+            and not args.profile and args.output_format == 'sqlite' and not args.jsonl_dir
+            and not (args.num_orgs > 1 and args.org_output == 'per-org')):
+        cache_params = dict(
+            options,
+            seed=args.seed,
+            as_of=as_of.isoformat(),
+            # Pipeline shape changes the order RNG draws are consumed in
+            pipeline=('multi_org' if args.num_orgs > 1 else 'sharded' if args.workers > 1
+                      else 'stream' if args.stream else 'staged'),
+            workers=args.workers,
+            vectorized_tasks=args.vectorized_tasks,
+            id_scheme=args.id_scheme,
+            timestamps=args.timestamps,
+            text_storage=args.text_storage,
+        )
+        if args.num_orgs > 1:
+            cache_params.update(
+                num_orgs=args.num_orgs,
+                org_size_dist=args.org_size_dist,
+                org_size_spread=args.org_size_spread,
+            )
+        cache = DatasetCache(args.cache_dir)
+        key = cache_key(cache_params)
+        if cache.lookup(key):
+            cache.materialize(key, args.output, hardlink=args.cache_hardlink)
+            logger.info(f"Cache hit {key[:12]}: served {args.output} from {args.cache_dir}")
+            return
+        logger.info(f"Cache miss {key[:12]}: generating")
+    
+    generator = AsanaDataGenerator(
+        db_path=args.output,
+        batch_size=args.batch_size,
+        bulk_load=args.bulk_load,
+        writer_thread=args.writer_thread,
+        queue_depth=args.queue_depth,
+        seed=args.seed,
+        as_of=as_of,
+        vectorized_tasks=args.vectorized_tasks,
+        profile=args.profile,
+        profile_pstats=args.profile_pstats,
+        id_scheme=args.id_scheme,
+        timestamps=args.timestamps,
+        text_storage=args.text_storage,
+        output_format=args.output_format,
+        parquet_dir=args.parquet_dir,
+        row_group_size=args.row_group_size,
+        jsonl_dir=args.jsonl_dir,
+        jsonl_shard_rows=args.jsonl_shard_rows,
+        jsonl_workers=args.jsonl_workers,
+        in_memory_build=args.in_memory_build,
+        compact=args.compact,
+        checkpoint_stages=args.checkpoint
+    )
+    start = time.perf_counter()
+    if args.append:
+        try:
+            generator.open_existing_database(args.org_id)
+        except ValueError as e:
+            parser.error(str(e))
+        generator.generate_append(
+            add_tasks=args.add_tasks,
+            add_projects_per_team=args.add_projects_per_team,
+            tasks_per_section=args.tasks_per_section
+        )
+    elif args.resume:
+        options = generator.resume_database()
+        generator.generate_all(**options)
+    elif args.num_orgs > 1:
+        if args.org_output == 'shared':
+            generator.setup_database(expected_bytes=estimate_database_bytes(**options) * args.num_orgs)
+        generator.generate_multi_org(
+            args.num_orgs, workers=args.workers, org_output=args.org_output,
+            size_distribution=args.org_size_dist, size_spread=args.org_size_spread, **options
+        )
+    else:
+        generator.setup_database(expected_bytes=estimate_database_bytes(**options))
+        if args.workers > 1:
+            generator.generate_sharded(workers=args.workers, **options)
+        elif args.stream:
+            generator.generate_streaming(**options)
+        else:
+            generator.generate_all(**options)
+    
+    if args.profile:
+        generator.write_profile_report(
+            wall_seconds=round(time.perf_counter() - start, 6),
+            options=options,
+            seed=generator.seed,
+            as_of=generator.base_datetime.isoformat(),
+            pipeline=('append' if args.append else 'multi_org' if args.num_orgs > 1
+                      else 'sharded' if args.workers > 1
+                      else 'stream' if args.stream else 'staged'),
+            workers=args.workers,
+            bulk_load=generator.bulk_load,
+            writer_thread=args.writer_thread,
+            vectorized_tasks=generator.vectorized_tasks,
+            id_scheme=generator.id_scheme,
+            timestamps=generator.timestamps,
+            text_storage=generator.text_storage,
+            output_format=args.output_format,
+            in_memory_build=generator.in_memory_build,
+        )
+    
+    if cache is not None:
+        cache.store(key, args.output, cache_params)
+        logger.info(f"Stored dataset in cache as {key[:12]}")
 
 if __name__ == "__main__":
     main()
@@ -1,12 +1,40 @@
 # Data models for Asana simulation
-from dataclasses import dataclass
+from dataclasses import dataclass, fields
 from datetime import datetime, date
-from typing import Optional, List
+from typing import Optional, List, Union
+
+from generators.texts import render_text
+
+# Entity keys are UUID strings by default, ints under --id-scheme int/gid
+EntityId = Union[str, int]
+
+# Task/subtask descriptions and comment bodies are generated as text ids
+# into generators/texts.py, not as text; rows read back from an inline
+# database hold the text. Read them through the *_text properties.
+TextRef = Union[int, str]
+
+def slotted(cls):
+    """
+    Rebuild a dataclass with __slots__ instead of a per-instance __dict__.
+    
+    Equivalent to @dataclass(slots=True), which needs Python 3.10. Used for
+    the high-volume row types, where the __dict__ is most of the footprint.
+    Enum-like fields hold the shared constant strings from the generators'
+    pools, so instances only add a pointer per field.
+    """
+    names = tuple(f.name for f in fields(cls))
+    namespace = dict(cls.__dict__)
+    namespace['__slots__'] = names
+    namespace.pop('__dict__', None)
+    namespace.pop('__weakref__', None)
+    for name in names:
+        namespace.pop(name, None)
+    return type(cls)(cls.__name__, cls.__bases__, namespace)
 
 @dataclass
 class Organization:
     """Represents an Asana organization/workspace"""
-    org_id: str
+    org_id: EntityId
     name: str
     domain: str
     is_verified: bool
@@ -17,8 +45,8 @@ class Organization:
 @dataclass
 class Team:
     """Represents a team within an organization"""
-    team_id: str
-    org_id: str
+    team_id: EntityId
+    org_id: EntityId
     name: str
     description: Optional[str]
     team_type: str  # 'engineering', 'marketing', 'operations', etc.
@@ -28,8 +56,8 @@ class Team:
 @dataclass
 class User:
     """Represents a workspace user"""
-    user_id: str
-    org_id: str
+    user_id: EntityId
+    org_id: EntityId
     email: str
     full_name: str
     first_name: str
@@ -44,9 +72,9 @@ class User:
 @dataclass
 class Project:
     """Represents a project within a team"""
-    project_id: str
-    org_id: str
-    team_id: str
+    project_id: EntityId
+    org_id: EntityId
+    team_id: EntityId
     name: str
     description: Optional[str]
     project_type: str  # 'product_development', 'marketing_campaign', 'operations', 'infrastructure'
@@ -54,29 +82,33 @@ class Project:
     created_at: datetime
     start_date: Optional[date]
     target_end_date: Optional[date]
-    owner_user_id: str
+    owner_user_id: EntityId
     visibility: str  # 'private', 'team', 'org'
 
 @dataclass
 class Section:
     """Represents a section/column within a project"""
-    section_id: str
-    project_id: str
+    section_id: EntityId
+    project_id: EntityId
     name: str
     description: Optional[str]
     display_order: int
     created_at: datetime
 
+@slotted
 @dataclass
 class Task:
-    """Represents a task (main unit of work)"""
-    task_id: str
-    project_id: str
-    section_id: str
+    """
+    Represents a task (main unit of work). description is a text id (see
+    TextRef); description_text is the text, with the task name filled in.
+    """
+    task_id: EntityId
+    project_id: EntityId
+    section_id: EntityId
     name: str
-    description: Optional[str]
-    assignee_id: Optional[str]
-    created_by_user_id: str
+    description: Optional[TextRef]  # text id, not text
+    assignee_id: Optional[EntityId]
+    created_by_user_id: EntityId
     created_at: datetime
     due_date: Optional[date]
     start_date: Optional[date]
@@ -86,36 +118,56 @@ class Task:
     completed_at: Optional[datetime]
     estimated_hours: Optional[float]
     actual_hours: Optional[float]
+    
+    @property
+    def description_text(self) -> Optional[str]:
+        return render_text(self.description, self.name)
 
+@slotted
 @dataclass
 class Subtask:
-    """Represents a subtask nested within a task"""
-    subtask_id: str
-    task_id: str
+    """
+    Represents a subtask nested within a task. description is a text id
+    (see TextRef); description_text is the text.
+    """
+    subtask_id: EntityId
+    task_id: EntityId
     name: str
-    description: Optional[str]
-    assignee_id: Optional[str]
+    description: Optional[TextRef]  # text id, not text
+    assignee_id: Optional[EntityId]
     created_at: datetime
     due_date: Optional[date]
     is_completed: bool
     completed_at: Optional[datetime]
+    
+    @property
+    def description_text(self) -> Optional[str]:
+        return render_text(self.description)
 
+@slotted
 @dataclass
 class Comment:
-    """Represents a comment on a task"""
-    comment_id: str
-    task_id: str
-    user_id: str
-    content: str
+    """
+    Represents a comment on a task. content is a text id (see TextRef);
+    content_text is the text.
+    """
+    comment_id: EntityId
+    task_id: EntityId
+    user_id: EntityId
+    content: TextRef  # text id, not text
     created_at: datetime
     updated_at: Optional[datetime]
     is_edited: bool
+    
+    @property
+    def content_text(self) -> str:
+        return render_text(self.content)
 
 @dataclass
 class Tag:
     """Represents a tag that can be applied to tasks"""
-    tag_id: str
-    org_id: str
+    tag_id: EntityId
+    org_id: EntityId
     name: str
     color: Optional[str]
     created_at: datetime
@@ -123,58 +175,61 @@ class Tag:
 @dataclass
 class CustomFieldDefinition:
     """Represents a custom field definition for a project"""
-    field_id: str
-    project_id: str
+    field_id: EntityId
+    project_id: EntityId
     name: str
     field_type: str  # 'text', 'number', 'dropdown', 'date', 'checkbox', 'multi_select'
     description: Optional[str]
     is_required: bool
     created_at: datetime
 
+@slotted
 @dataclass
 class CustomFieldValue:
     """Represents the value of a custom field for a task"""
-    value_id: str
-    task_id: str
-    field_id: str
+    value_id: EntityId
+    task_id: EntityId
+    field_id: EntityId
     value: Optional[str]
     created_at: datetime
     updated_at: Optional[datetime]
 
+@slotted
 @dataclass
 class TaskTag:
     """Association between a task and a tag"""
-    task_tag_id: str
-    task_id: str
-    tag_id: str
+    task_tag_id: EntityId
+    task_id: EntityId
+    tag_id: EntityId
     added_at: datetime
 
+@slotted
 @dataclass
 class TaskDependency:
     """Represents a dependency between two tasks"""
-    dependency_id: str
-    task_id: str
-    depends_on_task_id: str
-    dependency_type: str  # 'blocks', 'is_blocked_by', 'related_to'
+    dependency_id: EntityId
+    task_id: EntityId
+    depends_on_task_id: EntityId
+    dependency_type: str  # 'blocks', 'related_to'
     created_at: datetime
 
 @dataclass
 class Attachment:
     """Represents a file attachment to a task"""
-    attachment_id: str
-    task_id: str
+    attachment_id: EntityId
+    task_id: EntityId
     file_name: str
     file_size: Optional[int]
     file_url: Optional[str]
-    uploaded_by_user_id: str
+    uploaded_by_user_id: EntityId
     created_at: datetime
 
 @dataclass
 class TeamMembership:
     """Represents a user's membership in a team"""
-    membership_id: str
-    team_id: str
-    user_id: str
+    membership_id: EntityId
+    team_id: EntityId
+    user_id: EntityId
     joined_at: datetime
     is_lead: bool
     role_in_team: Optional[str]  # 'member', 'lead', 'manager'
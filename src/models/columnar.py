@@ -0,0 +1,167 @@
+# Columnar (struct-of-arrays) entity tables
+#
+# A list of a million Task dataclasses holds a million __dict__s plus a
+# datetime and a str per field. The tables here keep one NumPy array per
+# field instead: datetime64 for timestamps, NaN/NaT for missing values and
+# Categorical codes for enum-like and foreign-key fields. They convert to
+# and from the row dataclasses in models, so code that wants objects can
+# still have them; code that only reads a few fields goes through
+# entity_columns and accepts either form.
+from dataclasses import dataclass, fields
+from operator import attrgetter
+from typing import Iterator, List, Optional, Sequence
+
+import numpy as np
+
+from generators.texts import render_text
+from models import Task
+
+
+def _code_dtype(num_categories: int):
+    """Smallest signed integer dtype that holds every code plus -1 for None"""
+    for dtype in (np.int8, np.int16, np.int32):
+        if num_categories < np.iinfo(dtype).max:
+            return dtype
+    return np.int64
+
+
+@dataclass
+class Categorical:
+    """Integer codes into a list of categories; code -1 means None"""
+    codes: np.ndarray
+    categories: List
+
+    @classmethod
+    def from_values(cls, values: Sequence, categories: Optional[Sequence] = None) -> 'Categorical':
+        """Encode values; categories default to the distinct non-None values in first-seen order"""
+        if categories is None:
+            categories = list(dict.fromkeys(v for v in values if v is not None))
+        lookup = {category: code for code, category in enumerate(categories)}
+        codes = np.fromiter(
+            (-1 if v is None else lookup[v] for v in values),
+            dtype=_code_dtype(len(categories)), count=len(values)
+        )
+        return cls(codes, list(categories))
+
+    @classmethod
+    def from_codes(cls, codes: np.ndarray, categories: Sequence) -> 'Categorical':
+        """Wrap precomputed codes, narrowed to the smallest dtype that fits"""
+        return cls(np.asarray(codes).astype(_code_dtype(len(categories))), list(categories))
+
+    def __len__(self) -> int:
+        return len(self.codes)
+
+    def decode(self) -> List:
+        """Python list of category values (None for code -1)"""
+        # Code -1 indexes the trailing None
+        lookup = np.array(list(self.categories) + [None], dtype=object)
+        return lookup[self.codes].tolist()
+
+
+def _datetimes(values: Sequence, unit: str) -> np.ndarray:
+    """datetime64 array from datetimes/dates with None as NaT"""
+    return np.array([np.datetime64('NaT') if v is None else v for v in values], dtype=f'datetime64[{unit}]')
+
+
+def _floats(values: Sequence) -> np.ndarray:
+    """float64 array with None as NaN"""
+    return np.array([np.nan if v is None else v for v in values], dtype=np.float64)
+
+
+def _decode(column) -> List:
+    """Python values for one column, with NaT/NaN mapped back to None"""
+    if isinstance(column, Categorical):
+        return column.decode()
+    if column.dtype.kind == 'M':
+        values = column.astype(object)
+        values[np.isnat(column)] = None
+        return values.tolist()
+    if column.dtype.kind == 'f':
+        values = column.astype(object)
+        values[np.isnan(column)] = None
+        return values.tolist()
+    return column.tolist()
+
+
+class _ColumnarTable:
+    """Shared behaviour for the tables below; subclasses are dataclasses"""
+    ROW_TYPE = None
+
+    def __len__(self) -> int:
+        return len(getattr(self, fields(self)[0].name))
+
+    def column(self, name: str) -> List:
+        """One field as a list of Python values, decoded like the row dataclass holds it"""
+        return _decode(getattr(self, name))
+
+    def iter_rows(self) -> Iterator:
+        """Yield row dataclasses one at a time without keeping them around"""
+        columns = [self.column(f.name) for f in fields(self)]
+        for values in zip(*columns):
+            yield self.ROW_TYPE(*values)
+
+    def to_rows(self) -> List:
+        return list(self.iter_rows())
+
+
+@dataclass
+class TaskTable(_ColumnarTable):
+    """Tasks as columns; field order matches Task and the tasks table"""
+    task_id: np.ndarray  # object (str)
+    project_id: Categorical
+    section_id: Categorical
+    name: np.ndarray  # object (str)
+    description: np.ndarray  # object (text id or None)
+    assignee_id: Categorical
+    created_by_user_id: Categorical
+    created_at: np.ndarray  # datetime64[us]
+    due_date: np.ndarray  # datetime64[D], NaT = no due date
+    start_date: np.ndarray  # datetime64[D]
+    priority: Categorical
+    status: Categorical
+    is_completed: np.ndarray  # bool
+    completed_at: np.ndarray  # datetime64[us]
+    estimated_hours: np.ndarray  # float64, NaN = no estimate
+    actual_hours: np.ndarray  # float64
+
+    ROW_TYPE = Task
+
+    @classmethod
+    def from_tasks(cls, tasks: List[Task]) -> 'TaskTable':
+        return cls(
+            task_id=np.array([t.task_id for t in tasks], dtype=object),
+            project_id=Categorical.from_values([t.project_id for t in tasks]),
+            section_id=Categorical.from_values([t.section_id for t in tasks]),
+            name=np.array([t.name for t in tasks], dtype=object),
+            description=np.array([t.description for t in tasks], dtype=object),
+            assignee_id=Categorical.from_values([t.assignee_id for t in tasks]),
+            created_by_user_id=Categorical.from_values([t.created_by_user_id for t in tasks]),
+            created_at=_datetimes([t.created_at for t in tasks], 'us'),
+            due_date=_datetimes([t.due_date for t in tasks], 'D'),
+            start_date=_datetimes([t.start_date for t in tasks], 'D'),
+            priority=Categorical.from_values([t.priority for t in tasks]),
+            status=Categorical.from_values([t.status for t in tasks]),
+            is_completed=np.array([t.is_completed for t in tasks], dtype=bool),
+            completed_at=_datetimes([t.completed_at for t in tasks], 'us'),
+            estimated_hours=_floats([t.estimated_hours for t in tasks]),
+            actual_hours=_floats([t.actual_hours for t in tasks]),
+        )
+
+    def to_tasks(self) -> List[Task]:
+        return self.to_rows()
+
+    def description_texts(self) -> np.ndarray:
+        """description rendered to text (Task.description_text per row)"""
+        return np.array([render_text(d, n) for d, n in zip(self.description, self.name)], dtype=object)
+
+
+def entity_columns(entities, *names: str) -> Iterator[tuple]:
+    """
+    (names...) of every entity as tuples, read column by column from a
+    columnar table or field by field from a list of row dataclasses
+    """
+    if isinstance(entities, _ColumnarTable):
+        return zip(*(entities.column(name) for name in names))
+    if len(names) == 1:
+        return ((value,) for value in map(attrgetter(names[0]), entities))
+    return map(attrgetter(*names), entities)
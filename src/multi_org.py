@@ -0,0 +1,233 @@
+# Multi-process generation of many tenant organizations (--num-orgs)
+#
+# Organizations share no rows, so each one is a complete, independent
+# workspace: its own users, teams, memberships, projects and tags, with
+# the project-chunk pipeline below them. The parent only plans the orgs
+# (names, sizes and RNG seeds); every org is generated in a worker
+# process into its own SQLite file, which is either merged into the shared
+# output database or kept as that org's database.
+import json
+import random
+import sqlite3
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field, asdict
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional
+
+import numpy as np
+
+from generators.organizations import generate_company_names, generate_organization
+from generators.users import generate_users, ensure_role_distribution
+from generators.teams import generate_teams, generate_team_memberships
+from generators.projects import generate_projects
+from generators.tags import generate_tags
+from generators.streaming import iter_project_chunks
+from sharding import SHARD_TABLES, shard_seeds
+from storage.rows import ROW_CONVERTERS
+from storage.sqlite_writer import (
+    BulkWriter, DEFAULT_BATCH_SIZE, apply_bulk_load_pragmas, execute_sql_file, create_iso_views,
+    create_text_views
+)
+from utils.helpers import IdAllocator, set_id_scheme
+
+# shared: every org merged into --output; per-org: one database per org
+ORG_OUTPUTS = ('shared', 'per-org')
+
+# How users per org are drawn around --num-users (the mean):
+#   fixed     - every org gets num_users
+#   uniform   - num_users * (1 +/- spread)
+#   lognormal - right-skewed, sigma = spread: many small tenants, a few large ones
+ORG_SIZE_DISTRIBUTIONS = ('fixed', 'uniform', 'lognormal')
+DEFAULT_ORG_SIZE_SPREAD = 0.5
+MIN_ORG_USERS = 5
+
+MANIFEST_NAME = 'orgs.json'
+
+# Tables of one org workspace, in foreign-key order for merging
+ORG_TABLES = ['organizations', 'users', 'teams', 'team_memberships', 'projects', 'tags'] + SHARD_TABLES
+
+
+@dataclass
+class OrgPlan:
+    """Name, size and RNG seed of one org, drawn up front by the parent"""
+    index: int
+    name: str
+    num_users: int
+    projects_per_team: int
+    seed: int
+
+
+@dataclass
+class OrgSpec:
+    """Everything a worker process needs to generate one org"""
+    plan: OrgPlan
+    path: str
+    schema_path: str
+    base_datetime: datetime
+    tasks_per_section: int
+    # Set for per-org output, where the worker's file is the final database
+    index_schema_path: Optional[str] = None
+    batch_size: int = DEFAULT_BATCH_SIZE
+    vectorized: bool = False
+    id_scheme: str = 'uuid'
+    timestamps: str = 'iso'
+    text_storage: str = 'inline'
+    # This org's slice of the int ID sequence (see IdAllocator.interleave),
+    # so keys stay unique across orgs
+    id_start: int = 1
+    id_step: int = 1
+
+
+@dataclass
+class OrgResult:
+    """What a worker reports back about the org it generated"""
+    index: int
+    org_id: object
+    name: str
+    domain: str
+    path: str
+    seconds: float
+    counts: Dict[str, int] = field(default_factory=dict)
+
+
+def draw_org_sizes(num_orgs: int, mean_users: int, distribution: str = 'fixed',
+                   spread: float = DEFAULT_ORG_SIZE_SPREAD,
+                   rng: Optional[np.random.Generator] = None) -> List[int]:
+    """Users per org, drawn from distribution with the given mean (at least MIN_ORG_USERS)"""
+    if distribution not in ORG_SIZE_DISTRIBUTIONS:
+        raise ValueError(f"Unknown org size distribution {distribution!r}")
+    rng = rng or np.random.default_rng()
+    if distribution == 'fixed':
+        sizes = np.full(num_orgs, float(mean_users))
+    elif distribution == 'uniform':
+        sizes = rng.uniform(mean_users * (1 - spread), mean_users * (1 + spread), num_orgs)
+    else:
+        # exp(N(-sigma^2/2, sigma)) has mean 1
+        sizes = mean_users * rng.lognormal(-spread ** 2 / 2, spread, num_orgs)
+    return np.maximum(np.rint(sizes), MIN_ORG_USERS).astype(int).tolist()
+
+
+def plan_organizations(num_orgs: int, num_users: int, projects_per_team: int,
+                       distribution: str = 'fixed',
+                       spread: float = DEFAULT_ORG_SIZE_SPREAD) -> List[OrgPlan]:
+    """
+    Draw every org's name, size and seed from the global RNG state. Team
+    count is fixed per org, so projects per team scale with the org's size
+    to keep tasks roughly proportional to users.
+    """
+    names = generate_company_names(num_orgs)
+    sizes = draw_org_sizes(num_orgs, num_users, distribution, spread,
+                           np.random.default_rng(random.getrandbits(63)))
+    seeds = shard_seeds(random.getrandbits(63), num_orgs)
+    return [
+        OrgPlan(
+            index=i,
+            name=names[i],
+            num_users=sizes[i],
+            projects_per_team=max(1, round(projects_per_team * sizes[i] / num_users)),
+            seed=seeds[i],
+        )
+        for i in range(num_orgs)
+    ]
+
+
+def org_id_sequences(id_scheme: str, num_orgs: int):
+    """(start, step) of each org's int/gid ID sequence; every org starts at 1 for uuid"""
+    if id_scheme == 'uuid':
+        return [(1, 1)] * num_orgs
+    return IdAllocator('int').interleave(num_orgs)
+
+
+def run_org(spec: OrgSpec) -> OrgResult:
+    """Generate one complete org workspace into its own database"""
+    start = time.perf_counter()
+    plan = spec.plan
+    random.seed(plan.seed)
+    np.random.seed(plan.seed % (2 ** 32))
+    set_id_scheme(spec.id_scheme, spec.id_start, spec.id_step)
+    base = spec.base_datetime
+
+    connection = sqlite3.connect(spec.path, isolation_level=None)
+    try:
+        apply_bulk_load_pragmas(connection)
+        execute_sql_file(connection, spec.schema_path, spec.id_scheme, spec.timestamps, spec.text_storage)
+        writer = BulkWriter(
+            connection, batch_size=spec.batch_size, timestamps=spec.timestamps, text_storage=spec.text_storage
+        )
+        counts = {table: 0 for table in ORG_TABLES}
+
+        def write(table, rows):
+            counts[table] += writer.insert(table, map(ROW_CONVERTERS[table], rows))
+
+        writer.begin()
+        org = generate_organization(plan.index, plan.name, base)
+        write('organizations', [org])
+        users = ensure_role_distribution(generate_users(org.org_id, org.domain, plan.num_users, base))
+        write('users', users)
+        teams = generate_teams(org.org_id, base)
+        write('teams', teams)
+        write('team_memberships', generate_team_memberships(teams, users, base))
+        projects = generate_projects(org.org_id, teams, users, base, plan.projects_per_team)
+        write('projects', projects)
+        tags = generate_tags(org.org_id, base)
+        write('tags', tags)
+
+        for chunk in iter_project_chunks(projects, users, tags, base, spec.tasks_per_section, spec.vectorized):
+            write('sections', chunk.sections)
+            write('custom_field_definitions', chunk.custom_fields)
+            write('tasks', chunk.tasks)
+            write('subtasks', chunk.subtasks)
+            write('comments', chunk.comments)
+            write('custom_field_values', chunk.custom_field_values)
+            write('task_tags', chunk.task_tags)
+            write('task_dependencies', chunk.dependencies)
+        writer.commit()
+
+        if spec.index_schema_path:
+            execute_sql_file(connection, spec.index_schema_path)
+            if spec.text_storage == 'normalized':
+                create_text_views(connection)
+            if spec.timestamps == 'epoch':
+                create_iso_views(connection, spec.text_storage)
+    finally:
+        connection.close()
+    return OrgResult(
+        index=plan.index, org_id=org.org_id, name=org.name, domain=org.domain, path=spec.path,
+        seconds=round(time.perf_counter() - start, 6), counts=counts
+    )
+
+
+def generate_orgs(specs: List[OrgSpec], workers: int) -> Iterator[OrgResult]:
+    """
+    Run all orgs in a process pool, yielding results in org order as they
+    complete, so the caller can merge one org while later ones are generated
+    """
+    if workers == 1:
+        yield from map(run_org, specs)
+        return
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        yield from pool.map(run_org, specs)
+
+
+def org_dir_for(db_path) -> Path:
+    """<output stem>.orgs/ next to the output path, for per-org databases"""
+    path = Path(db_path)
+    return path.with_name(path.stem + '.orgs')
+
+
+def org_file_name(index: int) -> str:
+    return f"org_{index:05d}.sqlite"
+
+
+def write_org_manifest(org_dir, results: List[OrgResult], params: Dict) -> Path:
+    """orgs.json listing every per-org database with its org and row counts"""
+    path = Path(org_dir) / MANIFEST_NAME
+    manifest = {
+        'params': params,
+        'orgs': [dict(asdict(result), path=Path(result.path).name) for result in results],
+    }
+    with open(path, 'w') as f:
+        json.dump(manifest, f, indent=2, default=str)
+    return path
@@ -0,0 +1,200 @@
+# Per-stage timing and profiling for the generation pipeline
+import cProfile
+import json
+import os
+import sys
+import time
+import tracemalloc
+from contextlib import contextmanager
+from dataclasses import dataclass, asdict
+from pathlib import Path
+from typing import Dict, List, Optional
+
+try:
+    import resource
+except ImportError:  # not available on Windows
+    resource = None
+
+# The 11 stages of AsanaDataGenerator.generate_all, in order
+STAGES = [
+    'organizations', 'users', 'teams', 'team_memberships', 'projects', 'sections',
+    'tasks', 'subtasks', 'comments', 'tags_and_custom_fields', 'task_dependencies',
+]
+
+
+def peak_rss_kb() -> Optional[int]:
+    """Peak resident set size of this process in KiB (None where unsupported)"""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # macOS reports bytes, Linux reports KiB
+    return peak // 1024 if sys.platform == 'darwin' else peak
+
+
+def current_rss_kb() -> Optional[int]:
+    """Current resident set size of this process in KiB (None without /proc)"""
+    try:
+        with open('/proc/self/statm') as f:
+            resident_pages = int(f.read().split()[1])
+    except (OSError, IndexError, ValueError):
+        return None
+    return resident_pages * os.sysconf('SC_PAGE_SIZE') // 1024
+
+
+def _difference(after: Optional[int], before: Optional[int]) -> Optional[int]:
+    return after - before if after is not None and before is not None else None
+
+
+# Meaning of the memory fields, written into every report
+MEMORY_FIELDS = {
+    'peak_rss_growth_kb': "How far the step raised the process's peak RSS (ru_maxrss); "
+                          "0 when it stayed under an earlier peak",
+    'rss_delta_kb': "Current RSS (/proc/self/statm) after the step minus before; "
+                    "negative when memory was returned",
+    'tracemalloc_peak_kb': "Peak Python heap allocated during the step (--profile only)",
+    'peak_rss_kb': "Peak RSS of the whole process (top level only)",
+}
+
+
+@dataclass
+class StageRecord:
+    """One measured step: the generation or the insert half of a stage"""
+    stage: str
+    phase: str  # 'generate' or 'insert'
+    target: str  # entity or table name
+    seconds: float = 0.0
+    cpu_seconds: float = 0.0
+    rows: int = 0
+    # Per-step memory, see MEMORY_FIELDS (None where unsupported)
+    peak_rss_growth_kb: Optional[int] = None
+    rss_delta_kb: Optional[int] = None
+    # Only recorded with profile=True
+    tracemalloc_peak_kb: Optional[int] = None
+
+    @property
+    def rows_per_sec(self) -> float:
+        return self.rows / self.seconds if self.seconds > 0 else 0.0
+
+
+class StageRecorder:
+    """
+    Collects StageRecords while generate_all runs.
+
+    Wall time, CPU time, rows and RSS changes are cheap enough to record
+    on every run. The process peak only ever grows, so each step records
+    how much it raised the peak rather than the peak itself. With profile=True each step also records its tracemalloc
+    peak, and with a pstats_dir every stage gets its own cProfile dump.
+    With a writer thread the insert phase measures hand-off to the queue,
+    not the write itself, and cProfile only sees the generating thread.
+    """
+
+    def __init__(self, profile: bool = False, pstats_dir: Optional[str] = None):
+        self.records: List[StageRecord] = []
+        self.current_stage: Optional[str] = None
+        self.profile = profile
+        self.pstats_dir = Path(pstats_dir) if pstats_dir else None
+        self._profilers: Dict[str, cProfile.Profile] = {}
+        if profile and not tracemalloc.is_tracing():
+            tracemalloc.start()
+
+    @contextmanager
+    def measure(self, phase: str, target: str, stage: Optional[str] = None):
+        """Time the enclosed block; set .rows on the yielded record"""
+        record = StageRecord(stage or self.current_stage or target, phase, target)
+        profiler = None
+        if self.profile:
+            tracemalloc.reset_peak()
+            if self.pstats_dir is not None:
+                profiler = self._profilers.setdefault(record.stage, cProfile.Profile())
+                profiler.enable()
+        peak_before = peak_rss_kb()
+        rss_before = current_rss_kb()
+        cpu_start = time.process_time()
+        start = time.perf_counter()
+        try:
+            yield record
+        finally:
+            record.seconds = time.perf_counter() - start
+            record.cpu_seconds = time.process_time() - cpu_start
+            if profiler is not None:
+                profiler.disable()
+            if self.profile:
+                record.tracemalloc_peak_kb = tracemalloc.get_traced_memory()[1] // 1024
+            record.peak_rss_growth_kb = _difference(peak_rss_kb(), peak_before)
+            record.rss_delta_kb = _difference(current_rss_kb(), rss_before)
+            self.records.append(record)
+
+    def summary(self) -> List[Dict[str, object]]:
+        """Records folded per (stage, phase), in pipeline order"""
+        totals: Dict[tuple, StageRecord] = {}
+        for record in self.records:
+            key = (record.stage, record.phase)
+            total = totals.get(key)
+            if total is None:
+                total = totals[key] = StageRecord(record.stage, record.phase, record.stage)
+            total.seconds += record.seconds
+            total.cpu_seconds += record.cpu_seconds
+            total.rows += record.rows
+            # Both are changes, so a stage's steps add up
+            if record.peak_rss_growth_kb is not None:
+                total.peak_rss_growth_kb = (total.peak_rss_growth_kb or 0) + record.peak_rss_growth_kb
+            if record.rss_delta_kb is not None:
+                total.rss_delta_kb = (total.rss_delta_kb or 0) + record.rss_delta_kb
+            if record.tracemalloc_peak_kb is not None:
+                total.tracemalloc_peak_kb = max(total.tracemalloc_peak_kb or 0, record.tracemalloc_peak_kb)
+        return [
+            {
+                'stage': total.stage,
+                'phase': total.phase,
+                'seconds': round(total.seconds, 6),
+                'cpu_seconds': round(total.cpu_seconds, 6),
+                'rows': total.rows,
+                'rows_per_sec': round(total.rows_per_sec, 1),
+                'peak_rss_growth_kb': total.peak_rss_growth_kb,
+                'rss_delta_kb': total.rss_delta_kb,
+                'tracemalloc_peak_kb': total.tracemalloc_peak_kb,
+            }
+            for total in totals.values()
+        ]
+
+    def report(self) -> Dict[str, object]:
+        """Machine-readable report: folded stages plus the raw records"""
+        return {
+            'stages': self.summary(),
+            'records': [dict(asdict(r), rows_per_sec=round(r.rows_per_sec, 1)) for r in self.records],
+            'peak_rss_kb': peak_rss_kb(),
+            'memory_fields': MEMORY_FIELDS,
+        }
+
+    def dump_pstats(self) -> List[str]:
+        """Write one <stage>.pstats file per profiled stage; returns the paths"""
+        if self.pstats_dir is None:
+            return []
+        self.pstats_dir.mkdir(parents=True, exist_ok=True)
+        paths = []
+        for stage, profiler in self._profilers.items():
+            path = self.pstats_dir / f"{stage}.pstats"
+            profiler.dump_stats(str(path))
+            paths.append(str(path))
+        return paths
+
+    def write_report(self, path, **extra) -> Path:
+        """Write report() plus extra top-level fields and pstats paths as JSON"""
+        report = dict(extra, **self.report())
+        report['pstats'] = self.dump_pstats()
+        path = Path(path)
+        with open(path, 'w') as f:
+            json.dump(report, f, indent=2, default=str)
+        return path
+
+
+def profile_report_path(db_path) -> Path:
+    """Profile report written next to the database: <db stem>.profile.json"""
+    db_path = Path(db_path)
+    return db_path.with_name(db_path.stem + '.profile.json')
+
+
+def pstats_dir_for(db_path) -> Path:
+    """Directory for per-stage pstats dumps: <db stem>.pstats/"""
+    db_path = Path(db_path)
+    return db_path.with_name(db_path.stem + '.pstats')
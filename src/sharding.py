@@ -0,0 +1,116 @@
+# Multi-process sharded generation of project-level entities
+#
+# Sections, custom fields, tasks and everything hanging off a task only ever
+# reference rows of their own project. Projects are therefore partitioned
+# into shards; each shard runs the project-chunk pipeline in its own process,
+# with its own RNG stream, into its own SQLite file. The parent merges the
+# shard files into the final database afterwards.
+import random
+import shutil
+import sqlite3
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List
+
+import numpy as np
+
+from generators.streaming import iter_project_chunks
+from storage.rows import ROW_CONVERTERS
+from storage.sqlite_writer import (
+    BulkWriter, DEFAULT_BATCH_SIZE, apply_bulk_load_pragmas, execute_sql_file
+)
+from utils.helpers import set_id_scheme
+
+# Tables produced by a shard, in foreign-key order for merging
+SHARD_TABLES = [
+    'sections', 'custom_field_definitions', 'tasks', 'subtasks', 'comments',
+    'custom_field_values', 'task_tags', 'task_dependencies',
+]
+
+
+@dataclass
+class ShardSpec:
+    """Everything a worker process needs to generate one shard"""
+    index: int
+    path: str
+    seed: int
+    schema_path: str
+    projects: List
+    users: List
+    tags: List
+    base_datetime: datetime
+    tasks_per_section: int
+    batch_size: int = DEFAULT_BATCH_SIZE
+    vectorized: bool = False
+    id_scheme: str = 'uuid'
+    timestamps: str = 'iso'
+    text_storage: str = 'inline'
+    # This shard's slice of the int ID sequence (see IdAllocator.interleave)
+    id_start: int = 1
+    id_step: int = 1
+
+
+def partition_projects(projects: List, num_shards: int) -> List[List]:
+    """Round-robin projects over shards so large and small projects spread evenly"""
+    return [projects[i::num_shards] for i in range(num_shards)]
+
+
+def shard_seeds(base_seed: int, num_shards: int) -> List[int]:
+    """Independent per-shard seeds derived from one base seed"""
+    children = np.random.SeedSequence(base_seed).spawn(num_shards)
+    return [int(child.generate_state(1)[0]) for child in children]
+
+
+def run_shard(spec: ShardSpec) -> Dict[str, int]:
+    """Generate one shard into its own database; returns rows written per table"""
+    random.seed(spec.seed)
+    np.random.seed(spec.seed)
+    set_id_scheme(spec.id_scheme, spec.id_start, spec.id_step)
+    
+    connection = sqlite3.connect(spec.path, isolation_level=None)
+    try:
+        apply_bulk_load_pragmas(connection)
+        execute_sql_file(connection, spec.schema_path, spec.id_scheme, spec.timestamps, spec.text_storage)
+        writer = BulkWriter(
+            connection, batch_size=spec.batch_size, timestamps=spec.timestamps, text_storage=spec.text_storage
+        )
+        counts = {table: 0 for table in SHARD_TABLES}
+        
+        writer.begin()
+        chunks = iter_project_chunks(
+            spec.projects, spec.users, spec.tags, spec.base_datetime, spec.tasks_per_section,
+            spec.vectorized
+        )
+        for chunk in chunks:
+            for table, rows in (
+                ('sections', chunk.sections),
+                ('custom_field_definitions', chunk.custom_fields),
+                ('tasks', chunk.tasks),
+                ('subtasks', chunk.subtasks),
+                ('comments', chunk.comments),
+                ('custom_field_values', chunk.custom_field_values),
+                ('task_tags', chunk.task_tags),
+                ('task_dependencies', chunk.dependencies),
+            ):
+                counts[table] += writer.insert(table, map(ROW_CONVERTERS[table], rows))
+        writer.commit()
+        return counts
+    finally:
+        connection.close()
+
+
+def generate_shards(specs: List[ShardSpec], workers: int) -> List[Dict[str, int]]:
+    """Run all shards in a process pool; results are returned in shard order"""
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(run_shard, specs))
+
+
+def make_shard_dir(db_path: str) -> Path:
+    """Fresh scratch directory for shard databases next to the output file"""
+    shard_dir = Path(f"{db_path}.shards")
+    if shard_dir.exists():
+        shutil.rmtree(shard_dir)
+    shard_dir.mkdir(parents=True)
+    return shard_dir
@@ -0,0 +1 @@
+# Storage layer package (row layouts and database writers)
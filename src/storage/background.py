@@ -0,0 +1,182 @@
+# Background writer thread for overlapping generation with SQLite writes
+import queue
+import threading
+import time
+import logging
+import sqlite3
+from typing import Iterable, List, Optional
+
+from storage.sqlite_writer import BulkWriter, DEFAULT_BATCH_SIZE
+from utils.helpers import batch_insert_values
+
+DEFAULT_QUEUE_DEPTH = 8
+
+# Seconds between checks for a failed writer while the producer is blocked
+_PUT_POLL_SECONDS = 0.1
+
+_STOP = object()
+
+
+class WriterThreadError(RuntimeError):
+    """Raised in the producer when the writer thread failed"""
+
+
+class BackgroundWriter:
+    """
+    Producer/consumer front end for BulkWriter.
+    
+    insert() converts rows into tuple batches on the calling (generator)
+    thread and pushes them onto a bounded queue; a dedicated thread owns the
+    sqlite3 connection and drains the queue inside one transaction. A full
+    queue blocks the producer (backpressure). If the writer thread fails, the
+    next insert() or commit() on the producer side re-raises its error.
+    
+    The connection must be opened with check_same_thread=False; the caller
+    must not touch it between begin() and commit()/rollback().
+    """
+
+    def __init__(self, connection: sqlite3.Connection, batch_size: int = DEFAULT_BATCH_SIZE,
+                 queue_depth: int = DEFAULT_QUEUE_DEPTH, timestamps: str = 'iso',
+                 text_storage: str = 'inline'):
+        if queue_depth < 1:
+            raise ValueError("queue_depth must be at least 1")
+        self.connection = connection
+        self.batch_size = batch_size
+        self._bulk = BulkWriter(
+            connection, batch_size=batch_size, timestamps=timestamps, text_storage=text_storage
+        )
+        self._queue: "queue.Queue" = queue.Queue(maxsize=queue_depth)
+        self._thread: Optional[threading.Thread] = None
+        self._error: Optional[BaseException] = None
+        self._started_at = 0.0
+        self._wall_seconds = 0.0
+        self._blocked_seconds = 0.0
+        self._max_queue_size = 0
+
+    @property
+    def stats(self):
+        return self._bulk.stats
+
+    # ------------------------------------------------------------------
+    # Writer thread
+    # ------------------------------------------------------------------
+    def _run(self):
+        try:
+            self._bulk.begin()
+            while True:
+                item = self._queue.get()
+                if item is _STOP:
+                    return
+                op, table, batch = item
+                if op == 'insert':
+                    self._bulk.insert(table, batch)
+                elif op == 'insert_encoded':
+                    self._bulk.insert(table, batch, encoded=True)
+                elif op == 'commit':
+                    self._bulk.commit()
+                elif op == 'rollback':
+                    self._bulk.rollback()
+        except BaseException as e:  # surfaced to the producer via _check()
+            self._error = e
+            try:
+                self._bulk.rollback()
+            except sqlite3.Error:
+                pass
+            # Keep draining so a blocked producer can observe the error
+            while self._queue.get() is not _STOP:
+                pass
+
+    def _check(self):
+        if self._error is not None:
+            raise WriterThreadError(f"writer thread failed: {self._error!r}") from self._error
+
+    def _put(self, item):
+        start = time.perf_counter()
+        while True:
+            self._check()
+            try:
+                self._queue.put(item, timeout=_PUT_POLL_SECONDS)
+                break
+            except queue.Full:
+                continue
+        self._blocked_seconds += time.perf_counter() - start
+        self._max_queue_size = max(self._max_queue_size, self._queue.qsize())
+
+    def _finish(self, op: str):
+        if self._thread is None:
+            return
+        if self._thread.is_alive():
+            self._queue.put((op, None, None))
+            self._queue.put(_STOP)
+            self._thread.join()
+        self._thread = None
+        # Accumulates over begin()/commit() cycles (one per checkpointed stage)
+        self._wall_seconds += time.perf_counter() - self._started_at
+
+    # ------------------------------------------------------------------
+    # BulkWriter-compatible interface
+    # ------------------------------------------------------------------
+    def begin(self):
+        """Start the writer thread, which opens the load transaction"""
+        if self._thread is not None:
+            return
+        self._error = None
+        self._started_at = time.perf_counter()
+        self._thread = threading.Thread(target=self._run, name="sqlite-writer", daemon=True)
+        self._thread.start()
+
+    def insert(self, table: str, rows: Iterable[tuple], encoded: bool = False) -> int:
+        """Queue row tuples for table (see BulkWriter.insert); returns the number of rows queued"""
+        if self._thread is None:
+            raise RuntimeError("begin() must be called before insert()")
+        op = 'insert_encoded' if encoded else 'insert'
+        count = 0
+        for batch in batch_insert_values(rows, self.batch_size):
+            self._put((op, table, batch))
+            count += len(batch)
+        return count
+
+    def commit(self):
+        """Flush the queue, commit and stop the writer thread"""
+        self._finish('commit')
+        self._check()
+
+    def rollback(self):
+        """Discard queued work, roll back and stop the writer thread"""
+        self._finish('rollback')
+
+    def report(self) -> List[dict]:
+        return self._bulk.report()
+
+    def overlap_report(self) -> dict:
+        """
+        How much generation and writing overlapped.
+        
+        write_seconds is time the writer thread spent in executemany;
+        generate_seconds is producer time not spent blocked on a full queue.
+        Perfectly serial execution gives overlap_seconds == 0.
+        """
+        write_seconds = sum(s.seconds for s in self._bulk.stats.values())
+        generate_seconds = max(self._wall_seconds - self._blocked_seconds, 0.0)
+        overlap = max(generate_seconds + write_seconds - self._wall_seconds, 0.0)
+        shorter = min(generate_seconds, write_seconds)
+        return {
+            'wall_seconds': round(self._wall_seconds, 6),
+            'generate_seconds': round(generate_seconds, 6),
+            'write_seconds': round(write_seconds, 6),
+            'producer_blocked_seconds': round(self._blocked_seconds, 6),
+            'overlap_seconds': round(overlap, 6),
+            'overlap_ratio': round(overlap / shorter, 3) if shorter > 0 else 0.0,
+            'max_queue_size': self._max_queue_size,
+        }
+
+    def log_report(self, logger: logging.Logger):
+        self._bulk.log_report(logger)
+        overlap = self.overlap_report()
+        logger.info(
+            f"writer thread: wall {overlap['wall_seconds']:.3f}s, "
+            f"generate {overlap['generate_seconds']:.3f}s, "
+            f"write {overlap['write_seconds']:.3f}s, "
+            f"overlap {overlap['overlap_seconds']:.3f}s ({overlap['overlap_ratio']:.0%}), "
+            f"producer blocked {overlap['producer_blocked_seconds']:.3f}s"
+        )
@@ -0,0 +1,245 @@
+# Stage checkpoints for generate_all (--resume)
+#
+# Every stage of the staged pipeline commits on its own, then appends a
+# record to <output>.checkpoint: the stage name, its row counts and the
+# state of every RNG (random, numpy's global state and the ID allocator)
+# at that point. --resume reloads the entities the remaining stages read
+# from the database, restores that RNG state and continues with the first
+# unfinished stage, so the result matches an uninterrupted seeded run. The
+# file sits next to the database rather than in it, so a finished database
+# carries no trace of the checkpoints; it is removed when the run completes.
+import os
+import pickle
+import random
+import sqlite3
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from models import Organization, User, Team, Project, Section, Task
+from models.columnar import entity_columns
+from profiling import STAGES
+from storage.rows import TABLE_COLUMNS
+from storage.workspace import UserRef, load_rows
+from utils.helpers import id_allocator, use_id_allocator
+
+CHECKPOINT_SUFFIX = '.checkpoint'
+
+# Tables written by each stage of generate_all
+STAGE_TABLES = {
+    'organizations': ['organizations'],
+    'users': ['users'],
+    'teams': ['teams'],
+    'team_memberships': ['team_memberships'],
+    'projects': ['projects'],
+    'sections': ['sections'],
+    'tasks': ['tasks'],
+    'subtasks': ['subtasks'],
+    'comments': ['comments'],
+    'tags_and_custom_fields': ['tags', 'custom_field_definitions', 'custom_field_values', 'task_tags'],
+    'task_dependencies': ['task_dependencies'],
+}
+
+# Entity lists that later stages read, by the stages reading them. A resume
+# only loads what some unfinished stage still needs. Users are always loaded
+# (they seed the RelationshipIndex), as full rows only while team
+# memberships are pending: lead picks look at role and seniority.
+READ_BY = {
+    'organizations': ('users', 'teams', 'projects', 'tags_and_custom_fields'),
+    'teams': ('team_memberships', 'projects'),
+    'projects': ('sections', 'tasks', 'tags_and_custom_fields'),
+    'sections': ('tasks',),
+    'tasks': ('subtasks', 'comments', 'tags_and_custom_fields', 'task_dependencies'),
+}
+
+_MODELS = {
+    'organizations': Organization,
+    'teams': Team,
+    'projects': Project,
+    'sections': Section,
+    'tasks': Task,
+}
+
+
+class CheckpointError(RuntimeError):
+    """Raised when a checkpoint cannot be resumed against its database"""
+
+
+@dataclass
+class CheckpointRecord:
+    """One finished stage"""
+    stage: str
+    rows: Dict[str, int]
+    seconds: float
+    finished_at: str
+    # Keys in generation order, kept where rowid order differs from it:
+    # gid keys are scattered rowid aliases, so the table is stored sorted by id
+    key_order: Optional[np.ndarray] = None
+
+
+@dataclass
+class Checkpoint:
+    """
+    Progress of one generate_all run: the settings that determine its output
+    and the stages finished so far, with the RNG state after the last one
+    """
+    params: Dict[str, object]
+    records: List[CheckpointRecord] = field(default_factory=list)
+    rng_state: Optional[bytes] = None
+
+    @property
+    def finished(self) -> List[str]:
+        return [record.stage for record in self.records]
+
+    @property
+    def next_stage(self) -> Optional[str]:
+        """First unfinished stage (None once all 11 are done)"""
+        return STAGES[len(self.records)] if len(self.records) < len(STAGES) else None
+
+    @property
+    def row_counts(self) -> Dict[str, int]:
+        counts = {}
+        for record in self.records:
+            counts.update(record.rows)
+        return counts
+
+
+def checkpoint_path_for(db_path) -> Path:
+    """<output>.checkpoint next to the database"""
+    return Path(str(db_path) + CHECKPOINT_SUFFIX)
+
+
+def capture_rng_state() -> bytes:
+    """random, numpy and the ID allocator (with its buffered UUIDs), pickled"""
+    return pickle.dumps((random.getstate(), np.random.get_state(), id_allocator()))
+
+
+def restore_rng_state(state: bytes):
+    """Put every RNG back where capture_rng_state() found it"""
+    python_state, numpy_state, allocator = pickle.loads(state)
+    random.setstate(python_state)
+    np.random.set_state(numpy_state)
+    use_id_allocator(allocator)
+
+
+def write_checkpoint(path, checkpoint: Checkpoint):
+    """Replace path atomically, so a crash mid-write keeps the previous record"""
+    path = Path(path)
+    partial = path.with_name(path.name + '.partial')
+    with open(partial, 'wb') as f:
+        pickle.dump(checkpoint, f, protocol=pickle.HIGHEST_PROTOCOL)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(partial, path)
+
+
+def read_checkpoint(path) -> Checkpoint:
+    with open(path, 'rb') as f:
+        checkpoint = pickle.load(f)
+    if not isinstance(checkpoint, Checkpoint):
+        raise CheckpointError(f"{path} is not a generation checkpoint")
+    return checkpoint
+
+
+class CheckpointLog:
+    """Appends a record to the checkpoint file after each committed stage"""
+
+    def __init__(self, path, params: Dict[str, object]):
+        self.path = Path(path)
+        self.checkpoint = Checkpoint(params=params)
+
+    @classmethod
+    def resume(cls, path, checkpoint: Checkpoint) -> "CheckpointLog":
+        log = cls(path, checkpoint.params)
+        log.checkpoint = checkpoint
+        return log
+
+    def record(self, stage: str, rows: Dict[str, int], seconds: float, entities: Optional[List] = None):
+        """
+        Record a committed stage. entities is the list later stages read
+        (if any), whose order is kept for gid keys.
+        """
+        expected = self.checkpoint.next_stage
+        if stage != expected:
+            raise CheckpointError(f"stage {stage!r} finished out of order (expected {expected!r})")
+        key_order = None
+        if entities is not None and self.checkpoint.params['id_scheme'] == 'gid':
+            key = TABLE_COLUMNS[stage][0]
+            key_order = np.array([k for k, in entity_columns(entities, key)], dtype=np.int64)
+        self.checkpoint.records.append(CheckpointRecord(
+            stage=stage, rows=dict(rows), seconds=round(seconds, 6),
+            finished_at=datetime.now().isoformat(timespec='seconds'), key_order=key_order
+        ))
+        self.checkpoint.rng_state = capture_rng_state()
+        write_checkpoint(self.path, self.checkpoint)
+
+    def remove(self):
+        if self.path.exists():
+            self.path.unlink()
+
+
+def check_row_counts(connection: sqlite3.Connection, checkpoint: Checkpoint) -> List[str]:
+    """Tables of finished stages whose row count differs from the checkpoint"""
+    problems = []
+    for table, expected in checkpoint.row_counts.items():
+        actual = connection.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+        if actual != expected:
+            problems.append(f"{table}: {actual} rows, checkpoint recorded {expected}")
+    return problems
+
+
+def discard_unfinished(connection: sqlite3.Connection, checkpoint: Checkpoint) -> Dict[str, int]:
+    """
+    Delete whatever unfinished stages left behind: the stage that committed
+    just before a crash but was never recorded, or the partial rows of a
+    bulk load (journal_mode=OFF cannot roll back). Returns rows deleted per
+    table; children go before parents.
+    """
+    deleted = {}
+    pending = STAGES[len(checkpoint.records):]
+    connection.execute("BEGIN")
+    try:
+        for stage in reversed(pending):
+            for table in reversed(STAGE_TABLES[stage]):
+                count = connection.execute(f"DELETE FROM {table}").rowcount
+                if count:
+                    deleted[table] = count
+        connection.execute("COMMIT")
+    except BaseException:
+        connection.execute("ROLLBACK")
+        raise
+    return deleted
+
+
+def _in_generation_order(rows: List, key: str, key_order: Optional[np.ndarray]) -> List:
+    if key_order is None:
+        return rows
+    by_key = {getattr(row, key): row for row in rows}
+    return [by_key[k] for k in key_order.tolist()]
+
+
+def load_finished_entities(connection: sqlite3.Connection, checkpoint: Checkpoint,
+                           timestamps: str = 'iso') -> Dict[str, List]:
+    """
+    Entity lists of finished stages that an unfinished stage still reads,
+    in the order the interrupted run generated them in
+    """
+    records = {record.stage: record for record in checkpoint.records}
+    pending = set(STAGES) - set(records)
+    entities = {}
+    if 'users' in records:
+        if 'team_memberships' in pending:
+            users = load_rows(connection, 'users', User, timestamps)
+        else:
+            users = [
+                UserRef(user_id) for user_id, in connection.execute("SELECT user_id FROM users ORDER BY rowid")
+            ]
+        entities['users'] = _in_generation_order(users, 'user_id', records['users'].key_order)
+    for table, readers in READ_BY.items():
+        if table in records and pending.intersection(readers):
+            rows = load_rows(connection, table, _MODELS[table], timestamps)
+            entities[table] = _in_generation_order(rows, TABLE_COLUMNS[table][0], records[table].key_order)
+    return entities
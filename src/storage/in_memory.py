@@ -0,0 +1,85 @@
+# In-memory builds (--in-memory-build)
+#
+# The whole workspace is built in a :memory: connection, so the load never
+# syncs or rewrites pages on disk, and is persisted to the output path in
+# one pass at the end with the backup API (or VACUUM INTO for a compacted
+# file). A size guard keeps builds that would not fit in RAM on disk.
+import os
+import sqlite3
+import time
+from pathlib import Path
+from typing import Optional
+
+# Calibrated on uuid-keyed builds (the largest scheme) including indexes:
+# every task brings its subtasks, comments, custom field values, tags and
+# dependencies along
+ESTIMATED_TEAMS = 15
+BYTES_PER_TASK = 3200
+BYTES_PER_USER = 1024
+BASE_BYTES = 256 * 1024
+
+# Share of available RAM an in-memory build may use; the rest is left for
+# the generator's Python objects and the rest of the system
+MEMORY_BUILD_FRACTION = 0.5
+
+
+def estimate_database_bytes(num_users: int, projects_per_team: int, tasks_per_section: int) -> int:
+    """
+    Upper-end estimate of the finished database size. Generators draw up to
+    projects_per_team + 2 projects per team and about tasks_per_section
+    tasks per active project.
+    """
+    projects = ESTIMATED_TEAMS * (projects_per_team + 0.5)
+    tasks = projects * (tasks_per_section + 1.5)
+    return int(BASE_BYTES + num_users * BYTES_PER_USER + tasks * BYTES_PER_TASK)
+
+
+def available_memory_bytes() -> Optional[int]:
+    """Memory available to new allocations (None where it cannot be determined)"""
+    try:
+        with open('/proc/meminfo') as f:
+            for line in f:
+                if line.startswith('MemAvailable:'):
+                    return int(line.split()[1]) * 1024
+    except OSError:
+        pass
+    try:
+        return os.sysconf('SC_AVPHYS_PAGES') * os.sysconf('SC_PAGE_SIZE')
+    except (AttributeError, ValueError, OSError):
+        return None
+
+
+def fits_in_memory(expected_bytes: Optional[int]) -> bool:
+    """True unless the expected size exceeds MEMORY_BUILD_FRACTION of available RAM"""
+    available = available_memory_bytes()
+    if expected_bytes is None or available is None:
+        return True
+    return expected_bytes <= available * MEMORY_BUILD_FRACTION
+
+
+def persist_database(connection: sqlite3.Connection, path, compact: bool = False) -> float:
+    """
+    Write an in-memory database to path in one pass; returns seconds taken.
+
+    The backup API copies pages as they are. compact uses VACUUM INTO,
+    which rebuilds every table and index into a fresh, defragmented file at
+    the cost of a slower copy. Either way the file is written next to path
+    and renamed over it, so path never holds a partial database.
+    """
+    if connection.in_transaction:
+        raise RuntimeError("persist_database must run outside a transaction")
+    path = Path(path)
+    partial = path.with_name(path.name + '.partial')
+    if partial.exists():
+        partial.unlink()
+    start = time.perf_counter()
+    if compact:
+        connection.execute("VACUUM INTO ?", (str(partial),))
+    else:
+        target = sqlite3.connect(str(partial))
+        try:
+            connection.backup(target)
+        finally:
+            target.close()
+    os.replace(partial, path)
+    return time.perf_counter() - start
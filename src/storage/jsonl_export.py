@@ -0,0 +1,357 @@
+# Sharded .jsonl.gz export (--jsonl-dir, src/export.py)
+#
+# Every table (or the denormalized task view) becomes a directory of
+# fixed-size shards, <dir>/<table>/part-00000.jsonl.gz, plus one
+# manifest.json with row counts, sizes and SHA-256 checksums per shard.
+# Rows are JSON-encoded on the calling thread; gzip runs in a process pool
+# so it does not serialize on one core.
+import gzip
+import hashlib
+import json
+import logging
+import os
+import shutil
+import sqlite3
+import time
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from datetime import date, datetime
+from pathlib import Path
+from typing import Deque, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from generators.texts import TASK_NAME_MARKER
+from storage.rows import (
+    TABLE_COLUMNS, REAL_COLUMNS, TEMPORAL_COLUMNS, TEXT_COLUMNS, render_texts, text_positions
+)
+from storage.sqlite_writer import TableStats, WriterReport, iso_expression
+from storage.workspace import detect_text_storage, detect_timestamps
+from utils.helpers import batch_insert_values
+
+DEFAULT_SHARD_ROWS = 100_000
+DEFAULT_COMPRESS_WORKERS = max(1, (os.cpu_count() or 1) - 1)
+DEFAULT_COMPRESSLEVEL = 6
+# Rows fetched per cursor.fetchmany() when exporting from a database
+EXPORT_FETCH_SIZE = 10_000
+
+MANIFEST_NAME = 'manifest.json'
+
+# One row per task with its project, team, section, people, tags and counts
+# (format with task_view_sql)
+TASK_VIEW = 'task_view'
+TASK_VIEW_SQL = """
+    SELECT
+        t.task_id, t.name, {description} AS description, t.status, t.priority, t.is_completed,
+        {temporal},
+        t.estimated_hours, t.actual_hours,
+        p.project_id, p.name AS project_name, p.project_type, p.status AS project_status,
+        tm.team_id, tm.name AS team_name, tm.team_type,
+        s.section_id, s.name AS section_name,
+        a.user_id AS assignee_id, a.full_name AS assignee_name, a.email AS assignee_email,
+        a.department AS assignee_department,
+        c.user_id AS created_by_user_id, c.full_name AS created_by_name,
+        (SELECT json_group_array(g.name) FROM task_tags tt JOIN tags g ON g.tag_id = tt.tag_id
+         WHERE tt.task_id = t.task_id) AS tags,
+        (SELECT COUNT(*) FROM subtasks st WHERE st.task_id = t.task_id) AS subtask_count,
+        (SELECT COUNT(*) FROM comments cm WHERE cm.task_id = t.task_id) AS comment_count,
+        (SELECT COUNT(*) FROM task_dependencies d WHERE d.task_id = t.task_id) AS dependency_count
+    FROM tasks t
+    JOIN projects p ON p.project_id = t.project_id
+    JOIN teams tm ON tm.team_id = p.team_id
+    JOIN sections s ON s.section_id = t.section_id
+    LEFT JOIN users a ON a.user_id = t.assignee_id
+    LEFT JOIN users c ON c.user_id = t.created_by_user_id{text_join}
+    ORDER BY t.rowid
+"""
+
+
+# The task view's date/timestamp columns, in view order
+TASK_VIEW_TEMPORAL_COLUMNS = ('created_at', 'start_date', 'due_date', 'completed_at')
+
+
+def task_view_sql(normalized: bool = False, timestamps: str = 'iso') -> str:
+    """
+    TASK_VIEW_SQL for a database with inline or normalized text storage and
+    iso or epoch timestamps; the view always reads as text and ISO strings
+    """
+    kinds = TEMPORAL_COLUMNS['tasks']
+    temporal = ', '.join(
+        f"{iso_expression('t.' + column, kinds[column])} AS {column}" if timestamps == 'epoch' else f"t.{column}"
+        for column in TASK_VIEW_TEMPORAL_COLUMNS
+    )
+    if not normalized:
+        return TASK_VIEW_SQL.format(description='t.description', temporal=temporal, text_join='')
+    return TASK_VIEW_SQL.format(
+        description=f"replace(b.body, '{TASK_NAME_MARKER}', t.name)",
+        temporal=temporal,
+        text_join="\n    LEFT JOIN text_bodies b ON b.text_id = t.description"
+    )
+
+
+# Columns SQLite hands back as JSON text, embedded as JSON values
+_JSON_TEXT_COLUMNS = {'tags'}
+
+
+def _json_default(value):
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    raise TypeError(f"{type(value).__name__} is not JSON serializable")
+
+
+_ENCODER = json.JSONEncoder(ensure_ascii=False, separators=(',', ':'), default=_json_default)
+
+
+def encode_lines(columns: Sequence[str], rows: Iterable[tuple]) -> bytes:
+    """
+    JSON Lines for row tuples. Values are normalized to the schema types:
+    SQLite's 0/1 booleans (is_* columns) become true/false, REAL columns
+    are always floats and JSON text columns are embedded as values, so a
+    database export (of any storage mode, see export_database) and a
+    pipeline export of the same data are identical.
+    """
+    booleans = [i for i, c in enumerate(columns) if c.startswith('is_')]
+    reals = [i for i, c in enumerate(columns) if c in REAL_COLUMNS]
+    json_text = [i for i, c in enumerate(columns) if c in _JSON_TEXT_COLUMNS]
+    encode = _ENCODER.encode
+    lines = []
+    for row in rows:
+        if booleans or reals or json_text:
+            row = list(row)
+            for i in booleans:
+                if row[i] is not None:
+                    row[i] = bool(row[i])
+            for i in reals:
+                if row[i] is not None:
+                    row[i] = float(row[i])
+            for i in json_text:
+                if row[i] is not None:
+                    row[i] = json.loads(row[i])
+        lines.append(encode(dict(zip(columns, row))))
+    lines.append('')
+    return '\n'.join(lines).encode('utf-8')
+
+
+def compress_shard(path: str, payload: bytes, compresslevel: int = DEFAULT_COMPRESSLEVEL) -> Tuple[int, str]:
+    """
+    Gzip payload to path (mtime 0, so identical data gives identical files);
+    returns (compressed bytes, SHA-256 hex digest). Runs in a pool worker.
+    """
+    data = gzip.compress(payload, compresslevel=compresslevel, mtime=0)
+    with open(path, 'wb') as f:
+        f.write(data)
+    return len(data), hashlib.sha256(data).hexdigest()
+
+
+class JsonlShardWriter(WriterReport):
+    """
+    BulkWriter-compatible sink writing sharded .jsonl.gz datasets.
+
+    insert() buffers rows per table and cuts a shard every shard_rows rows.
+    The shard is encoded here and handed to a process pool for compression;
+    at most 2 x workers shards are in flight, which bounds memory. With
+    workers=1 compression runs inline. Files are staged under
+    <output_dir>.tmp; commit() waits for the pool, writes manifest.json
+    and renames the directory into place.
+    """
+
+    def __init__(self, output_dir, shard_rows: int = DEFAULT_SHARD_ROWS,
+                 workers: int = DEFAULT_COMPRESS_WORKERS, compresslevel: int = DEFAULT_COMPRESSLEVEL):
+        if shard_rows < 1:
+            raise ValueError("shard_rows must be at least 1")
+        if workers < 1:
+            raise ValueError("workers must be at least 1")
+        self.output_dir = Path(output_dir)
+        self.shard_rows = shard_rows
+        self.workers = workers
+        self.compresslevel = compresslevel
+        self.stats: Dict[str, TableStats] = {}
+        self.manifest: Dict[str, dict] = {}
+        self._staging: Optional[Path] = None
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._columns: Dict[str, Sequence[str]] = {}
+        self._buffers: Dict[str, List[tuple]] = {}
+        self._pending: Deque[Tuple[dict, Future]] = deque()
+
+    def _cut_shard(self, table: str, rows: List[tuple]):
+        """Encode rows as the table's next shard and queue it for compression"""
+        entry = self.manifest.setdefault(table, {'columns': list(self._columns[table]), 'rows': 0, 'shards': []})
+        name = f"part-{len(entry['shards']):05d}.jsonl.gz"
+        (self._staging / table).mkdir(exist_ok=True)
+        path = str(self._staging / table / name)
+        payload = encode_lines(self._columns[table], rows)
+        shard = {'file': f"{table}/{name}", 'rows': len(rows), 'uncompressed_bytes': len(payload)}
+        entry['shards'].append(shard)
+        entry['rows'] += len(rows)
+        if self._pool is None:
+            shard['bytes'], shard['sha256'] = compress_shard(path, payload, self.compresslevel)
+            return
+        self._pending.append((shard, self._pool.submit(compress_shard, path, payload, self.compresslevel)))
+        while len(self._pending) > 2 * self.workers:
+            self._collect_oldest()
+
+    def _collect_oldest(self):
+        shard, future = self._pending.popleft()
+        shard['bytes'], shard['sha256'] = future.result()
+
+    def begin(self):
+        """Start a fresh staging directory and the compression pool"""
+        if self._staging is not None:
+            return
+        self._staging = self.output_dir.with_name(self.output_dir.name + '.tmp')
+        if self._staging.exists():
+            shutil.rmtree(self._staging)
+        self._staging.mkdir(parents=True)
+        if self.workers > 1:
+            self._pool = ProcessPoolExecutor(max_workers=self.workers)
+
+    def insert(self, table: str, rows: Iterable[tuple], columns: Optional[Sequence[str]] = None) -> int:
+        """
+        Buffer row tuples for table, cutting full shards; returns rows accepted.
+        columns defaults to TABLE_COLUMNS[table] (needed for views). Text ids
+        are rendered, so the export holds text with either --text-storage.
+        """
+        if self._staging is None:
+            raise RuntimeError("begin() must be called before insert()")
+        self._columns.setdefault(table, columns or TABLE_COLUMNS[table])
+        buffer = self._buffers.setdefault(table, [])
+        texts = text_positions(table)
+        count = 0
+        start = time.perf_counter()
+        for batch in batch_insert_values(rows, self.shard_rows):
+            buffer.extend(render_texts(batch, texts))
+            count += len(batch)
+            while len(buffer) >= self.shard_rows:
+                self._cut_shard(table, buffer[:self.shard_rows])
+                del buffer[:self.shard_rows]
+        elapsed = time.perf_counter() - start
+
+        stats = self.stats.setdefault(table, TableStats())
+        stats.rows += count
+        stats.seconds += elapsed
+        return count
+
+    def commit(self):
+        """Cut partial shards, wait for compression and write the manifest"""
+        if self._staging is None:
+            return
+        for table, buffer in self._buffers.items():
+            if buffer:
+                start = time.perf_counter()
+                self._cut_shard(table, buffer)
+                self.stats[table].seconds += time.perf_counter() - start
+        self._buffers.clear()
+        while self._pending:
+            self._collect_oldest()
+        self._shutdown_pool()
+        manifest = {
+            'format': 'jsonl.gz',
+            'shard_rows': self.shard_rows,
+            'compresslevel': self.compresslevel,
+            'tables': self.manifest,
+        }
+        with open(self._staging / MANIFEST_NAME, 'w') as f:
+            json.dump(manifest, f, indent=2)
+        if self.output_dir.exists():
+            shutil.rmtree(self.output_dir)
+        os.replace(self._staging, self.output_dir)
+        self._staging = None
+
+    def rollback(self):
+        """Discard buffered rows, in-flight shards and everything written since begin()"""
+        self._buffers.clear()
+        for _, future in self._pending:
+            future.cancel()
+        self._pending.clear()
+        self._shutdown_pool()
+        self.manifest.clear()
+        if self._staging is not None:
+            shutil.rmtree(self._staging, ignore_errors=True)
+            self._staging = None
+
+    def _shutdown_pool(self):
+        if self._pool is not None:
+            self._pool.shutdown(wait=True)
+            self._pool = None
+
+    def log_report(self, logger: logging.Logger):
+        super().log_report(logger)
+        logger.info(f"JSONL shards written to {self.output_dir}")
+
+
+def export_database(db_path, output_dir, tables: Optional[Sequence[str]] = None,
+                    task_view: bool = False, shard_rows: int = DEFAULT_SHARD_ROWS,
+                    workers: int = DEFAULT_COMPRESS_WORKERS,
+                    compresslevel: int = DEFAULT_COMPRESSLEVEL) -> JsonlShardWriter:
+    """
+    Export tables (default: all) and optionally the denormalized task view
+    from a finished database, reading each with a chunked cursor. Normalized
+    text and epoch timestamps are read through the <table>_text and
+    <table>_iso views, so every storage mode exports the same shards.
+    Returns the writer, whose manifest and report describe the export.
+    """
+    tables = list(TABLE_COLUMNS) if tables is None else list(tables)
+    writer = JsonlShardWriter(output_dir, shard_rows=shard_rows, workers=workers, compresslevel=compresslevel)
+    # Read-only: an export must never create or modify the database
+    connection = sqlite3.connect(f"file:{Path(db_path).resolve()}?mode=ro", uri=True)
+    try:
+        writer.begin()
+        normalized = detect_text_storage(connection) == 'normalized'
+        timestamps = detect_timestamps(connection)
+        queries = [
+            (table, f"SELECT {', '.join(TABLE_COLUMNS[table])} "
+                    f"FROM {export_source(table, normalized, timestamps)}")
+            for table in tables
+        ]
+        if task_view:
+            queries.append((TASK_VIEW, task_view_sql(normalized, timestamps)))
+        for name, sql in queries:
+            cursor = connection.execute(sql)
+            columns = [d[0] for d in cursor.description]
+            writer.insert(name, _fetch_chunks(cursor), columns=columns)
+        writer.commit()
+    except BaseException:
+        writer.rollback()
+        raise
+    finally:
+        connection.close()
+    return writer
+
+
+def export_source(table: str, normalized: bool, timestamps: str) -> str:
+    """
+    The table or view export_database reads: <table>_iso decodes epoch
+    timestamps (and reads <table>_text itself under normalized storage),
+    <table>_text renders text ids
+    """
+    if timestamps == 'epoch' and table in TEMPORAL_COLUMNS:
+        return f"{table}_iso"
+    if normalized and table in TEXT_COLUMNS:
+        return f"{table}_text"
+    return table
+
+
+def _fetch_chunks(cursor: sqlite3.Cursor):
+    while True:
+        rows = cursor.fetchmany(EXPORT_FETCH_SIZE)
+        if not rows:
+            return
+        yield from rows
+
+
+def verify_manifest(output_dir) -> List[str]:
+    """Check every shard against manifest.json; returns a list of problems (empty if intact)"""
+    output_dir = Path(output_dir)
+    with open(output_dir / MANIFEST_NAME) as f:
+        manifest = json.load(f)
+    problems = []
+    for table, entry in manifest['tables'].items():
+        for shard in entry['shards']:
+            path = output_dir / shard['file']
+            if not path.exists():
+                problems.append(f"{shard['file']}: missing")
+                continue
+            data = path.read_bytes()
+            if hashlib.sha256(data).hexdigest() != shard['sha256']:
+                problems.append(f"{shard['file']}: checksum mismatch")
+            elif gzip.decompress(data).count(b'\n') != shard['rows']:
+                problems.append(f"{shard['file']}: row count mismatch")
+    return problems
@@ -0,0 +1,193 @@
+# Parquet output backend (--format parquet / both)
+#
+# Writes one Parquet dataset per schema table, <dir>/<table>/part-00000.parquet,
+# straight from the row tuples the generators produce. pyarrow is optional:
+# it is only imported when a ParquetWriter is created.
+import logging
+import os
+import shutil
+import time
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+from storage.rows import TABLE_COLUMNS, TEMPORAL_COLUMNS, REAL_COLUMNS, render_texts, text_positions
+from storage.sqlite_writer import TableStats, WriterReport
+from utils.helpers import batch_insert_values
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # optional dependency
+    pa = pq = None
+
+OUTPUT_FORMATS = ('sqlite', 'parquet', 'both')
+
+# Rows per Parquet row group: small enough to read a table in bounded-memory
+# batches, large enough for dictionary pages and statistics to pay off
+DEFAULT_ROW_GROUP_SIZE = 64 * 1024
+
+# Enum-like columns, stored as Arrow dictionary<int32, string> so pandas
+# reads them back as categoricals
+DICTIONARY_COLUMNS: Dict[str, tuple] = {
+    'organizations': ('industry',),
+    'users': ('role', 'seniority_level', 'department'),
+    'teams': ('team_type',),
+    'team_memberships': ('role_in_team',),
+    'projects': ('project_type', 'status', 'visibility'),
+    'tasks': ('priority', 'status'),
+    'tags': ('color',),
+    'custom_field_definitions': ('field_type',),
+    'task_dependencies': ('dependency_type',),
+}
+
+INTEGER_COLUMNS = {'employee_count', 'display_order'}
+
+
+class ParquetUnavailableError(RuntimeError):
+    """Raised when Parquet output is requested but pyarrow is not installed"""
+
+
+def parquet_dir_for(db_path) -> Path:
+    """Parquet output next to the database: <db stem>.parquet/"""
+    db_path = Path(db_path)
+    return db_path.with_name(db_path.stem + '.parquet')
+
+
+def arrow_type(table: str, column: str, id_scheme: str = 'uuid'):
+    """Arrow type for one column of the SQLite schema"""
+    kind = TEMPORAL_COLUMNS.get(table, {}).get(column)
+    if kind == 'timestamp':
+        return pa.timestamp('us')
+    if kind == 'date':
+        return pa.date32()
+    if column in DICTIONARY_COLUMNS.get(table, ()):
+        return pa.dictionary(pa.int32(), pa.string())
+    if column.startswith('is_'):
+        return pa.bool_()
+    if column.endswith('_id'):
+        return pa.string() if id_scheme == 'uuid' else pa.int64()
+    if column in INTEGER_COLUMNS:
+        return pa.int64()
+    if column in REAL_COLUMNS:
+        return pa.float64()
+    return pa.string()
+
+
+def arrow_schema(table: str, id_scheme: str = 'uuid'):
+    """Arrow schema for a table, columns in TABLE_COLUMNS order"""
+    return pa.schema([(c, arrow_type(table, c, id_scheme)) for c in TABLE_COLUMNS[table]])
+
+
+def _column_array(values: List, type_):
+    if pa.types.is_dictionary(type_):
+        return pa.array(values, type=type_.value_type).dictionary_encode()
+    return pa.array(values, type=type_)
+
+
+class ParquetWriter(WriterReport):
+    """
+    BulkWriter-compatible writer producing Parquet instead of SQLite rows.
+
+    insert() buffers row tuples per table and writes a row group whenever
+    row_group_size rows are buffered, so memory stays bounded by one row
+    group per table. Files are written under <output_dir>.tmp and renamed
+    into place by commit(); rollback() deletes them. Timestamps are always
+    stored as typed timestamp[us]/date32 columns, whatever --timestamps says,
+    and text ids are always rendered, whatever --text-storage says.
+    """
+
+    def __init__(self, output_dir, row_group_size: int = DEFAULT_ROW_GROUP_SIZE,
+                 id_scheme: str = 'uuid', compression: str = 'zstd'):
+        if pa is None:
+            raise ParquetUnavailableError("Parquet output requires pyarrow (pip install pyarrow)")
+        if row_group_size < 1:
+            raise ValueError("row_group_size must be at least 1")
+        self.output_dir = Path(output_dir)
+        self.row_group_size = row_group_size
+        self.id_scheme = id_scheme
+        self.compression = compression
+        self.stats: Dict[str, TableStats] = {}
+        self._staging: Optional[Path] = None
+        self._buffers: Dict[str, List[tuple]] = {}
+        self._files: Dict[str, 'pq.ParquetWriter'] = {}
+        self._schemas: Dict[str, 'pa.Schema'] = {}
+
+    def _file(self, table: str):
+        writer = self._files.get(table)
+        if writer is None:
+            path = self._staging / table / 'part-00000.parquet'
+            path.parent.mkdir(parents=True, exist_ok=True)
+            self._schemas[table] = arrow_schema(table, self.id_scheme)
+            writer = self._files[table] = pq.ParquetWriter(
+                str(path), self._schemas[table], compression=self.compression
+            )
+        return writer
+
+    def _write_row_group(self, table: str, rows: List[tuple]):
+        writer = self._file(table)
+        schema = self._schemas[table]
+        rows = render_texts(rows, text_positions(table))
+        arrays = [_column_array(list(values), field.type) for values, field in zip(zip(*rows), schema)]
+        writer.write_table(pa.Table.from_arrays(arrays, schema=schema), row_group_size=len(rows))
+
+    def begin(self):
+        """Start a fresh staging directory"""
+        if self._staging is not None:
+            return
+        self._staging = self.output_dir.with_name(self.output_dir.name + '.tmp')
+        if self._staging.exists():
+            shutil.rmtree(self._staging)
+        self._staging.mkdir(parents=True)
+
+    def insert(self, table: str, rows: Iterable[tuple]) -> int:
+        """Buffer row tuples for table, writing full row groups; returns rows accepted"""
+        if self._staging is None:
+            raise RuntimeError("begin() must be called before insert()")
+        buffer = self._buffers.setdefault(table, [])
+        count = 0
+        start = time.perf_counter()
+        for batch in batch_insert_values(rows, self.row_group_size):
+            buffer.extend(batch)
+            count += len(batch)
+            while len(buffer) >= self.row_group_size:
+                self._write_row_group(table, buffer[:self.row_group_size])
+                del buffer[:self.row_group_size]
+        elapsed = time.perf_counter() - start
+
+        stats = self.stats.setdefault(table, TableStats())
+        stats.rows += count
+        stats.seconds += elapsed
+        return count
+
+    def commit(self):
+        """Flush partial row groups, close every file and move the datasets into place"""
+        if self._staging is None:
+            return
+        for table, buffer in self._buffers.items():
+            if buffer:
+                start = time.perf_counter()
+                self._write_row_group(table, buffer)
+                self.stats[table].seconds += time.perf_counter() - start
+        self._buffers.clear()
+        for writer in self._files.values():
+            writer.close()
+        self._files.clear()
+        if self.output_dir.exists():
+            shutil.rmtree(self.output_dir)
+        os.replace(self._staging, self.output_dir)
+        self._staging = None
+
+    def rollback(self):
+        """Discard buffered rows and everything written since begin()"""
+        self._buffers.clear()
+        for writer in self._files.values():
+            writer.close()
+        self._files.clear()
+        if self._staging is not None:
+            shutil.rmtree(self._staging, ignore_errors=True)
+            self._staging = None
+
+    def log_report(self, logger: logging.Logger):
+        super().log_report(logger)
+        logger.info(f"Parquet datasets written to {self.output_dir}")
+
@@ -0,0 +1,402 @@
+# Row layouts for every table populated by the generator
+# Each converter flattens one model instance into the column order of TABLE_COLUMNS.
+# Date/datetime values are left as objects; the writer encodes each
+# TEMPORAL_COLUMNS column for a whole batch at once (see encode_batch).
+# Likewise TEXT_COLUMNS hold text ids until a writer renders them (render_texts).
+from datetime import date, datetime, timedelta
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+from generators.texts import TEXT_BODIES, render_text
+
+
+TABLE_COLUMNS: Dict[str, Tuple[str, ...]] = {
+    'organizations': (
+        'org_id', 'name', 'domain', 'is_verified', 'created_at', 'employee_count', 'industry'
+    ),
+    'users': (
+        'user_id', 'org_id', 'email', 'full_name', 'first_name', 'last_name',
+        'profile_picture_url', 'role', 'seniority_level', 'created_at', 'is_active', 'department'
+    ),
+    'teams': (
+        'team_id', 'org_id', 'name', 'description', 'team_type', 'created_at', 'is_active'
+    ),
+    'team_memberships': (
+        'membership_id', 'team_id', 'user_id', 'joined_at', 'is_lead', 'role_in_team'
+    ),
+    'projects': (
+        'project_id', 'org_id', 'team_id', 'name', 'description', 'project_type',
+        'status', 'created_at', 'start_date', 'target_end_date', 'owner_user_id', 'visibility'
+    ),
+    'sections': (
+        'section_id', 'project_id', 'name', 'description', 'display_order', 'created_at'
+    ),
+    'tasks': (
+        'task_id', 'project_id', 'section_id', 'name', 'description', 'assignee_id',
+        'created_by_user_id', 'created_at', 'due_date', 'start_date', 'priority',
+        'status', 'is_completed', 'completed_at', 'estimated_hours', 'actual_hours'
+    ),
+    'subtasks': (
+        'subtask_id', 'task_id', 'name', 'description', 'assignee_id', 'created_at',
+        'due_date', 'is_completed', 'completed_at'
+    ),
+    'comments': (
+        'comment_id', 'task_id', 'user_id', 'content', 'created_at', 'updated_at', 'is_edited'
+    ),
+    'tags': (
+        'tag_id', 'org_id', 'name', 'color', 'created_at'
+    ),
+    'custom_field_definitions': (
+        'field_id', 'project_id', 'name', 'field_type', 'description', 'is_required', 'created_at'
+    ),
+    'custom_field_values': (
+        'value_id', 'task_id', 'field_id', 'value', 'created_at', 'updated_at'
+    ),
+    'task_tags': (
+        'task_tag_id', 'task_id', 'tag_id', 'added_at'
+    ),
+    'task_dependencies': (
+        'dependency_id', 'task_id', 'depends_on_task_id', 'dependency_type', 'created_at'
+    ),
+}
+
+
+def organization_row(org) -> tuple:
+    return (
+        org.org_id, org.name, org.domain, org.is_verified,
+        org.created_at, org.employee_count, org.industry
+    )
+
+
+def user_row(user) -> tuple:
+    return (
+        user.user_id, user.org_id, user.email, user.full_name,
+        user.first_name, user.last_name, user.profile_picture_url,
+        user.role, user.seniority_level, user.created_at,
+        user.is_active, user.department
+    )
+
+
+def team_row(team) -> tuple:
+    return (
+        team.team_id, team.org_id, team.name, team.description,
+        team.team_type, team.created_at, team.is_active
+    )
+
+
+def team_membership_row(membership) -> tuple:
+    return (
+        membership.membership_id, membership.team_id, membership.user_id,
+        membership.joined_at, membership.is_lead, membership.role_in_team
+    )
+
+
+def project_row(project) -> tuple:
+    return (
+        project.project_id, project.org_id, project.team_id,
+        project.name, project.description, project.project_type,
+        project.status, project.created_at,
+        project.start_date, project.target_end_date,
+        project.owner_user_id, project.visibility
+    )
+
+
+def section_row(section) -> tuple:
+    return (
+        section.section_id, section.project_id, section.name,
+        section.description, section.display_order, section.created_at
+    )
+
+
+def task_row(task) -> tuple:
+    return (
+        task.task_id, task.project_id, task.section_id, task.name,
+        task.description, task.assignee_id, task.created_by_user_id,
+        task.created_at, task.due_date, task.start_date,
+        task.priority, task.status, task.is_completed, task.completed_at,
+        task.estimated_hours, task.actual_hours
+    )
+
+
+def subtask_row(subtask) -> tuple:
+    return (
+        subtask.subtask_id, subtask.task_id, subtask.name,
+        subtask.description, subtask.assignee_id, subtask.created_at,
+        subtask.due_date, subtask.is_completed, subtask.completed_at
+    )
+
+
+def comment_row(comment) -> tuple:
+    return (
+        comment.comment_id, comment.task_id, comment.user_id,
+        comment.content, comment.created_at,
+        comment.updated_at, comment.is_edited
+    )
+
+
+def tag_row(tag) -> tuple:
+    return (tag.tag_id, tag.org_id, tag.name, tag.color, tag.created_at)
+
+
+def custom_field_row(field) -> tuple:
+    return (
+        field.field_id, field.project_id, field.name, field.field_type,
+        field.description, field.is_required, field.created_at
+    )
+
+
+def custom_field_value_row(value) -> tuple:
+    return (
+        value.value_id, value.task_id, value.field_id, value.value,
+        value.created_at, value.updated_at
+    )
+
+
+def task_tag_row(task_tag) -> tuple:
+    return (task_tag.task_tag_id, task_tag.task_id, task_tag.tag_id, task_tag.added_at)
+
+
+def task_dependency_row(dep) -> tuple:
+    return (
+        dep.dependency_id, dep.task_id, dep.depends_on_task_id,
+        dep.dependency_type, dep.created_at
+    )
+
+
+# Columns stored as timestamps or calendar dates, per table
+TEMPORAL_COLUMNS: Dict[str, Dict[str, str]] = {
+    'organizations': {'created_at': 'timestamp'},
+    'users': {'created_at': 'timestamp'},
+    'teams': {'created_at': 'timestamp'},
+    'team_memberships': {'joined_at': 'timestamp'},
+    'projects': {'created_at': 'timestamp', 'start_date': 'date', 'target_end_date': 'date'},
+    'sections': {'created_at': 'timestamp'},
+    'tasks': {
+        'created_at': 'timestamp', 'due_date': 'date', 'start_date': 'date',
+        'completed_at': 'timestamp',
+    },
+    'subtasks': {'created_at': 'timestamp', 'due_date': 'date', 'completed_at': 'timestamp'},
+    'comments': {'created_at': 'timestamp', 'updated_at': 'timestamp'},
+    'tags': {'created_at': 'timestamp'},
+    'custom_field_definitions': {'created_at': 'timestamp'},
+    'custom_field_values': {'created_at': 'timestamp', 'updated_at': 'timestamp'},
+    'task_tags': {'added_at': 'timestamp'},
+    'task_dependencies': {'created_at': 'timestamp'},
+}
+
+# Columns declared REAL in schema.sql (the models may hold ints there)
+REAL_COLUMNS = {'estimated_hours', 'actual_hours'}
+
+# Columns holding text ids (generators/texts.py) per table: the text column,
+# and the column whose value fills in TASK_NAME_MARKER, if any
+TEXT_COLUMNS: Dict[str, Tuple[str, Optional[str]]] = {
+    'tasks': ('description', 'name'),
+    'subtasks': ('description', None),
+    'comments': ('content', None),
+}
+
+# Text storage (--text-storage):
+#   inline     - bodies rendered into the TEXT columns (default)
+#   normalized - INTEGER ids into a text_bodies table holding each body once,
+#                with <table>_text views reading as the inline columns
+TEXT_STORAGE_MODES = ('inline', 'normalized')
+
+# Timestamp encodings (--timestamps):
+#   iso   - ISO-8601 TEXT, exactly as datetime.isoformat() writes it (default)
+#   epoch - INTEGER microseconds since 1970-01-01 for timestamps (lossless,
+#           like the ISO text), days for dates
+TIMESTAMP_FORMATS = ('iso', 'epoch')
+
+
+ROW_CONVERTERS: Dict[str, Callable] = {
+    'organizations': organization_row,
+    'users': user_row,
+    'teams': team_row,
+    'team_memberships': team_membership_row,
+    'projects': project_row,
+    'sections': section_row,
+    'tasks': task_row,
+    'subtasks': subtask_row,
+    'comments': comment_row,
+    'tags': tag_row,
+    'custom_field_definitions': custom_field_row,
+    'custom_field_values': custom_field_value_row,
+    'task_tags': task_tag_row,
+    'task_dependencies': task_dependency_row,
+}
+
+
+def _write_digits(out: np.ndarray, start: int, values: np.ndarray, width: int):
+    """Write zero-padded decimal digits of values into out[:, start:start + width]"""
+    values = values.copy()
+    for position in range(start + width - 1, start - 1, -1):
+        out[:, position] = 48 + values % 10
+        values //= 10
+
+
+def _civil_from_days(days: np.ndarray):
+    """(year, month, day) arrays for days since 1970-01-01 (proleptic Gregorian)"""
+    z = days + 719468
+    era = z // 146097
+    doe = z - era * 146097
+    yoe = (doe - doe // 1460 + doe // 36524 - doe // 146096) // 365
+    doy = doe - (365 * yoe + yoe // 4 - yoe // 100)
+    mp = (5 * doy + 2) // 153
+    day = doy - (153 * mp + 2) // 5 + 1
+    month = np.where(mp < 10, mp + 3, mp - 9)
+    year = yoe + era * 400 + (month <= 2)
+    return year, month, day
+
+
+def _format_iso(values: np.ndarray, with_time: bool, with_fraction: bool = False) -> np.ndarray:
+    """Fixed-width ISO strings as an S10/S19/S26 array, built digit by digit"""
+    ticks = values.view(np.int64)
+    days = ticks // 86400000000 if with_time else ticks
+    year, month, day = _civil_from_days(days)
+    width = 26 if with_fraction else 19 if with_time else 10
+    out = np.empty((len(values), width), dtype=np.uint8)
+    _write_digits(out, 0, year, 4)
+    out[:, 4] = out[:, 7] = ord('-')
+    _write_digits(out, 5, month, 2)
+    _write_digits(out, 8, day, 2)
+    if with_time:
+        micros = ticks - days * 86400000000
+        seconds = micros // 1000000
+        out[:, 10] = ord('T')
+        out[:, 13] = out[:, 16] = ord(':')
+        _write_digits(out, 11, seconds // 3600, 2)
+        _write_digits(out, 14, seconds // 60 % 60, 2)
+        _write_digits(out, 17, seconds % 60, 2)
+        if with_fraction:
+            out[:, 19] = ord('.')
+            _write_digits(out, 20, micros % 1000000, 6)
+    return out.view(f'S{width}').ravel()
+
+
+def iso_column(values: np.ndarray) -> List:
+    """
+    Vectorized isoformat() for a datetime64 column; NaT becomes None.
+    
+    Matches datetime.isoformat(): whole seconds are written without a
+    fractional part, anything finer with microseconds.
+    """
+    missing = np.isnat(values)
+    if values.dtype == np.dtype('datetime64[D]'):
+        out = _format_iso(values, with_time=False).astype('U10').astype(object)
+    else:
+        values = values.astype('datetime64[us]')
+        out = _format_iso(values, with_time=True).astype('U19').astype(object)
+        fractional = (values.view(np.int64) % 1000000 != 0) & ~missing
+        if fractional.any():
+            out[fractional] = _format_iso(values[fractional], True, True).astype('U26')
+    if missing.any():
+        out[missing] = None
+    return out.tolist()
+
+
+def epoch_column(values: np.ndarray) -> List:
+    """datetime64 column as epoch microseconds (days for datetime64[D]); NaT becomes None"""
+    unit = 'D' if values.dtype == np.dtype('datetime64[D]') else 'us'
+    out = values.astype(f'datetime64[{unit}]').astype(np.int64).astype(object)
+    out[np.isnat(values)] = None
+    return out.tolist()
+
+
+_EPOCH = datetime(1970, 1, 1)
+_EPOCH_ORDINAL = _EPOCH.toordinal()
+_MICROSECOND = timedelta(microseconds=1)
+_NAT = np.iinfo(np.int64).min
+
+
+def to_datetime64(values, kind: str) -> np.ndarray:
+    """
+    dates/datetimes (None allowed) as a datetime64[D]/[us] array.
+    
+    Integer offsets from the epoch are computed in Python and viewed as
+    datetime64; np.array(values, dtype='datetime64[us]') does the same per
+    element several times slower.
+    """
+    if kind == 'date':
+        offsets = [_NAT if v is None else v.toordinal() - _EPOCH_ORDINAL for v in values]
+        return np.array(offsets, dtype=np.int64).view('datetime64[D]')
+    offsets = [_NAT if v is None else (v - _EPOCH) // _MICROSECOND for v in values]
+    return np.array(offsets, dtype=np.int64).view('datetime64[us]')
+
+
+def encode_temporal(values, kind: str, timestamps: str = 'iso') -> List:
+    """Encode one column of dates/datetimes (None allowed); formatting runs in NumPy"""
+    array = to_datetime64(values, kind)
+    return iso_column(array) if timestamps == 'iso' else epoch_column(array)
+
+
+def decode_temporal(value, kind: str, timestamps: str = 'iso'):
+    """Inverse of encode_temporal for one stored value (None stays None)"""
+    if value is None:
+        return None
+    if timestamps == 'epoch':
+        if kind == 'date':
+            return date.fromordinal(_EPOCH_ORDINAL + value)
+        return _EPOCH + timedelta(microseconds=value)
+    if kind == 'date':
+        return date.fromisoformat(value)
+    return datetime.fromisoformat(value)
+
+
+def temporal_positions(table: str) -> List[Tuple[int, str]]:
+    """(column index, kind) for every temporal column of table"""
+    columns = TABLE_COLUMNS[table]
+    return [(columns.index(name), kind) for name, kind in TEMPORAL_COLUMNS.get(table, {}).items()]
+
+
+def text_positions(table: str) -> Optional[Tuple[int, Optional[int]]]:
+    """(text column index, name column index or None) for a TEXT_COLUMNS table, else None"""
+    if table not in TEXT_COLUMNS:
+        return None
+    columns = TABLE_COLUMNS[table]
+    column, name_column = TEXT_COLUMNS[table]
+    return columns.index(column), None if name_column is None else columns.index(name_column)
+
+
+def render_texts(batch: List[tuple], positions: Optional[Tuple[int, Optional[int]]]) -> List[tuple]:
+    """Render the text ids of a batch of row tuples; values that are already text pass through"""
+    if not batch or positions is None:
+        return batch
+    index, name_index = positions
+    columns = list(zip(*batch))
+    if name_index is None:
+        columns[index] = [TEXT_BODIES[v] if isinstance(v, int) else v for v in columns[index]]
+    else:
+        columns[index] = [
+            render_text(v, name) if isinstance(v, int) else v
+            for v, name in zip(columns[index], columns[name_index])
+        ]
+    return list(zip(*columns))
+
+
+def encode_batch(batch: List[tuple], positions: List[Tuple[int, str]], timestamps: str = 'iso') -> List[tuple]:
+    """Encode the temporal columns of a batch of row tuples column by column"""
+    if not batch or not positions:
+        return batch
+    columns = list(zip(*batch))
+    for index, kind in positions:
+        columns[index] = encode_temporal(columns[index], kind, timestamps)
+    return list(zip(*columns))
+
+
+def columnar_rows(table: str, columns, timestamps: Optional[str] = None) -> Iterator[tuple]:
+    """
+    Row tuples for a columnar entity table (models.columnar) in TABLE_COLUMNS order.
+    
+    Each column is converted in one pass instead of converting a model
+    instance per row. With timestamps ('iso' or 'epoch'), temporal columns
+    go from their datetime64 arrays straight to the stored form
+    (iso_column/epoch_column), for a SQLite writer's insert(..., encoded=True);
+    without, they are decoded to dates/datetimes like any other row source.
+    """
+    temporal = TEMPORAL_COLUMNS.get(table, {}) if timestamps is not None else {}
+    encode = iso_column if timestamps == 'iso' else epoch_column
+    return zip(*(
+        encode(getattr(columns, name)) if name in temporal else columns.column(name)
+        for name in TABLE_COLUMNS[table]
+    ))
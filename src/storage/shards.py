@@ -0,0 +1,30 @@
+# Merging per-shard SQLite databases into the final database
+import sqlite3
+from pathlib import Path
+from typing import Dict, Iterable
+
+
+def merge_shard(connection: sqlite3.Connection, shard_path, tables: Iterable[str]) -> Dict[str, int]:
+    """
+    Copy every row of the given tables from a shard database into the main
+    database with ATTACH + INSERT ... SELECT, in one transaction.
+    Shards share schema.sql, so column order matches. Returns rows copied per table.
+    """
+    if connection.in_transaction:
+        raise RuntimeError("merge_shard must run outside a transaction (ATTACH/DETACH)")
+    
+    connection.execute("ATTACH DATABASE ? AS shard", (str(Path(shard_path)),))
+    counts = {}
+    try:
+        connection.execute("BEGIN")
+        for table in tables:
+            cursor = connection.execute(f"INSERT INTO main.{table} SELECT * FROM shard.{table}")
+            counts[table] = cursor.rowcount
+        connection.execute("COMMIT")
+    except Exception:
+        if connection.in_transaction:
+            connection.execute("ROLLBACK")
+        raise
+    finally:
+        connection.execute("DETACH DATABASE shard")
+    return counts
@@ -0,0 +1,307 @@
+# Batched SQLite writer used by AsanaDataGenerator
+import re
+import sqlite3
+import time
+import logging
+from dataclasses import dataclass
+from typing import Dict, Iterable, List
+
+from generators.texts import TEXT_BODIES, TASK_NAME_MARKER
+from storage.rows import (
+    TABLE_COLUMNS, TEMPORAL_COLUMNS, TEXT_COLUMNS, encode_batch, render_texts, temporal_positions,
+    text_positions
+)
+from utils.helpers import batch_insert_values
+
+DEFAULT_BATCH_SIZE = 5000
+
+# Load-time settings for --bulk-load. The database is built from scratch, so a
+# crash mid-load means regenerating it anyway; durability is traded for speed
+# until restore_pragmas() runs.
+BULK_LOAD_PRAGMAS = {
+    'journal_mode': 'OFF',
+    'synchronous': 'OFF',
+    'cache_size': -262144,  # negative = KiB, i.e. 256 MiB page cache
+    'temp_store': 'MEMORY',
+}
+
+
+def apply_bulk_load_pragmas(connection: sqlite3.Connection) -> Dict[str, object]:
+    """Switch the connection to load-time settings; returns the previous values"""
+    previous = {}
+    for name, value in BULK_LOAD_PRAGMAS.items():
+        previous[name] = connection.execute(f"PRAGMA {name}").fetchone()[0]
+        connection.execute(f"PRAGMA {name} = {value}")
+    return previous
+
+
+def restore_pragmas(connection: sqlite3.Connection, previous: Dict[str, object]):
+    """Restore the settings captured by apply_bulk_load_pragmas"""
+    for name, value in previous.items():
+        connection.execute(f"PRAGMA {name} = {value}")
+
+
+# Every text body once, for --text-storage normalized (ids from generators/texts.py)
+TEXT_TABLE_SQL = """
+CREATE TABLE IF NOT EXISTS text_bodies (
+    text_id INTEGER PRIMARY KEY,
+    body TEXT NOT NULL
+)
+"""
+
+
+def schema_script(path, id_scheme: str = 'uuid', timestamps: str = 'iso',
+                  text_storage: str = 'inline') -> str:
+    """
+    Read a DDL script. For the int and gid ID schemes every *_id TEXT column
+    becomes INTEGER, so primary keys turn into rowid aliases. With epoch
+    timestamps, TIMESTAMP and DATE columns become INTEGER. With normalized
+    text storage, the TEXT_COLUMNS become INTEGER references to text_bodies.
+    """
+    with open(path, 'r') as f:
+        script = f.read()
+    if id_scheme != 'uuid':
+        script = re.sub(r'\b(\w+_id) TEXT\b', r'\1 INTEGER', script)
+    if timestamps == 'epoch':
+        script = re.sub(r'\b(\w+) (?:TIMESTAMP|DATE)\b', r'\1 INTEGER', script)
+    if text_storage == 'normalized':
+        for table, (column, _) in TEXT_COLUMNS.items():
+            # Only within that table's CREATE TABLE statement
+            script = re.sub(
+                rf'(CREATE TABLE {table} \((?:(?!\);).)*?)\b{column} TEXT\b',
+                rf'\1{column} INTEGER REFERENCES text_bodies(text_id)', script, flags=re.DOTALL
+            )
+    return script
+
+
+def execute_sql_file(connection: sqlite3.Connection, path, id_scheme: str = 'uuid',
+                     timestamps: str = 'iso', text_storage: str = 'inline') -> float:
+    """
+    Run a DDL script such as schema.sql or schema_indexes.sql; returns
+    seconds taken. With normalized text storage the filled text_bodies
+    table is created too.
+    """
+    script = schema_script(path, id_scheme, timestamps, text_storage)
+    start = time.perf_counter()
+    connection.executescript(script)
+    if text_storage == 'normalized':
+        create_text_table(connection)
+    return time.perf_counter() - start
+
+
+def create_text_table(connection: sqlite3.Connection):
+    """text_bodies with every body of generators/texts.py (existing ids are kept)"""
+    connection.execute(TEXT_TABLE_SQL)
+    connection.execute("BEGIN")
+    connection.executemany(
+        "INSERT OR IGNORE INTO text_bodies (text_id, body) VALUES (?, ?)",
+        [(text_id, TEXT_BODIES[text_id]) for text_id in range(1, len(TEXT_BODIES))]
+    )
+    connection.execute("COMMIT")
+
+
+def text_view_sql(table: str) -> str:
+    """CREATE VIEW <table>_text presenting a text id column as the text it stands for"""
+    column, name_column = TEXT_COLUMNS[table]
+    body = "b.body" if name_column is None else f"replace(b.body, '{TASK_NAME_MARKER}', t.{name_column})"
+    select = [f"{body} AS {c}" if c == column else f"t.{c}" for c in TABLE_COLUMNS[table]]
+    return (f"CREATE VIEW IF NOT EXISTS {table}_text AS SELECT {', '.join(select)} "
+            f"FROM {table} t LEFT JOIN text_bodies b ON b.text_id = t.{column}")
+
+
+def create_text_views(connection: sqlite3.Connection):
+    """One <table>_text view per TEXT_COLUMNS table (normalized text storage only)"""
+    for table in TEXT_COLUMNS:
+        connection.execute(text_view_sql(table))
+
+
+def iso_expression(column: str, kind: str) -> str:
+    """
+    SQL reading an epoch-encoded timestamp or date column as the ISO string
+    --timestamps iso stores: timestamps with microseconds only when non-zero
+    """
+    if kind == 'date':
+        return f"date({column} * 86400, 'unixepoch')"
+    return (
+        f"strftime('%Y-%m-%dT%H:%M:%S', {column} / 1000000, 'unixepoch') || "
+        f"CASE WHEN {column} % 1000000 THEN printf('.%06d', {column} % 1000000) ELSE '' END"
+    )
+
+
+def iso_view_sql(table: str, source: str = None) -> str:
+    """
+    CREATE VIEW <table>_iso presenting epoch-encoded columns as ISO strings
+    (iso_expression), read from source (default: the table itself)
+    """
+    temporal = TEMPORAL_COLUMNS.get(table, {})
+    select = [
+        f"{iso_expression(column, temporal[column])} AS {column}" if column in temporal else column
+        for column in TABLE_COLUMNS[table]
+    ]
+    return f"CREATE VIEW IF NOT EXISTS {table}_iso AS SELECT {', '.join(select)} FROM {source or table}"
+
+
+def create_iso_views(connection: sqlite3.Connection, text_storage: str = 'inline'):
+    """
+    One <table>_iso view per table with temporal columns (epoch timestamps
+    only). With normalized text storage they read the <table>_text views,
+    which must exist, so text columns show as text.
+    """
+    for table in TEMPORAL_COLUMNS:
+        source = f"{table}_text" if text_storage == 'normalized' and table in TEXT_COLUMNS else None
+        connection.execute(iso_view_sql(table, source))
+
+
+@dataclass
+class TableStats:
+    """Accumulated insert statistics for one table"""
+    rows: int = 0
+    seconds: float = 0.0
+
+    @property
+    def rows_per_sec(self) -> float:
+        return self.rows / self.seconds if self.seconds > 0 else 0.0
+
+
+class WriterReport:
+    """Per-table insert report shared by the writers; subclasses fill self.stats"""
+    stats: Dict[str, TableStats]
+
+    def report(self) -> List[dict]:
+        """Per-table rows, seconds and rows/sec in insertion order"""
+        return [
+            {
+                'table': table,
+                'rows': stats.rows,
+                'seconds': round(stats.seconds, 6),
+                'rows_per_sec': round(stats.rows_per_sec, 1),
+            }
+            for table, stats in self.stats.items()
+        ]
+
+    def log_report(self, logger: logging.Logger):
+        """Log the per-table throughput report"""
+        logger.info(f"{'table':<26}{'rows':>10}{'seconds':>10}{'rows/sec':>14}")
+        for entry in self.report():
+            logger.info(
+                f"{entry['table']:<26}{entry['rows']:>10}"
+                f"{entry['seconds']:>10.3f}{entry['rows_per_sec']:>14,.0f}"
+            )
+
+
+class TeeWriter(WriterReport):
+    """
+    Fans every insert out to several writers (--format both, --jsonl-dir).
+
+    Rows are batched once and each batch goes to every writer in turn; the
+    report is the first writer's.
+    """
+
+    def __init__(self, writers: List, batch_size: int):
+        self.writers = writers
+        self.batch_size = batch_size
+
+    @property
+    def stats(self) -> Dict[str, TableStats]:
+        return self.writers[0].stats
+
+    def begin(self):
+        for writer in self.writers:
+            writer.begin()
+
+    def insert(self, table: str, rows: Iterable[tuple]) -> int:
+        count = 0
+        for batch in batch_insert_values(rows, self.batch_size):
+            for writer in self.writers:
+                writer.insert(table, batch)
+            count += len(batch)
+        return count
+
+    def commit(self):
+        for writer in self.writers:
+            writer.commit()
+
+    def rollback(self):
+        for writer in self.writers:
+            writer.rollback()
+
+    def log_report(self, logger: logging.Logger):
+        for writer in self.writers:
+            writer.log_report(logger)
+
+
+class BulkWriter(WriterReport):
+    """
+    Bulk-write layer behind every insert_* method.
+
+    Rows are grouped into precomputed tuple batches and written with
+    executemany. The caller brackets the whole load with begin()/commit(),
+    so SQLite sees a single explicit transaction instead of one per table.
+    """
+
+    def __init__(self, connection: sqlite3.Connection, batch_size: int = DEFAULT_BATCH_SIZE,
+                 timestamps: str = 'iso', text_storage: str = 'inline'):
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1")
+        self.connection = connection
+        self.batch_size = batch_size
+        self.timestamps = timestamps
+        self.text_storage = text_storage
+        self._temporal: Dict[str, list] = {}
+        self._texts: Dict[str, tuple] = {}
+        self.stats: Dict[str, TableStats] = {}
+        self._statements: Dict[str, str] = {}
+
+    def _insert_sql(self, table: str) -> str:
+        sql = self._statements.get(table)
+        if sql is None:
+            columns = TABLE_COLUMNS[table]
+            placeholders = ", ".join("?" * len(columns))
+            sql = f"INSERT INTO {table} ({', '.join(columns)}) VALUES ({placeholders})"
+            self._statements[table] = sql
+        return sql
+
+    def begin(self):
+        """Open the load transaction"""
+        if not self.connection.in_transaction:
+            self.connection.execute("BEGIN")
+
+    def commit(self):
+        """Commit the load transaction"""
+        if self.connection.in_transaction:
+            self.connection.execute("COMMIT")
+
+    def rollback(self):
+        """Discard everything written since begin()"""
+        if self.connection.in_transaction:
+            self.connection.execute("ROLLBACK")
+
+    def insert(self, table: str, rows: Iterable[tuple], encoded: bool = False) -> int:
+        """
+        Write row tuples to table in batches; returns the number of rows written.
+        Date/datetime columns are encoded per batch (see storage.rows.encode_batch)
+        unless encoded says the rows already hold them in the stored form
+        (storage.rows.columnar_rows), and text ids are rendered unless text
+        storage is normalized.
+        """
+        sql = self._insert_sql(table)
+        positions = self._temporal.get(table)
+        if positions is None:
+            positions = self._temporal[table] = temporal_positions(table)
+            self._texts[table] = text_positions(table) if self.text_storage == 'inline' else None
+        texts = self._texts[table]
+        if encoded:
+            positions = []
+        cursor = self.connection.cursor()
+        count = 0
+        start = time.perf_counter()
+        for batch in batch_insert_values(rows, self.batch_size):
+            cursor.executemany(sql, encode_batch(render_texts(batch, texts), positions, self.timestamps))
+            count += len(batch)
+        elapsed = time.perf_counter() - start
+
+        stats = self.stats.setdefault(table, TableStats())
+        stats.rows += count
+        stats.seconds += elapsed
+        return count
+
@@ -0,0 +1,172 @@
+# Loading an existing database for --append
+#
+# Appending only needs the rows new entities hang off: the organization,
+# user ids, teams, projects with their sections and custom fields, and tags.
+# Tasks and everything below them are never read, so the cost of an append
+# scales with what is added rather than with what is already there. A
+# database built with --num-orgs holds several organizations; appending
+# then targets one of them (--org-id) and loads only its rows, so new rows
+# never mix organizations.
+import sqlite3
+from collections import namedtuple
+from dataclasses import dataclass, field, fields
+from typing import Dict, List, Optional, Set
+
+from models import Team, Project, Section, Tag, CustomFieldDefinition
+from storage.rows import TABLE_COLUMNS, TEMPORAL_COLUMNS, decode_temporal
+from utils.helpers import GID_MIN, GID_COUNTER_SQL
+
+# Users are only ever referenced by id when appending
+UserRef = namedtuple('UserRef', ['user_id'])
+
+
+
+@dataclass
+class ExistingWorkspace:
+    """The parts of an existing database that appended rows reference"""
+    org_id: object
+    id_scheme: str
+    timestamps: str
+    users: List[UserRef]
+    teams: List[Team]
+    projects: List[Project]
+    sections: List[Section]
+    custom_fields: List[CustomFieldDefinition]
+    tags: List[Tag]
+    # Last position of the int ID sequence used by any key (the key itself
+    # under int, its counter_for_gid under gid); new ids continue after it
+    max_int_id: int = 0
+    # Total rows per table, used to derive a fresh RNG stream for the append
+    row_counts: Dict[str, int] = field(default_factory=dict)
+    text_storage: str = 'inline'
+
+    @property
+    def project_names(self) -> Set[str]:
+        return {p.name for p in self.projects}
+
+
+def detect_id_scheme(connection: sqlite3.Connection) -> str:
+    """uuid, int or gid, from the stored organization key"""
+    row = connection.execute("SELECT org_id, typeof(org_id) FROM organizations LIMIT 1").fetchone()
+    if row is None:
+        raise ValueError("database has no organization to append to")
+    value, kind = row
+    if kind == 'text':
+        return 'uuid'
+    # gid-scheme ids are 16-digit numbers; int-scheme ids count up from 1
+    return 'gid' if value >= GID_MIN else 'int'
+
+
+def detect_timestamps(connection: sqlite3.Connection) -> str:
+    """iso or epoch, from the declared type of organizations.created_at"""
+    for _, name, declared, *_ in connection.execute("PRAGMA table_info(organizations)"):
+        if name == 'created_at':
+            return 'epoch' if declared.upper() == 'INTEGER' else 'iso'
+    raise ValueError("organizations.created_at not found")
+
+
+def detect_text_storage(connection: sqlite3.Connection) -> str:
+    """normalized if the database has a text_bodies table, else inline"""
+    row = connection.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'text_bodies'"
+    ).fetchone()
+    return 'normalized' if row is not None else 'inline'
+
+
+# Rows of each loaded table that belong to the organization bound to :org_id
+ORG_FILTERS = {
+    'users': "org_id = :org_id",
+    'teams': "org_id = :org_id",
+    'projects': "org_id = :org_id",
+    'sections': "project_id IN (SELECT project_id FROM projects WHERE org_id = :org_id)",
+    'custom_field_definitions': "project_id IN (SELECT project_id FROM projects WHERE org_id = :org_id)",
+    'tags': "org_id = :org_id",
+}
+
+
+def resolve_org_id(connection: sqlite3.Connection, org_id: Optional[str] = None):
+    """
+    The stored key of the organization to append to. org_id is matched
+    as text, so it can be given as a UUID or a number whatever the ID
+    scheme; it may only be omitted when the database holds one organization.
+    """
+    stored = [key for key, in connection.execute("SELECT org_id FROM organizations ORDER BY rowid")]
+    if not stored:
+        raise ValueError("database has no organization to append to")
+    if org_id is None:
+        if len(stored) > 1:
+            raise ValueError(
+                f"database holds {len(stored)} organizations; pick one with --org-id "
+                f"(SELECT org_id, name FROM organizations)"
+            )
+        return stored[0]
+    for key in stored:
+        if str(key) == str(org_id):
+            return key
+    raise ValueError(f"organization {org_id} not found")
+
+
+def load_rows(connection: sqlite3.Connection, table: str, model, timestamps: str = 'iso',
+              org_id=None) -> List:
+    """
+    Every row of table as model instances, with temporal and boolean
+    columns decoded; only the rows of org_id's organization if given.
+    """
+    columns = TABLE_COLUMNS[table]
+    assert [f.name for f in fields(model)] == list(columns), f"{model.__name__} does not match {table}"
+    temporal = [(columns.index(name), kind) for name, kind in TEMPORAL_COLUMNS.get(table, {}).items()]
+    booleans = [i for i, name in enumerate(columns) if name.startswith('is_')]
+    where = f" WHERE {ORG_FILTERS[table]}" if org_id is not None else ""
+    rows = []
+    for row in connection.execute(f"SELECT {', '.join(columns)} FROM {table}{where} ORDER BY rowid",
+                                  {'org_id': org_id}):
+        row = list(row)
+        for i, kind in temporal:
+            row[i] = decode_temporal(row[i], kind, timestamps)
+        for i in booleans:
+            if row[i] is not None:
+                row[i] = bool(row[i])
+        rows.append(model(*row))
+    return rows
+
+
+def load_workspace(connection: sqlite3.Connection, org_id: Optional[str] = None) -> ExistingWorkspace:
+    """
+    Read what --append needs from an existing database, for the
+    organization org_id (required if there is more than one)
+    """
+    id_scheme = detect_id_scheme(connection)
+    timestamps = detect_timestamps(connection)
+    org_id = resolve_org_id(connection, org_id)
+    row_counts = {
+        table: connection.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+        for table in TABLE_COLUMNS
+    }
+    max_int_id = 0
+    if id_scheme != 'uuid':
+        # The first column of every table is its key
+        counter = '{column}' if id_scheme == 'int' else GID_COUNTER_SQL
+        max_int_id = max(
+            connection.execute(
+                f"SELECT COALESCE(MAX({counter.format(column=columns[0])}), 0) FROM {table}"
+            ).fetchone()[0]
+            for table, columns in TABLE_COLUMNS.items()
+        )
+    return ExistingWorkspace(
+        org_id=org_id,
+        id_scheme=id_scheme,
+        timestamps=timestamps,
+        users=[UserRef(user_id) for user_id, in connection.execute(
+            f"SELECT user_id FROM users WHERE {ORG_FILTERS['users']} ORDER BY rowid", {'org_id': org_id}
+        )],
+        teams=load_rows(connection, 'teams', Team, timestamps, org_id),
+        projects=load_rows(connection, 'projects', Project, timestamps, org_id),
+        sections=load_rows(connection, 'sections', Section, timestamps, org_id),
+        custom_fields=load_rows(
+            connection, 'custom_field_definitions', CustomFieldDefinition, timestamps, org_id
+        ),
+        tags=load_rows(connection, 'tags', Tag, timestamps, org_id),
+        max_int_id=max_int_id,
+        row_counts=row_counts,
+        text_storage=detect_text_storage(connection),
+    )
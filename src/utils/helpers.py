@@ -1,17 +1,328 @@
 # Utility functions for data generation
+import math
+import string
+import sys
 import uuid
 import random
 from datetime import datetime, timedelta, date
-from typing import List, Tuple
+from itertools import islice
+from typing import Iterable, List, Sequence, Tuple
 import numpy as np
 
+def seed_everything(seed: int):
+    """Seed every RNG the generators draw from (random and numpy's global state)"""
+    random.seed(seed)
+    np.random.seed(seed % (2 ** 32))
+
+class AliasSampler:
+    """
+    Weighted draws from a fixed categorical distribution (Walker's alias
+    method, Vose's construction).
+    
+    The table is built once in O(k): every one of the k columns holds a
+    probability prob[i] and an alias. A draw picks a column uniformly and
+    keeps it with probability prob[i], else takes its alias, so a scalar
+    draw costs one random() call whatever k is, and a batch of any size is
+    a few array operations. random.choices(values, weights) instead
+    re-accumulates the weights on every call.
+    """
+    
+    __slots__ = ('values', 'weights', 'prob', 'alias', '_prob', '_alias', '_k', '_array')
+    
+    def __init__(self, values: Sequence, weights: Sequence[float]):
+        if len(values) != len(weights) or not len(values):
+            raise ValueError("values and weights must be non-empty and of equal length")
+        weights = np.asarray(weights, dtype=float)
+        if (weights < 0).any() or weights.sum() <= 0:
+            raise ValueError("weights must be non-negative with a positive sum")
+        k = len(weights)
+        scaled = weights * (k / weights.sum())
+        prob = np.ones(k)
+        alias = np.arange(k)
+        small = [i for i in range(k) if scaled[i] < 1.0]
+        large = [i for i in range(k) if scaled[i] >= 1.0]
+        while small and large:
+            s, l = small.pop(), large.pop()
+            prob[s] = scaled[s]
+            alias[s] = l
+            # The large column gives away what fills up the small one
+            scaled[l] -= 1.0 - scaled[s]
+            (small if scaled[l] < 1.0 else large).append(l)
+        # Whatever is left is 1 up to rounding
+        self.values = list(values)
+        self.weights = weights / weights.sum()
+        self.prob = prob
+        self.alias = alias
+        self._prob = prob.tolist()
+        self._alias = alias.tolist()
+        self._k = k
+        self._array = None
+    
+    def index(self, rng=random) -> int:
+        """Index of one weighted draw; one rng.random() call"""
+        u = rng.random() * self._k
+        i = int(u)
+        return i if u - i < self._prob[i] else self._alias[i]
+    
+    def draw(self, rng=random):
+        """One weighted draw"""
+        return self.values[self.index(rng)]
+    
+    def indices(self, size: int, rng=None) -> np.ndarray:
+        """size weighted draws as an int64 index array (numpy's global RNG by default)"""
+        u = (rng or np.random).random(size) * self._k
+        i = u.astype(np.int64)
+        return np.where(u - i < self.prob[i], i, self.alias[i])
+    
+    def sample(self, size: int, rng=None) -> np.ndarray:
+        """size weighted draws as an array of values"""
+        if self._array is None:
+            self._array = np.array(self.values)
+        return self._array[self.indices(size, rng)]
+
+class TemplatePool:
+    """
+    Text drawn from format patterns with uniformly chosen slot values,
+    compiled once into an indexed pool.
+    
+    Each pattern only draws the slots it actually uses, so a pattern with
+    slots of sizes (a, b) has a*b distinct renderings, numbered in mixed
+    radix. All patterns' renderings are numbered consecutively, and a draw
+    is a pattern (weighted, uniform by default) plus a uniform number below
+    its rendering count, i.e. one code into the pool. Rendered codes are
+    cached, so repeated draws of the same text share one string object.
+    """
+    
+    __slots__ = ('patterns', 'slots', 'pattern_slots', 'sizes', 'offsets', 'capitalize',
+                 '_sampler', '_sizes', '_offsets', '_rendered')
+    
+    def __init__(self, patterns: Sequence[str], slots: dict, weights: Sequence[float] = None,
+                 capitalize: bool = False):
+        self.patterns = list(patterns)
+        self.slots = {name: list(values) for name, values in slots.items()}
+        self.capitalize = capitalize
+        # Slots used per pattern, in order of first use
+        self.pattern_slots = []
+        for pattern in self.patterns:
+            used = []
+            for _, name, _, _ in string.Formatter().parse(pattern):
+                if name is None or name in used:
+                    continue
+                if name not in self.slots:
+                    raise ValueError(f"pattern {pattern!r} uses unknown slot {name!r}")
+                used.append(name)
+            self.pattern_slots.append(tuple(used))
+        self.sizes = np.array(
+            [math.prod(len(self.slots[name]) for name in used) for used in self.pattern_slots], dtype=np.int64
+        )
+        self.offsets = np.concatenate(([0], np.cumsum(self.sizes)[:-1])).astype(np.int64)
+        self._sampler = AliasSampler(range(len(self.patterns)), [1] * len(self.patterns) if weights is None else weights)
+        self._sizes = self.sizes.tolist()
+        self._offsets = self.offsets.tolist()
+        self._rendered = {}
+    
+    def __len__(self) -> int:
+        """Number of codes (renderings counted once per pattern that yields them)"""
+        return int(self.sizes.sum())
+    
+    def render(self, code: int) -> str:
+        """Text of one code, cached and interned"""
+        text = self._rendered.get(code)
+        if text is None:
+            text = self._rendered[code] = sys.intern(self._format(code))
+        return text
+    
+    def _format(self, code: int) -> str:
+        p = int(np.searchsorted(self.offsets, code, side='right')) - 1
+        rest = code - self._offsets[p]
+        values = {}
+        for name in reversed(self.pattern_slots[p]):
+            rest, i = divmod(rest, len(self.slots[name]))
+            values[name] = self.slots[name][i]
+        text = self.patterns[p].format(**values)
+        return text.capitalize() if self.capitalize else text
+    
+    def code(self, rng=random) -> int:
+        """One draw as a pool code; two rng calls whatever the pattern"""
+        p = self._sampler.index(rng)
+        return self._offsets[p] + rng.randrange(self._sizes[p])
+    
+    def draw(self, rng=random) -> str:
+        return self.render(self.code(rng))
+    
+    def codes(self, size: int, rng=None) -> np.ndarray:
+        """size draws as an int64 code array (numpy's global RNG by default)"""
+        p = self._sampler.indices(size, rng)
+        return self.offsets[p] + ((rng or np.random).random(size) * self.sizes[p]).astype(np.int64)
+    
+    def sample(self, size: int, rng=None, intern: bool = True) -> np.ndarray:
+        """
+        size draws as an object array of strings. Each distinct code is
+        rendered once; with intern, through the pool's cache, so identical
+        text shares one object across calls as well as within this one.
+        """
+        unique, inverse = np.unique(self.codes(size, rng), return_inverse=True)
+        rendered = np.empty(len(unique), dtype=object)
+        render = self.render if intern else self._format
+        rendered[:] = [render(code) for code in unique.tolist()]
+        return rendered[inverse]
+
 def generate_uuid() -> str:
-    """Generate a UUID v4 string for IDs"""
-    return str(uuid.uuid4())
+    """
+    Generate a UUID v4 string for IDs.
+    Drawn from the `random` module rather than os.urandom so seeded runs are reproducible.
+    """
+    return str(uuid.UUID(int=random.getrandbits(128), version=4))
 
-def generate_gid_like_id() -> str:
+def generate_gid_like_id(rng=random) -> str:
     """Generate an ID similar to Asana's GID format (numeric string)"""
-    return str(random.randint(1000000000000000, 9999999999999999))
+    return str(rng.randint(1000000000000000, 9999999999999999))
+
+# Entity ID schemes (--id-scheme):
+#   uuid - 36-char v4 UUID text keys (default)
+#   int  - compact integers from one sequence shared by all tables; stored in
+#          INTEGER PRIMARY KEY columns, i.e. as SQLite rowid aliases
+#   gid  - Asana-style 16-digit numeric ids, stored as INTEGER: the int
+#          sequence mapped through gid_for_counter, so they never repeat
+ID_SCHEMES = ('uuid', 'int', 'gid')
+
+# gid = GID_MIN + (GID_MULTIPLIER * counter + GID_OFFSET) mod GID_SPAN. The
+# multiplier is coprime to GID_SPAN, which makes the mapping a bijection on
+# the 16-digit range: distinct counters give distinct, scattered gids. Its
+# inverse is GID_INVERSE, small enough that SQLite can undo the mapping in
+# 64-bit integers (see GID_COUNTER_SQL).
+GID_MIN = 10 ** 15
+GID_SPAN = 9 * 10 ** 15
+GID_INVERSE = 1009
+GID_MULTIPLIER = pow(GID_INVERSE, -1, GID_SPAN)
+GID_OFFSET = 2718281828459045
+GID_COUNTER_SQL = (
+    f"(({{column}} - {GID_MIN + GID_OFFSET}) % {GID_SPAN} + {GID_SPAN}) % {GID_SPAN} * {GID_INVERSE} % {GID_SPAN}"
+)
+
+def gid_for_counter(counter: int) -> int:
+    """The gid of one position in the int ID sequence"""
+    return GID_MIN + (GID_MULTIPLIER * counter + GID_OFFSET) % GID_SPAN
+
+def counter_for_gid(gid: int) -> int:
+    """Inverse of gid_for_counter (the position, modulo GID_SPAN)"""
+    return (gid - GID_MIN - GID_OFFSET) * GID_INVERSE % GID_SPAN
+
+# UUIDs are formatted this many at a time
+UUID_BLOCK_SIZE = 4096
+
+_HEX_DIGITS = np.frombuffer(b'0123456789abcdef', dtype=np.uint8)
+_UUID_HEX_POSITIONS = [i for i in range(36) if i not in (8, 13, 18, 23)]
+
+def format_uuid4_block(raw: bytes) -> List[str]:
+    """
+    Format each 16 bytes of random data as a v4 UUID string.
+    
+    Sets the version and variant bits and hex-encodes the whole block with
+    NumPy, instead of building a uuid.UUID and calling str() per ID.
+    """
+    octets = np.frombuffer(raw, dtype=np.uint8).reshape(-1, 16).copy()
+    octets[:, 6] = (octets[:, 6] & 0x0F) | 0x40  # version 4
+    octets[:, 8] = (octets[:, 8] & 0x3F) | 0x80  # RFC 4122 variant
+    digits = np.empty((len(octets), 32), dtype=np.uint8)
+    digits[:, 0::2] = _HEX_DIGITS[octets >> 4]
+    digits[:, 1::2] = _HEX_DIGITS[octets & 0x0F]
+    text = np.full((len(octets), 36), ord('-'), dtype=np.uint8)
+    text[:, _UUID_HEX_POSITIONS] = digits
+    return text.view('S36').ravel().astype('U36').tolist()
+
+class IdAllocator:
+    """
+    Hands out entity IDs under one scheme.
+    
+    UUIDs are drawn from the allocator's own random stream, seeded from the
+    global `random` state when the allocator is created, so seeded runs stay
+    reproducible and ID draws do not shift any attribute draws. int and gid
+    IDs both count along the (start, step) sequence; gids are its positions
+    mapped through gid_for_counter, so they are unique without tracking
+    which were issued. UUIDs are formatted a block at a time; take(n)
+    reserves n IDs in one call.
+    """
+    
+    def __init__(self, scheme: str = 'uuid', start: int = 1, step: int = 1,
+                 block_size: int = UUID_BLOCK_SIZE):
+        if scheme not in ID_SCHEMES:
+            raise ValueError(f"Unknown ID scheme {scheme!r} (expected one of {', '.join(ID_SCHEMES)})")
+        self.scheme = scheme
+        self.next_int = start
+        self.step = step
+        self.block_size = block_size
+        self._rng = random.Random(random.getrandbits(64))
+        self._buffer: List[str] = []
+        self._position = 0
+    
+    def _uuid_block(self, count: int) -> List[str]:
+        # getrandbits(128 * n) yields the same bytes as n getrandbits(128)
+        # calls, so the ID stream does not depend on how it is chunked
+        return format_uuid4_block(self._rng.getrandbits(128 * count).to_bytes(16 * count, 'little'))
+    
+    def next_id(self):
+        if self.scheme == 'uuid':
+            if self._position == len(self._buffer):
+                self._buffer = self._uuid_block(self.block_size)
+                self._position = 0
+            value = self._buffer[self._position]
+            self._position += 1
+            return value
+        value = self.next_int
+        self.next_int += self.step
+        return value if self.scheme == 'int' else gid_for_counter(value)
+    
+    def take(self, count: int) -> List:
+        """The next count IDs, as if next_id() had been called count times"""
+        if self.scheme == 'uuid':
+            ids = self._buffer[self._position:self._position + count]
+            self._position += len(ids)
+            if len(ids) < count:
+                ids += self._uuid_block(count - len(ids))
+            return ids
+        counters = range(self.next_int, self.next_int + count * self.step, self.step)
+        self.next_int += count * self.step
+        return list(counters) if self.scheme == 'int' else [gid_for_counter(c) for c in counters]
+    
+    def interleave(self, num_sequences: int) -> List[Tuple[int, int]]:
+        """
+        Split the remaining int sequence into num_sequences disjoint
+        (start, step) sequences, e.g. one per worker process. Together
+        they stay dense (and their gids distinct); this allocator must not
+        be used afterwards.
+        """
+        step = self.step * num_sequences
+        return [(self.next_int + i * self.step, step) for i in range(num_sequences)]
+
+_id_allocator = IdAllocator()
+
+def set_id_scheme(scheme: str, start: int = 1, step: int = 1) -> IdAllocator:
+    """
+    Start a fresh process-wide allocator for new_id()/new_ids(). Call it after
+    seeding `random` (and in every worker process, so forked workers do not
+    replay the parent's buffered IDs).
+    """
+    global _id_allocator
+    _id_allocator = IdAllocator(scheme, start, step)
+    return _id_allocator
+
+def id_allocator() -> IdAllocator:
+    return _id_allocator
+
+def use_id_allocator(allocator: IdAllocator) -> IdAllocator:
+    """Make allocator the process-wide one, e.g. one restored from a checkpoint"""
+    global _id_allocator
+    _id_allocator = allocator
+    return _id_allocator
+
+def new_id():
+    """Next entity ID under the active scheme (see set_id_scheme)"""
+    return _id_allocator.next_id()
+
+def new_ids(count: int) -> List:
+    """The next count entity IDs in one call"""
+    return _id_allocator.take(count)
 
 def generate_email(first_name: str, last_name: str, domain: str) -> str:
     """Generate realistic email from name and domain"""
@@ -29,6 +340,20 @@ def generate_random_datetime(start_date: datetime, end_date: datetime) -> dateti
     random_seconds = random.randint(0, int(time_delta.total_seconds()))
     return start_date + timedelta(seconds=random_seconds)
 
+# Due-date buckets: (cumulative probability, day offset range from creation or None).
+# Negative offsets are overdue tasks.
+DUE_DATE_BUCKETS = [
+    (0.10, None),        # 10% no due date
+    (0.15, (-90, -1)),   # 5% overdue
+    (0.40, (1, 7)),      # 25% within 1 week
+    (0.80, (1, 30)),     # 40% within 1 month
+    (1.00, (30, 90)),    # 20% 1-3 months out
+]
+DUE_DATE_BUCKET_SAMPLER = AliasSampler(
+    range(len(DUE_DATE_BUCKETS)),
+    np.diff([0.0] + [threshold for threshold, _ in DUE_DATE_BUCKETS])
+)
+
 def generate_weighted_due_date(created_at: datetime, today: date) -> Tuple[date, bool]:
     """
     Generate due dates with realistic distribution:
@@ -38,27 +363,40 @@ def generate_weighted_due_date(created_at: datetime, today: date) -> Tuple[date,
     10% no due date (returns None)
     5% overdue
     """
-    rand = random.random()
+    offsets = DUE_DATE_BUCKETS[DUE_DATE_BUCKET_SAMPLER.index()][1]
     created_date = created_at.date()
     
-    if rand < 0.10:  # 10% no due date
+    if offsets is None:
         return None, False
-    elif rand < 0.15:  # 5% overdue
-        days_overdue = random.randint(1, 90)
-        due_date = created_date - timedelta(days=days_overdue)
-        return due_date, True
-    elif rand < 0.40:  # 25% within 1 week
-        days_ahead = random.randint(1, 7)
-        due_date = created_date + timedelta(days=days_ahead)
-        return due_date, False
-    elif rand < 0.80:  # 40% within 1 month
-        days_ahead = random.randint(1, 30)
-        due_date = created_date + timedelta(days=days_ahead)
-        return due_date, False
-    else:  # 20% 1-3 months out
-        days_ahead = random.randint(30, 90)
-        due_date = created_date + timedelta(days=days_ahead)
-        return due_date, False
+    low, high = offsets
+    if high < 0:  # overdue
+        days_overdue = random.randint(-high, -low)
+        return created_date - timedelta(days=days_overdue), True
+    days_ahead = random.randint(low, high)
+    return created_date + timedelta(days=days_ahead), False
+
+def generate_weighted_due_dates(created_dates: np.ndarray) -> np.ndarray:
+    """
+    Vectorized generate_weighted_due_date + avoid_weekend.
+    created_dates is a datetime64[D] array; returns datetime64[D] with NaT for no due date.
+    """
+    n = len(created_dates)
+    bucket = DUE_DATE_BUCKET_SAMPLER.indices(n)
+    
+    offsets = np.zeros(n, dtype=np.int64)
+    for i, (_, bounds) in enumerate(DUE_DATE_BUCKETS):
+        if bounds is None:
+            continue
+        mask = bucket == i
+        low, high = bounds
+        offsets[mask] = np.random.randint(low, high + 1, size=int(mask.sum()))
+    
+    due = created_dates.astype('datetime64[D]') + offsets.astype('timedelta64[D]')
+    # Weekend avoidance: 1970-01-01 was a Thursday, so Monday == 0 below
+    weekday = (due.astype(np.int64) + 3) % 7
+    due = due + np.where(weekday == 5, 2, np.where(weekday == 6, 1, 0)).astype('timedelta64[D]')
+    due[bucket == 0] = np.datetime64('NaT')
+    return due
 
 def avoid_weekend(target_date: date, avoid_weekend: bool = True) -> date:
     """If avoid_weekend is True and target_date is weekend, move to Monday"""
@@ -91,6 +429,11 @@ def generate_creation_time(base_date: datetime) -> datetime:
     
     return base_date.replace(hour=hours, minute=minutes, second=seconds)
 
+# Cycle time in days: log-normal (median ~3 days), clipped to 1-14 days
+CYCLE_TIME_MEAN = 1.0
+CYCLE_TIME_SIGMA = 0.8
+CYCLE_TIME_BOUNDS = (1, 14)
+
 def generate_completion_time(created_at: datetime, completion_probability: float = 0.7) -> Tuple[datetime, bool]:
     """
     Generate completion timestamp with log-normal distribution.
@@ -101,15 +444,26 @@ def generate_completion_time(created_at: datetime, completion_probability: float
     
     # Log-normal distribution for cycle time (in days)
     # Median of 3 days, most tasks 1-14 days
-    shape = 0.8
-    scale = 1.0
-    cycle_days = np.random.lognormal(scale, shape)
-    cycle_days = min(cycle_days, 14)  # Cap at 14 days
-    cycle_days = max(cycle_days, 1)   # At least 1 day
+    cycle_days = np.random.lognormal(CYCLE_TIME_MEAN, CYCLE_TIME_SIGMA)
+    cycle_days = min(cycle_days, CYCLE_TIME_BOUNDS[1])  # Cap at 14 days
+    cycle_days = max(cycle_days, CYCLE_TIME_BOUNDS[0])  # At least 1 day
     
     completed_at = created_at + timedelta(days=cycle_days)
     return completed_at, True
 
+def generate_completion_times(created_at: np.ndarray, completion_probability: np.ndarray) -> np.ndarray:
+    """
+    Vectorized generate_completion_time.
+    created_at is datetime64[us]; returns datetime64[us] with NaT for open tasks.
+    """
+    n = len(created_at)
+    is_completed = np.random.random(n) <= completion_probability
+    cycle_days = np.clip(np.random.lognormal(CYCLE_TIME_MEAN, CYCLE_TIME_SIGMA, n), *CYCLE_TIME_BOUNDS)
+    cycle = np.round(cycle_days * 86400e6).astype(np.int64).astype('timedelta64[us]')
+    completed = created_at.astype('datetime64[us]') + cycle
+    completed[~is_completed] = np.datetime64('NaT')
+    return completed
+
 def is_realistic_date_range(created_at: datetime, completed_at: datetime) -> bool:
     """Validate that task was completed after creation"""
     return completed_at > created_at
@@ -145,7 +499,11 @@ def ensure_temporal_consistency(created_at: datetime, due_date: date, completed_
         return created_at <= completed_at
     return True
 
-def batch_insert_values(records: List, batch_size: int = 1000):
-    """Generator to batch records for efficient insertion"""
-    for i in range(0, len(records), batch_size):
-        yield records[i:i + batch_size]
+def batch_insert_values(records: Iterable, batch_size: int = 1000):
+    """Generator to batch records (any iterable) into lists for efficient insertion"""
+    iterator = iter(records)
+    while True:
+        batch = list(islice(iterator, batch_size))
+        if not batch:
+            return
+        yield batch